@@ -14,16 +14,38 @@ An extension program for MSDACSYS Participants
 ## • When converting to name case, ignore the non-alphabet capitalization such as double-quotes and make the 2nd character the capital instead.
 
 import re, sys
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from itertools import chain
+from string import ascii_letters
+from typing import FrozenSet, Iterable, Iterator, List, Optional, TextIO, Tuple
+
+_NAME_LETTERS = frozenset(ascii_letters)                                                                            ## Characters that qualifies a NAME
+_DELIM = ':'                                                                                                        ## Search delimiter
+_NEWLINE_RE = re.compile(r"\r\n|[\r\x0b\x0c\x1c\x1d\x1e\x85\u2028\u2029]")                                           ## Every other line boundary of str.splitlines
+_LINE_RE = re.compile(rf"^([^{_DELIM}\n]*){_DELIM}([^\n]*)(?:\n(?=([^\n]*)))?", re.M)                                ## ROLE, NAME and a peek at the next line of every delimited line
+
+
+@lru_cache(maxsize=2048)
+def _fmtStr(string:str, mode:int, excl:FrozenSet[str]) -> str:
+    """
+    Cached formatter behind `ParticipantParser.fmtStr` since roles and names repeat a lot.
+    The exclusions are part of the key so changing them needs no invalidation.
+    """
+    if mode and '@' in string: string = string.replace('@', '')                                                     ## NAME Formatting
+    return ' '.join([word if word in excl else word.capitalize() for word in string.split()])
+
 
 class ParticipantParser(object):
-    def __init__(self):
+    def __init__(self) -> None:
         self.NL = '\n'                                                                                              ## Newline
-        self.DELIM = ':'                                                                                            ## Search delimiter
+        self.DELIM = _DELIM                                                                                         ## Search delimiter
         self.FILE_READ = 'message.txt'                                                                              ## Message Source
-        self.FILTER_EXCLUSIONS = ['AY', 'to'], ['TBA']                                                              ## Exclusion for string formatting (Role, Name)
+        self.ROLE_EXCL = frozenset(('AY', 'to'))                                                                    ## Exclusion for ROLE string formatting
+        self.NAME_EXCL = frozenset(('TBA',))                                                                        ## Exclusion for NAME string formatting
 
 
-    def getMessage(self):
+    def getMessage(self) -> str:
         """
         Returns a string of participants from a message file
         """
@@ -31,56 +53,72 @@ class ParticipantParser(object):
             return f.read()
 
     
-    def fmtStr(self, string:str, mode):
+    def fmtStr(self, string:str, mode:int) -> str:
         """
         Formats ROLE and NAME to a presentable format
         """
-        out = []
-        for word in string.split():
-            if not mode:                                                                                            ## ROLE Formatting
-                if word not in self.FILTER_EXCLUSIONS[0]: out.append(f"{word[:1].upper()}{word[1:].lower()}")
-                else: out.append(word)
-
-            else:                                                                                                   ## NAME Formatting
-                word = word.replace('@', '')
-                if word not in self.FILTER_EXCLUSIONS[1]: out.append(f"{word[:1].upper()}{word[1:].lower()}")
-                else: out.append(word)
-
-        return ' '.join(out)
+        return _fmtStr(string, mode, self.NAME_EXCL if mode else self.ROLE_EXCL)
     
 
-    def parse(self, source=None):
+    def parse(self, source:Optional[str]=None) -> List[Tuple[str, str]]:
         """
-        Returns a tuple of participants with its ROLE and NAME
+        Returns a tuple of participants with its ROLE and NAME.
+        Streams the message file line by line when no source is given.
         """
-        RESULT = []
-        SOURCE = self.getMessage() if source is None else source
+        if source is None:
+            with open(self.FILE_READ, 'r', encoding='utf-8') as f:
+                return self.parseLines(part for line in f for part in line.splitlines())                            ## Same line boundaries as a string source
+        if self.DELIM != _DELIM: return self.parseLines(source.splitlines())                                       ## The compiled pattern only knows the default delimiter
+        SOURCE = _NEWLINE_RE.sub('\n', source)                                                                      ## Lines break wherever splitlines would break them
+        return [self.fmtEntry(*m.groups()) for m in _LINE_RE.finditer(SOURCE)]                                      ## One regex scan over the whole message
 
-        ## Strip lines
-        CLEAN = '\n'.join([line.strip() for line in SOURCE.splitlines()])                                           ## Strips the spaces for both ends of the string
+
+    def parseLines(self, lines:Iterable[str]) -> List[Tuple[str, str]]:
+        """
+        Returns a tuple of participants from any iterable of lines.
+        Only the current and the next line are held at a time.
+        """
+        RESULT: List[Tuple[str, str]] = []
+        LINES = (line.strip() for line in lines)                                                                    ## Strips the spaces for both ends of every line
+        CURRENT = next(LINES, None)
+        if CURRENT is None: return RESULT
 
         ## Distinguish roles and names
-        for i, line in enumerate(CLEAN.splitlines()):
-            if self.DELIM in line:
-                PART = line.split(self.DELIM)
-                ROLE, NAME = PART[0].strip(), PART[1].strip()
+        for NEXT in chain(LINES, (None,)):                                                                          ## One-line lookahead for a NAME below its ROLE
+            line, CURRENT = CURRENT, NEXT
+            ROLE, SEP, NAME = line.partition(self.DELIM)                                                            ## Stops at the first delimiter; the rest is kept as NAME
+            if SEP: RESULT.append(self.fmtEntry(ROLE, NAME, NEXT))
 
-                if len(re.sub(r"[^A-Za-z]+", '', NAME)):                                                            ## If there's a name in the line
-                    RESULT.append((self.fmtStr(ROLE, 0), self.fmtStr(NAME, 1)))
+        return RESULT
 
-                else:                                                                                               ## When there's no NAME next to the ROLE
-                    if i+1 == len(CLEAN.splitlines()): NLPT = ''
-                    else: NLPT = CLEAN.split(self.NL)[i+1].strip().replace('@', '')                                 ## Next Line Participant
 
-                    if self.DELIM in NLPT: NLPT = ''                                                                ## Ignore NAME when it's a ROLE
-                    RESULT.append((self.fmtStr(line.replace(self.DELIM, ''), 0), self.fmtStr(NLPT.strip(), 1)))
+    def parseMany(self, sources:Iterable[str], chunksize:int=64) -> Iterator[List[Tuple[str, str]]]:
+        """
+        Parses independent messages across worker processes.
+        Yields the result of every source in the same order.
+        """
+        with ProcessPoolExecutor() as ex:
+            yield from ex.map(self.parse, sources, chunksize=chunksize)
 
-        return RESULT
+
+    def fmtEntry(self, role:str, name:str, nextLine:Optional[str]) -> Tuple[str, str]:
+        """
+        Returns the formatted ROLE and NAME of a single delimited line.
+        Takes the NAME from the next line when there's none next to the ROLE.
+        """
+        if not _NAME_LETTERS.isdisjoint(name):                                                                      ## If there's a name in the line (stops at the first letter)
+            return self.fmtStr(role, 0), self.fmtStr(name, 1)
+
+        NLPT = nextLine or ''                                                                                       ## Next Line Participant ('@' is dropped by fmtStr)
+        if self.DELIM in NLPT: NLPT = ''                                                                            ## Ignore NAME when it's a ROLE
+        return self.fmtStr(role + name.replace(self.DELIM, ''), 0), self.fmtStr(NLPT, 1)
     
     
-    def showResult(self, source=None, out=sys.stdout):
-        for i in self.parse() if source is None else source:
-            print(f"{i[0]}: {i[1]}", file=out)
+    def showResult(self, source:Optional[Iterable[Tuple[str, str]]]=None, out:TextIO=sys.stdout) -> None:
+        """
+        Writes the parsed participants to `out` in a single write
+        """
+        out.write("".join([f"{i[0]}: {i[1]}\n" for i in (self.parse() if source is None else source)]))
 
 
 
@@ -36,24 +36,27 @@ Made with Qt, KV
 import sys
 
 try:
-    import os, psutil, winreg, time, datetime, json, shutil, gc, re, bz2, pyperclip
-    import Levenshtein as lev
+    import os, psutil, winreg, time, datetime, json, shutil, glob, gc, re, bz2, hashlib, ctypes, pyperclip
+    from ctypes import wintypes
+    from string import Template
+    try:
+        from rapidfuzz.distance.Indel import normalized_similarity as levRatio                      ## Same score as Levenshtein.ratio, faster backend
+        from rapidfuzz.process import extractOne, extract as extractAll
+    except ImportError:
+        from Levenshtein import ratio as levRatio
+        extractOne = extractAll = None
     from PyQt5 import QtCore, QtGui, QtWidgets
     from PyQt5.QtCore import Qt, QRegExp
     from PyQt5.QtGui import QFont, QPixmap, QImageReader, QIcon, QRegExpValidator
     from PyQt5.QtWidgets import (
-        QMessageBox, QComboBox, QSizePolicy, QLabel, QFontComboBox, QLineEdit,
+        QMessageBox, QComboBox, QSizePolicy, QLabel, QLineEdit,
         QSpacerItem, QPushButton, QFileDialog, QGridLayout, QVBoxLayout, QListWidget,
         QGroupBox, QCheckBox, QTabWidget, QFrame, QMainWindow, QWidget, QApplication,
         QPlainTextEdit, QHBoxLayout
         )
-    from functools import partial
+    from functools import partial, lru_cache
     from ext.parser import ParticipantParser
-    from pptx import Presentation
-    from pptx.util import Inches, Cm, Pt
-    from pptx.enum.text import PP_ALIGN
-    from pptx.dml.color import RGBColor
-    from kenverdadero.KCore import KPath, KString
+    from kenverdadero.KCore import KPath
     from kenverdadero.KLogging import KLog
     from kenverdadero.KSoftware import KSoftware
     from kenverdadero.KCore.KCore import modHex, p, showLatency
@@ -61,9 +64,48 @@ except ImportError as e:
     print(f'Module not found: {e}')
     sys.exit()
 
+## Optional Modules
+try:
+    import orjson                                                                                   ## Faster parsing and serializing of data.json
+except ImportError:
+    orjson = None
+
+modHex = lru_cache(maxsize=64)(modHex)                                                              ## Pure function of (color, amount), so derived theme colors are computed once
+
 
         
 
+class PROCESSENTRY32W(ctypes.Structure):
+    """
+    Process entry of a Win32 Toolhelp snapshot
+    """
+    _fields_ = [
+        ('dwSize', wintypes.DWORD),
+        ('cntUsage', wintypes.DWORD),
+        ('th32ProcessID', wintypes.DWORD),
+        ('th32DefaultHeapID', ctypes.c_size_t),
+        ('th32ModuleID', wintypes.DWORD),
+        ('cntThreads', wintypes.DWORD),
+        ('th32ParentProcessID', wintypes.DWORD),
+        ('pcPriClassBase', wintypes.LONG),
+        ('dwFlags', wintypes.DWORD),
+        ('szExeFile', wintypes.WCHAR * 260),
+        ]
+
+
+_KERNEL32 = ctypes.WinDLL('kernel32', use_last_error=True)                                          ## Private instance, so these prototypes don't touch ctypes.windll
+_KERNEL32.CreateToolhelp32Snapshot.argtypes = (wintypes.DWORD, wintypes.DWORD)
+_KERNEL32.CreateToolhelp32Snapshot.restype = wintypes.HANDLE
+_KERNEL32.Process32FirstW.argtypes = (wintypes.HANDLE, ctypes.POINTER(PROCESSENTRY32W))
+_KERNEL32.Process32FirstW.restype = wintypes.BOOL
+_KERNEL32.Process32NextW.argtypes = (wintypes.HANDLE, ctypes.POINTER(PROCESSENTRY32W))
+_KERNEL32.Process32NextW.restype = wintypes.BOOL
+_KERNEL32.CloseHandle.argtypes = (wintypes.HANDLE,)
+_KERNEL32.CloseHandle.restype = wintypes.BOOL
+
+
+
+
 class System(object):
     """
     System Class Handler
@@ -87,6 +129,7 @@ class System(object):
         self.DIR_PROGRAM =          self.DIR_PARENT + r'\Participants'                                                      ## Program Directory
         self.DIR_LOG =              self.DIR_PROGRAM + r'\Logs'                                                             ## Log Directory
         self.FILE_DATA =            self.DIR_PROGRAM + r'\data.json'                                                        ## Both data and configuration are stored here
+        self.FILE_DATA_BZ2 =        self.FILE_DATA + '.bz2'                                                                 ## Compressed data file for large pools
         self.FILE_PPT_EXPORTED =    self.DIR_PROGRAM + r'\exported.pptx'                                                    ## Path of the exported file
 
         ## Resources
@@ -98,8 +141,8 @@ class System(object):
         
         ## Properties
         self.PROCESS_NAME =         "participants.exe"                                                                      ## Program filename
-        self.PROCESS =              psutil.Process(os.getpid())                                                             ## Get PID to detect multiple instances
         self.LOG_FILE_LIMIT =       10                                                                                      ## Maximum threshold for maintaining log files
+        self.DATA_COMPRESS_SIZE =   64 * 1024                                                                               ## Data above this size (in bytes) is saved compact and compressed
         self.STARTUP_TIME =         0                                                                                       ## Set initial time for launching the program
         self.GLOBAL_STATE =         0                                                                                       ## 0 - Starting (unused), 1 - Ready, 2 - Reserved, 3 - Shutting Down
         self.EXT_MEMLIST =          "prt"                                                                                   ## Application Extension for Memberlist
@@ -108,7 +151,7 @@ class System(object):
     def verifyDirectories(self):
         """
         This method checks for directories and also generate new if the folders does not exist/
-        This verifies from parent directory down to subfolders via loop using a dict of directories.
+        Creating the deepest folder (Logs) also creates the parent and program folders.
 
         ..  - Root
         ... - Etc
@@ -125,17 +168,9 @@ class System(object):
 
             -> POWERPNT.exe (MS Office)
         """
-        DIRECTORIES = {
-            self.DIR_PARENT: "Parent",
-            self.DIR_PROGRAM: "Program",
-            self.DIR_LOG: "Logs"
-            }
-        MISSING = 0
-
-        for DIR, NAME in DIRECTORIES.items():
-            if not KPath.exists(DIR, True):
-                LOG.warn(f"{NAME} Directory \"{DIR}\" does not exist. Creating a new folder.")
-                MISSING += 1
+        if not os.path.isdir(self.DIR_LOG):
+            LOG.warn(f"Logs Directory \"{self.DIR_LOG}\" does not exist. Creating missing folders.")
+            os.makedirs(self.DIR_LOG, exist_ok=True)                                                                        ## Also creates the Parent and Program directories
         
 
     def verifyRequisites(self):
@@ -161,28 +196,48 @@ class System(object):
             MSG_BOX.setWindowTitle(f"{SW.NAME} - Error")
             MSG_BOX.setWindowFlags(Qt.Drawer | Qt.WindowStaysOnTopHint)
             
-            MSG_BOX.setStyleSheet(QSS.getStylesheet())
             MSG_BOX.exec_()
             LOG.sys("Program terminated due to an error: Cannot find PowerPoint directory.")
             sys.exit()
         return
 
 
+    def countProcesses(self, name):
+        """
+        Returns the number of running processes with the given executable name.
+        Reads all names from a single Toolhelp snapshot, psutil is used as fallback.
+        """
+        SNAPSHOT = _KERNEL32.CreateToolhelp32Snapshot(0x2, 0)                                        ## 0x2 - TH32CS_SNAPPROCESS
+        if SNAPSHOT in (None, ctypes.c_void_p(-1).value):                                           ## INVALID_HANDLE_VALUE
+            return sum(1 for PROC in psutil.process_iter(attrs=['name']) if PROC.info['name'] == name)
+
+        ENTRY = PROCESSENTRY32W()
+        ENTRY.dwSize = ctypes.sizeof(PROCESSENTRY32W)
+        COUNT = 0
+        try:
+            MORE = _KERNEL32.Process32FirstW(SNAPSHOT, ctypes.byref(ENTRY))
+            while MORE:
+                if ENTRY.szExeFile == name: COUNT += 1
+                MORE = _KERNEL32.Process32NextW(SNAPSHOT, ctypes.byref(ENTRY))
+        finally:
+            _KERNEL32.CloseHandle(SNAPSHOT)
+        return COUNT
+
+
     def checkInstances(self):
         """
         Asks the user if they want to run another instance
         """
         self.DUPLICATED = False
-        DUPLICATES = list(filter(lambda x: x == SYS.PROCESS_NAME, [i.name() for i in psutil.process_iter()]))
+        self.INSTANCES = self.countProcesses(SYS.PROCESS_NAME)
         
-        if len(DUPLICATES) > 2:
+        if self.INSTANCES > 2:
             MSG_BOX = QMessageBox()
             MSG_BOX.setStandardButtons(QMessageBox.Yes | QMessageBox.No)
             MSG_BOX.setIcon(QMessageBox.Question)
             MSG_BOX.setText("The program is already running.\nDo you want to open another instance?")
             MSG_BOX.setWindowTitle("Duplicate Instance Detected")
             MSG_BOX.setWindowFlags(Qt.Drawer | Qt.WindowStaysOnTopHint)
-            MSG_BOX.setStyleSheet(QSS.getStylesheet())
             MSG_BOX.setStyleSheet('min-width: 280px; min-height: 35px;')
             
             LOG.info("Duplicate Instance Detected")
@@ -223,6 +278,8 @@ class Data(object):
     along with the configuration settings for users.
     """
     def __init__(self):
+        self.CACHED_KEY = None                                                                      ## (path, mtime, size) of the last loaded or dumped file
+        self.CACHED_BUFFER = None                                                                   ## Its JSON bytes, parsed again on every load since the result is edited in place
         self.check()
 
 
@@ -230,7 +287,7 @@ class Data(object):
         """
         Checks if the file is existent in directory
         """
-        if not os.path.exists(SYS.FILE_DATA):
+        if not os.path.exists(SYS.FILE_DATA) and not os.path.exists(SYS.FILE_DATA_BZ2):
             LOG.warn("Data is missing. Generating new...")
             self.generateDefault()
 
@@ -240,27 +297,91 @@ class Data(object):
     def load(self):
         """
         Retrieves the data from system's data file.
+        Unchanged files are not read or decompressed again.
         """
-        while True:
-            with open(SYS.FILE_DATA, "r") as read:
-                try: 
-                    DATA = json.load(read)
-                except json.decoder.JSONDecodeError:
-                    LOG.crit('Failed to load statistic data. Regenerating default...')
-                    self.generateDefault()
-                else:
-                    return DATA
+        for _ in range(2):                                                                          ## Second pass reads the regenerated default
+            PATH = self.getDataPath()
+            COMPRESSED = PATH == SYS.FILE_DATA_BZ2
+            KEY = self.fingerprint(PATH)
+            if KEY == self.CACHED_KEY: BUFFER = self.CACHED_BUFFER
+            else:
+                with (bz2.open if COMPRESSED else open)(PATH, "rb") as read:
+                    try: BUFFER = read.read()
+                    except (OSError, EOFError): BUFFER = b''                                            ## Broken bz2 stream, treated as corrupted data
+            try: 
+                DATA = orjson.loads(BUFFER) if orjson else json.loads(BUFFER)
+                self.CACHED_KEY, self.CACHED_BUFFER = KEY, BUFFER
+                return DATA
+            except ValueError:                                                                      ## Both JSONDecodeError types are subclasses of ValueError
+                LOG.crit('Failed to load statistic data. Regenerating default...')
+                self.generateDefault()                                                              ## Done after the file is closed so the old file can be replaced
+        LOG.sys("Program terminated due to an error: Cannot load the data file.")
+        sys.exit()
+
+
+    def getDataPath(self):
+        """
+        Returns the data file to load. When both the plain and the
+        compressed file exist, the more recently modified one is used
+        """
+        if not os.path.exists(SYS.FILE_DATA_BZ2): return SYS.FILE_DATA
+        if not os.path.exists(SYS.FILE_DATA): return SYS.FILE_DATA_BZ2
+        NEWER, OLDER = sorted((SYS.FILE_DATA_BZ2, SYS.FILE_DATA), key=os.path.getmtime, reverse=True)
+        LOG.warn(f"Both data files exist. Loading the newer {NEWER} and ignoring {OLDER}")
+        return NEWER
         
 
     def dump(self, data=None, indent=4, sort_keys=True):
         """
-        Saves the passed data to system's data file.
-        Uses indention of 4 and sorted keys by default.
+        Saves the passed data to system's data file with sorted keys by default.
+        Indented with 2 spaces when orjson is installed, `indent` spaces (4 by default) otherwise.
         Can be processed with other data if 2nd argument is specified.
+        Large data is saved compact to a bz2 file instead.
         """
         if data is None: data = DCFG
-        with open(SYS.FILE_DATA, "w") as write:
-            json.dump(data, write, indent=indent, sort_keys=sort_keys)
+        COMPACT = self.serialize(data, 0, sort_keys)
+        if len(COMPACT) > SYS.DATA_COMPRESS_SIZE:                                                   ## Large pools skip the indention and are compressed
+            PATH, STALE = SYS.FILE_DATA_BZ2, SYS.FILE_DATA
+            with bz2.open(PATH, "wb", compresslevel=3) as write:
+                write.write(COMPACT)
+        else:
+            PATH, STALE = SYS.FILE_DATA, SYS.FILE_DATA_BZ2
+            with open(PATH, "wb") as write:
+                write.write(self.serialize(data, indent, sort_keys) if indent else COMPACT)
+        try: os.remove(STALE)                                                                       ## Only one of the data files should exist
+        except FileNotFoundError: pass
+        self.CACHED_KEY, self.CACHED_BUFFER = self.fingerprint(PATH), COMPACT                       ## Bytes, so later edits to the data can't leak into the cache
+
+
+    def findBestName(self, query:str, cutoff=0.0):
+        """
+        Returns (name, score) of the pool name most similar to the query
+        or None if no name reaches the cutoff. Case is ignored.
+        """
+        NAMES = self.DATA['POOL']['NAMES']                                                          ## Read live since the pool is updated in place
+        if extractOne:                                                                              ## Scores all candidates in one native call
+            MATCH = extractOne(query, NAMES, scorer=levRatio, processor=str.lower, score_cutoff=cutoff)
+            return MATCH[:2] if MATCH else None
+        QUERY = query.lower()
+        BEST = max(((n, levRatio(QUERY, n.lower())) for n in NAMES), key=lambda m: m[1], default=None)
+        return BEST if BEST and BEST[1] >= cutoff else None
+
+
+    def fingerprint(self, path):
+        """
+        Returns a key that changes whenever the file is modified
+        """
+        STAT = os.stat(path)
+        return (path, STAT.st_mtime_ns, STAT.st_size)
+
+
+    def serialize(self, data, indent, sort_keys):
+        """
+        Returns the data as JSON encoded bytes
+        """
+        if orjson:                                                                                  ## orjson only supports an indention of 2
+            return orjson.dumps(data, option=(orjson.OPT_INDENT_2 if indent else 0) | (orjson.OPT_SORT_KEYS if sort_keys else 0))
+        return json.dumps(data, indent=indent or None, sort_keys=sort_keys).encode('utf-8')
 
     
     def generateDefault(self):
@@ -278,7 +399,8 @@ class Data(object):
             }
         }
         self.dump(DATA)
-        LOG.info(f"Default data was generated successfully. | Hash: {KString.toHashMD5(DATA)}")
+        HASH = hashlib.blake2b(self.serialize(DATA, 0, True), digest_size=8).hexdigest()           ## Short fingerprint for the log only
+        LOG.info(f"Default data was generated successfully. | Hash: {HASH}")
 
 
 
@@ -315,28 +437,458 @@ class FileManager(object):
 
     def getLogFiles(self):
         """
-        Returns list of log file paths
+        Returns list of (path, access time) of log files
         """
-        return [f'{SYS.DIR_LOG}\\{i}' for i in os.listdir(SYS.DIR_LOG) if i.endswith('.log')]
+        with os.scandir(SYS.DIR_LOG) as ENTRIES:                                                                ## Stat info comes with the directory listing on Windows
+            return [(e.path, e.stat().st_atime) for e in ENTRIES if e.name.endswith('.log')]
 
 
     def deleteOldest(self, fileList, threshold, deleteAll):
         """
         Delete older files when the folder items reached the maximum recent files allowed.
         """
-        while len(fileList()) > (threshold if not deleteAll else 0):                                            ## Process code until the detected files are below threshold or when the switch is set to "Delete All" (0)
-            try: os.remove(min(fileList(), key=os.path.getatime))                                               ## Eliminates the oldest accessed file
-            except PermissionError as e: LOG.warn(e)                                                            ## Issue: There is no solution for this one yet. Administrator permissions could be used in future development
+        FILES = sorted(fileList(), key=lambda f: f[1])                                                          ## Scanned once, oldest accessed first
+        EXCESS = len(FILES) - (threshold if not deleteAll else 0)                                               ## Files above threshold or all when the switch is set to "Delete All" (0)
+        for PATH, _ in FILES[:max(EXCESS, 0)]:
+            try: os.remove(PATH)                                                                                ## Eliminates the oldest accessed file
+            except PermissionError as e: LOG.warn(e); break                                                     ## Issue: There is no solution for this one yet. Administrator permissions could be used in future development
             except FileNotFoundError as e: pass                                                                 ## Ignore when file is not there anymore
 
 
 
 
+_HEX_CACHE = {}                                                                                  ## Hex string -> QColor, shared by all palettes
+
+## Theme colors per mode: 0 - Light, 1 - Dark
+_THEMES = {
+    0: {
+        'PRIMARY': '#004B74',
+        'SECONDARY': '#008A9A',
+        'TERTIARY': '#F7EBC5',
+        'GOLD': '#FFA92D',
+        'WARN': '#D25900',
+        'ERROR': '#9E1919',
+        'BORDER': '#C0C0C0',
+        'BORDER_HIGHLIGHT': '#C0C0C0',
+        'BTN_DISABLED': '#B6B6B6',
+        'TXT_INV': '#FFFFFF',
+        'TXT_DISABLED': '#999999',
+        'TXT_STATUSBAR': '#707070',
+        'STATUSBAR': '#CFCFCF',
+        'SCROLLBAR': '#A0A0A0',
+        'CARD': '#EEEEEE',
+        'CARDHOVER': '#EEEEEE',
+        'CTX_MENU': '#FFFFFF',
+        },
+    1: {
+        'PRIMARY': '#008A9A',                                                                       ## #008A9A Original
+        'SECONDARY': '#004B74',
+        'TERTIARY': '#F7EBC5',
+        'GOLD': '#FFA92D',
+        'WARN': '#D25900',
+        'ERROR': '#9E1919',
+        'BORDER': '#303030',
+        'BORDER_HIGHLIGHT': '#505050',
+        'BTN_DISABLED': '#212121',
+        'TXT_INV': '#181818',
+        'TXT_DISABLED': '#434343',
+        'TXT_STATUSBAR': '#434343',
+        'STATUSBAR': '#2A2A2A',
+        'SCROLLBAR': '#3B3B3B',
+        'CARD': '#2A2A2A',
+        'CARDHOVER': '#323232',
+        'CTX_MENU': '#1D1D1D',
+        },
+    }
+
+## Application palette per mode: (role or (group, role), color)
+_PALETTE_COLORS = {
+    0: (
+        (QtGui.QPalette.Window, '#FFFFFF'),
+        (QtGui.QPalette.WindowText, '#202020'),
+        (QtGui.QPalette.Base, '#DFDFDF'),
+        (QtGui.QPalette.AlternateBase, '#2D2D2D'),
+        (QtGui.QPalette.ToolTipBase, '#252525'),
+        (QtGui.QPalette.ToolTipText, '#C5C5C5'),
+        (QtGui.QPalette.PlaceholderText, '#999999'),
+        (QtGui.QPalette.HighlightedText, '#EEEEEE'),
+        (QtGui.QPalette.Highlight, _THEMES[0]['PRIMARY']),
+        (QtGui.QPalette.Light, '#D7D7D7'),
+        (QtGui.QPalette.Text, '#202020'),
+        ((QtGui.QPalette.Disabled, QtGui.QPalette.Text), '#434343'),                                ## <- Unused
+        (QtGui.QPalette.Midlight, '#888888'),
+        (QtGui.QPalette.Mid, '#D2D2D2'),
+        (QtGui.QPalette.Dark, '#555555'),
+        (QtGui.QPalette.Button, '#CCCCCC'),
+        ((QtGui.QPalette.Disabled, QtGui.QPalette.Button), '#252525'),                              ## <- Unused
+        (QtGui.QPalette.ButtonText, '#202020'),
+        (QtGui.QPalette.BrightText, '#FFFFFF'),
+        (QtGui.QPalette.Link, '#202020'),
+        (QtGui.QPalette.LinkVisited, '#151515'),
+        ),
+    1: (
+        (QtGui.QPalette.Window, '#202020'),
+        (QtGui.QPalette.WindowText, '#D5D5D5'),
+        (QtGui.QPalette.Base, '#191919'),
+        (QtGui.QPalette.AlternateBase, '#2D2D2D'),
+        (QtGui.QPalette.ToolTipBase, '#252525'),
+        (QtGui.QPalette.ToolTipText, '#C5C5C5'),
+        (QtGui.QPalette.PlaceholderText, '#999999'),
+        (QtGui.QPalette.HighlightedText, '#191919'),
+        (QtGui.QPalette.Highlight, _THEMES[1]['PRIMARY']),
+        (QtGui.QPalette.Light, '#898989'),
+        (QtGui.QPalette.Text, '#EFEFEF'),
+        ((QtGui.QPalette.Disabled, QtGui.QPalette.Text), '#939393'),                                ## <- Unused
+        (QtGui.QPalette.Midlight, '#888888'),
+        (QtGui.QPalette.Mid, '#424242'),
+        (QtGui.QPalette.Dark, '#555555'),
+        (QtGui.QPalette.Button, '#353535'),
+        ((QtGui.QPalette.Disabled, QtGui.QPalette.Button), '#252525'),                              ## <- Unused
+        (QtGui.QPalette.ButtonText, '#EFEFEF'),
+        (QtGui.QPalette.BrightText, '#FFFFFF'),
+        (QtGui.QPalette.Link, '#D0D0D0'),
+        (QtGui.QPalette.LinkVisited, '#CECECE'),
+        ),
+    }
+
+## Icon-only buttons: (object names, icon, hover icon, disabled icon, highlighted on hover)
+_ICON_BUTTONS = (
+    (('BTN_POWERPOINT',), 'ppt', 'ppt_hover', 'ppt_disabled', True),
+    (('BTN_PLAINTEXT',), 'plaintext', 'plaintext_hover', 'plaintext_disabled', True),
+    (('BTN_PARSELIST',), 'parse', 'parse_hover', 'parse_disabled', False),
+    (('BTN_COPY_ROLE', 'BTN_COPY_NAME'), 'copy', 'copy_hover', 'copy_disabled', False),
+    (('BTN_ATVS',), None, 'radio_translucent_hover', 'radio_disabled', False),
+    (('BTN_ATVS_SELECTED',), 'radio_selected', 'radio_selected_hover', 'select_radio_disabled', False),
+    (('BTN_MEM_EDIT',), 'edit', 'edit_hover', 'edit_disabled', False),
+    (('BTN_INSS', 'BTN_MEM_ADD'), 'add', 'add_hover', 'add_disabled', False),
+    (('BTN_REMS', 'BTN_BG_DISCARD', 'BTN_MEM_REMOVE', 'BTN_GEN_REMOVE'), 'xmark', 'xmark_hover', 'xmark_disabled', False),
+    (('BTN_MEM_IMPORT', 'BTN_GEN_IMPORT'), 'import', 'import_hover', 'import_disabled', False),
+    (('BTN_MEM_EXPORT', 'BTN_GEN_EXPORT'), 'export', 'export_hover', 'export_disabled', False),
+    (('BTN_FAC_COLORPICKER',), 'fill', 'fill_hover', 'fill_disabled', False),
+    (('BTN_REMS_LOCKED',), 'locked', 'unlock', 'locked_disabled', False),
+    (('BTN_SAVELIST', 'BTN_MEM_SAVE'), 'save', 'save_hover', 'save_disabled', False),
+    (('BTN_SETTINGS', 'BTN_GEN_MODIFY'), 'settings', 'settings_hover', None, False),
+    (('BTN_BG_BROWSE',), 'folder', 'folder_hover', 'folder_disabled', False),
+    )
+
+## Application stylesheet, filled once per theme by Stylesheet.buildStylesheet
+_STYLESHEET_TEMPLATE = Template("""
+    QWidget#WIN_PARTICIPANTS {
+        image: url('./res/images/bg.png');
+        image-position: bottom;
+    }
+
+
+
+    /* Buttons */ 
+    QPushButton {
+        background-color: palette(button);
+        padding: $PADDING;
+        border-radius: $RADIUS;
+        border: 1px solid $BTN_BORDER
+    }
+    QPushButton::pressed {
+        background-color: palette(button);
+    }
+    QPushButton::disabled {
+        color: $TXT_DISABLED;
+        background-color: $BTN_DISABLED;
+    }
+    QPushButton::hover {
+        background-color: palette(light);
+    }
+    /*
+    QPushButton::focus {
+        border: 1px solid $BORDER;
+    }
+    */
+
+
+
+    /* Group Boxes */
+    QGroupBox {
+        border-radius: $RADIUS;
+        background-color: $CARD;
+        margin-top: 1.5em;
+        padding: 5px;
+        font-weight: bold;
+        font-size: 10pt;
+    }
+    QGroupBox::hover {
+        background-color: $CARDHOVER;
+    }
+    QGroupBox::title {
+        color: palette(text);
+        subcontrol-origin: margin;
+        left: 0px;
+        padding: 3px 5px 3px 5px;
+        border-radius: $RADIUS;
+    }
+    QGroupBox::title::hover {
+        border: 1px solid $PRIMARY;
+    }
+
+
+
+    /* Icon Buttons */
+$ICON_BUTTONS
+
+
+    /* Dialog Boxes */
+    QMessageBox {
+        background-color: palette(window);
+    }
+
+
+
+    /* Tooltip */
+    QToolTip {
+        color: palette(text);
+        background-color: palette(base);
+        border: none;
+    }
+
+
+
+    /* Status Bar */
+    QStatusBar#STATUSBAR {
+        color: $TXT_STATUSBAR;
+        background-color: $STATUSBAR;
+    }
+
+
+
+    /* Search Bars */
+    QLineEdit, QComboBox{
+        color: palette(text);
+        selection-color: $TXT_INV;
+        background-color: $CARD;
+        border: 1px solid $BORDER;
+        border-radius: $RADIUS;
+        padding: $PADDING;
+    }
+    QLineEdit::focus#LNE_SEARCH {
+        background-color: #AF$BORDER_RGB;
+    }
+    QLineEdit::hover#LNE_SEARCH {
+        border: 1px solid $BORDER_HIGHLIGHT;
+    }
+
+
+
+    /* Combo Boxes */
+    QComboBox {
+        background-color: transparent;
+        border: 1px solid $BORDER;
+    }
+    QComboBox::hover {
+        background-color: transparent;
+        border: 1px solid $SECONDARY;
+    }
+
+    QComboBox#CBX_RLS {
+        margin-bottom: 1px;
+    }
+    QComboBox#CBX_NMS {
+        margin-bottom: 1px;
+    }
+
+
+
+    /* Sliders */
+    QSlider::handle {
+        background-color: $PRIMARY;
+    }
+    QSlider::handle::pressed {
+        background-color: $SECONDARY;
+    }
+
+
+
+    /* ScrollBars */
+    QScrollBar:vertical {
+        background-color: palette(base);
+        width: 16px;
+        margin: 0px;
+        border-radius: $RADIUS_SML;
+    }
+    QScrollBar:horizontal {
+        background-color: palette(base);
+        height: 15px;
+        margin: 0px;
+        border-radius: $RADIUS_SML;
+    }
+    QScrollBar::handle:vertical {
+        background-color: $SCROLLBAR; min-height: 20px; margin: 3px; border-radius: $RADIUS_SML; border: none;
+    }
+    QScrollBar::handle:horizontal {
+        background-color: $SCROLLBAR; min-width: 20px; margin: 3px; border-radius: $RADIUS_SML; border: none;
+    }
+    QScrollBar::handle::hover {
+        background-color: $SCROLLBAR_HOVER; min-width: 20px; margin: 3px; border-radius: $RADIUS_SML; border: none;
+    }
+    QScrollBar::handle::pressed {
+        background-color: $PRIMARY; min-width: 20px; margin: 3px; border-radius: $RADIUS_SML; border: none;
+    }
+
+    QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical {
+        border: none; background: none; height: 0px;
+    }
+    QScrollBar::add-line:horizontal, QScrollBar::sub-line:horizontal {
+        border: none; background: none; width: 0px;
+    }
+    QScrollBar::up-arrow:vertical, QScrollBar::down-arrow:vertical, QScrollBar::add-page:vertical, QScrollBar::sub-page:vertical {
+        border: none; background: none; color: none;
+    }
+    QScrollBar::left-arrow:horizontal, QScrollBar::right-arrow:horizontal, QScrollBar::add-page:horizontal, QScrollBar::sub-page:horizontal {
+        border: none; background: none; color: none;
+    }
+
+
+
+    /* Settings Panel (List) */
+    QAbstractItemView {
+        color: palette(text);
+        outline: none;
+        background-color: palette(base);
+        border: none;
+        border-radius: $RADIUS;
+        selection-color: $TXT_INV;
+        selection-background-color: $SECONDARY;
+        padding: 3px;
+        min-height: 15px;
+    }
+    QAbstractItemView::item {
+        padding: 5px 2px 5px 4px;
+        margin: 2px 0px 2px 0px;
+        border-radius: $RADIUS;
+    }
+    QAbstractItemView::item::selected {
+        background-color: $PRIMARY;
+    }
+    QAbstractItemView::item::hover {
+        color: palette(text);
+        background-color: $CARD;
+    }
+    QAbstractItemView::item::selected::hover {
+        color: $TXT_INV;
+        background-color: qlineargradient(x1: 0, y1: 0, x2: 1, y2: 1,stop: 0 $PRIMARY_GRADIENT, stop: 1 $PRIMARY);
+    }
+
+    /* Log Panel */
+    QPlainTextEdit {
+        color: palette(text);
+        background-color: palette(base);
+        border: 1px solid $BORDER;
+        border-radius: $RADIUS;
+    }
+
+
+
+    /* Checkboxes (Toggle Switches) */
+    QCheckBox {
+        outline: none;
+    }
+    QCheckBox::indicator {
+        width: 23px;
+        height: 23px;
+    }
+    QCheckBox::indicator::unchecked {
+        image: url(./res/icons/off.png);
+    }
+    QCheckBox::indicator::unchecked::hover {
+        image: url(./res/icons/off_hover.png);
+    }
+    QCheckBox::indicator::checked {
+        image: url(./res/icons/on.png);
+    }
+    QCheckBox::indicator::checked::hover {
+        image: url(./res/icons/on_hover.png);
+    }
+    QCheckBox::indicator::disabled {
+        image: url(./res/icons/toggle_disabled.png);
+    }
+
+
+
+    /* Spin
+
+    /* Spin Box */
+    QSpinBox {
+        border: 1px solid $BORDER;
+        border-radius: $RADIUS;
+    }
+
+
+    /* Add Queue Button */
+    QPushButton#BTN_ADDQUEUE {
+        background-color: transparent;
+        min-width: 17px;
+        width: 20px;
+        height: 20px;
+        image: url('./res/icons/add_.png');
+    }
+    QPushButton::hover#BTN_ADDQUEUE {
+        image: url('./res/icons/add_hover_.png');
+    }
+
+
+    /* Queue Button */
+    QPushButton#BTN_QUEUES {
+        background-color: transparent;
+        min-width: 17px;
+        width: 20px;
+        height: 20px;
+        image: url('./res/icons/queue_.png');
+    }
+    QPushButton::hover#BTN_QUEUES {
+        image: url('./res/icons/queue_hover_.png');
+    }
+
+
+
+    /* Special */
+
+    QLabel#PIX_HEADER {
+        color: $PRIMARY;
+    }
+    QLabel::disabled, QLabel#LBL_BROWSERB {
+        color: $TXT_DISABLED;
+    }
+
+    QPushButton::enabled#BTN_LAUNCH, QPushButton::enabled#BTN_OK {
+        color: $TXT_INV;
+        background-color: $PRIMARY;
+    }
+    QPushButton#BTN_LAUNCH, QPushButton#BTN_OK  {
+        min-width: 100px;
+    }
+    QPushButton::hover#BTN_LAUNCH, QPushButton::hover#BTN_OK {
+        color: $TXT_INV;
+        background-color: qlineargradient(x1: 0, y1: 0, x2: 1, y2: 1,stop: 0 $PRIMARY_GRADIENT, stop: 1 $PRIMARY);
+    }
+
+    QPushButton::hover#BTN_RESET {
+        color: palette(highlighted-text);
+        background-color: $ERROR;
+    }
+    QLabel#LBL_RL, QLabel#LBL_NM {
+        color: #005278;
+        padding: 3px;
+        border-radius: $RADIUS;
+    }
+""")
+
+
+
+
 class Stylesheet(object):
     """
     Handles all interface appearance for this program
     """
     def __init__(self):
+        self.CACHED_HEX = {}                                                                    ## Palette color hex values per (mode, color)
+        self.buildPalettes()                                                                    ## Palettes are static so they are only built once
         self.toggleMode()                                                                       ## Sets global palette for the application
         self.initStylesheet()                                                                   ## Sets the appearance of the UI's elements
     
@@ -368,120 +920,102 @@ class Stylesheet(object):
             pass
 
 
+    def repolish(self, widget):
+        """
+        Re-applies the application stylesheet to a widget after its
+        object name or properties changed without parsing the stylesheet again
+        """
+        STYLE = widget.style()
+        STYLE.unpolish(widget)
+        STYLE.polish(widget)
+        widget.update()
+
+
     def QCl(self, c):
         """
         Returns QColor version of a hex value
         """
-        if '#' in c: c = c[1:]
-        return QtGui.QColor(int(c[0:2],16),int(c[2:4],16),int(c[4:6],16))
+        QCOLOR = _HEX_CACHE.get(c)
+        if QCOLOR is None:
+            RGB = bytes.fromhex(c[-6:])                                                         ## Parses all three channels in one call
+            QCOLOR = _HEX_CACHE[c] = QtGui.QColor(RGB[0], RGB[1], RGB[2])
+        return QCOLOR
     
 
     def palette2Hex(self, color):
         """
         Returns HEX value of an RGB of a certain palette color
+        Palettes are static per mode so the results are cached by (mode, color).
         """
-        return self.RGBtoHEX(getattr(APP.palette(), color)().color().getRgb())
+        KEY = (self.MODE, color)
+        HEX = self.CACHED_HEX.get(KEY)
+        if HEX is None:
+            HEX = self.CACHED_HEX[KEY] = self.RGBtoHEX(getattr(APP.palette(), color)().color().getRgb())
+        return HEX
     
     
     def RGBtoHEX(self, rgb):
-        rgb = list(rgb); del rgb[3]
-        return '#%02x%02x%02x' % tuple(rgb)
+        return '#%02x%02x%02x' % (rgb[0], rgb[1], rgb[2])
+
+
+    def buildPalettes(self):
+        """
+        Builds the application palette of every theme once
+        """
+        self.PALETTES = {}
+        for MODE, COLORS in _PALETTE_COLORS.items():
+            PALETTE = QtGui.QPalette()
+            SET_COLOR = PALETTE.setColor
+            for ROLE, COLOR in COLORS:
+                if isinstance(ROLE, tuple): SET_COLOR(*ROLE, self.QCl(COLOR))                       ## Color group specific role
+                else: SET_COLOR(ROLE, self.QCl(COLOR))
+            self.PALETTES[MODE] = PALETTE
 
 
     def toggleMode(self, mode=0):
         """
         Sets and updates all application color palette
         """
+        self.MODE = mode
+        self.__dict__.update(_THEMES[mode])                                                     ## Sets PRIMARY, SECONDARY, etc. of the chosen theme
+        APP.setPalette(self.PALETTES[mode])
+        
+        ## Derived Colors
+        self.BTN_BORDER = modHex(self.palette2Hex('button'), 7)
+        self.SCROLLBAR_HOVER = modHex(self.SCROLLBAR, 20)
+        self.PRIMARY_GRADIENT = modHex(self.PRIMARY, 50)
+        self.BORDER_RGB = self.BORDER[1:]
+        self.STYLESHEET = self.buildStylesheet()                                                ## Theme values only change here
 
-        if not mode:
-            """
-            For Light Mode
-            """
-            self.PRIMARY = '#004B74'
-            self.SECONDARY = '#008A9A'
-            self.TERTIARY = '#F7EBC5'
-            self.GOLD = '#FFA92D'
-            self.WARN = '#D25900'
-            self.ERROR = '#9E1919'
-            self.BORDER = '#C0C0C0'
-            self.BORDER_HIGHLIGHT = '#C0C0C0'
-            self.BTN_DISABLED = '#B6B6B6'
-            self.TXT_INV = '#FFFFFF'
-            self.TXT_DISABLED = '#999999'
-            self.TXT_STATUSBAR = '#707070'
-            self.STATUSBAR = '#CFCFCF'
-            self.SCROLLBAR = '#A0A0A0'
-            self.CARD = '#EEEEEE'
-            self.CARDHOVER = '#EEEEEE'
-            self.CTX_MENU = '#FFFFFF'
-            PLT_LIGHT = QtGui.QPalette()
-            PLT_LIGHT.setColor(QtGui.QPalette.Window, self.QCl('#FFFFFF'))
-            PLT_LIGHT.setColor(QtGui.QPalette.WindowText, self.QCl('#202020'))
-            PLT_LIGHT.setColor(QtGui.QPalette.Base, self.QCl('#DFDFDF'))
-            PLT_LIGHT.setColor(QtGui.QPalette.AlternateBase, self.QCl('#2D2D2D'))
-            PLT_LIGHT.setColor(QtGui.QPalette.ToolTipBase, self.QCl('#252525'))
-            PLT_LIGHT.setColor(QtGui.QPalette.ToolTipText, self.QCl('#C5C5C5'))
-            PLT_LIGHT.setColor(QtGui.QPalette.PlaceholderText, self.QCl('#999999'))
-            PLT_LIGHT.setColor(QtGui.QPalette.HighlightedText, self.QCl('#EEEEEE'))
-            PLT_LIGHT.setColor(QtGui.QPalette.Highlight, self.QCl(self.PRIMARY))
-            PLT_LIGHT.setColor(QtGui.QPalette.Light, self.QCl('#D7D7D7'))
-            PLT_LIGHT.setColor(QtGui.QPalette.Text, self.QCl('#202020'))
-            PLT_LIGHT.setColor(QtGui.QPalette.Disabled, QtGui.QPalette.Text, self.QCl('#434343')) ## <- Unused
-            PLT_LIGHT.setColor(QtGui.QPalette.Midlight, self.QCl('#888888'))
-            PLT_LIGHT.setColor(QtGui.QPalette.Mid, self.QCl('#D2D2D2'))
-            PLT_LIGHT.setColor(QtGui.QPalette.Dark, self.QCl('#555555'))
-            PLT_LIGHT.setColor(QtGui.QPalette.Button, self.QCl('#CCCCCC'))
-            PLT_LIGHT.setColor(QtGui.QPalette.Disabled, QtGui.QPalette.Button, self.QCl('#252525')) ## <- Unused
-            PLT_LIGHT.setColor(QtGui.QPalette.ButtonText, self.QCl('#202020'))
-            PLT_LIGHT.setColor(QtGui.QPalette.BrightText, self.QCl('#FFFFFF'))
-            PLT_LIGHT.setColor(QtGui.QPalette.Link, self.QCl('#202020'))
-            PLT_LIGHT.setColor(QtGui.QPalette.LinkVisited, self.QCl('#151515'))
-            APP.setPalette(PLT_LIGHT)
 
-        elif mode == 1:
-            """
-            For Dark Mode
-            """
-            self.PRIMARY = '#008A9A' ## #008A9A Original
-            self.SECONDARY = '#004B74'
-            self.TERTIARY = '#F7EBC5'
-            self.GOLD = '#FFA92D'
-            self.WARN = '#D25900'
-            self.ERROR = '#9E1919'
-            self.BORDER = '#303030'
-            self.BORDER_HIGHLIGHT = '#505050'
-            self.BTN_DISABLED = '#212121'
-            self.TXT_INV = '#181818'
-            self.TXT_DISABLED = '#434343'
-            self.TXT_STATUSBAR = '#434343'
-            self.STATUSBAR = '#2A2A2A'
-            self.SCROLLBAR = '#3B3B3B'
-            self.CARD = '#2A2A2A'
-            self.CARDHOVER = '#323232'
-            self.CTX_MENU = '#1D1D1D'
-            PLT_DARK = QtGui.QPalette()
-            PLT_DARK.setColor(QtGui.QPalette.Window, self.QCl('#202020'))
-            PLT_DARK.setColor(QtGui.QPalette.WindowText, self.QCl('#D5D5D5'))
-            PLT_DARK.setColor(QtGui.QPalette.Base, self.QCl('#191919'))
-            PLT_DARK.setColor(QtGui.QPalette.AlternateBase, self.QCl('#2D2D2D'))
-            PLT_DARK.setColor(QtGui.QPalette.ToolTipBase, self.QCl('#252525'))
-            PLT_DARK.setColor(QtGui.QPalette.ToolTipText, self.QCl('#C5C5C5'))
-            PLT_DARK.setColor(QtGui.QPalette.PlaceholderText, self.QCl('#999999'))
-            PLT_DARK.setColor(QtGui.QPalette.HighlightedText, self.QCl('#191919'))
-            PLT_DARK.setColor(QtGui.QPalette.Highlight, self.QCl(self.PRIMARY))
-            PLT_DARK.setColor(QtGui.QPalette.Light, self.QCl('#898989'))
-            PLT_DARK.setColor(QtGui.QPalette.Text, self.QCl('#EFEFEF'))
-            PLT_DARK.setColor(QtGui.QPalette.Disabled, QtGui.QPalette.Text, self.QCl('#939393')) ## <- Unused
-            PLT_DARK.setColor(QtGui.QPalette.Midlight, self.QCl('#888888'))
-            PLT_DARK.setColor(QtGui.QPalette.Mid, self.QCl('#424242'))
-            PLT_DARK.setColor(QtGui.QPalette.Dark, self.QCl('#555555'))
-            PLT_DARK.setColor(QtGui.QPalette.Button, self.QCl('#353535'))
-            PLT_DARK.setColor(QtGui.QPalette.Disabled, QtGui.QPalette.Button, self.QCl('#252525')) ## <- Unused
-            PLT_DARK.setColor(QtGui.QPalette.ButtonText, self.QCl('#EFEFEF'))
-            PLT_DARK.setColor(QtGui.QPalette.BrightText, self.QCl('#FFFFFF'))
-            PLT_DARK.setColor(QtGui.QPalette.Link, self.QCl('#D0D0D0'))
-            PLT_DARK.setColor(QtGui.QPalette.LinkVisited, self.QCl('#CECECE'))
-            APP.setPalette(PLT_DARK)
+    def buildStylesheet(self):
+        """
+        Fills the stylesheet template with the current theme's values
+        """
+        return _STYLESHEET_TEMPLATE.substitute(
+            self.__dict__,
+            RADIUS = "7px",                                                                     ## Default: 9px
+            RADIUS_SML = "4px",                                                                 ## Default: 5px
+            PADDING = "5px",
+            ICON_BUTTONS = self.buildIconStylesheet(),
+            )
+
+
+    def buildIconStylesheet(self):
+        """
+        Returns the rules for all icon-only buttons in _ICON_BUTTONS
+        """
+        URL = lambda icon: f"url('./res/icons/{icon}.png')" if icon else "none"
+        RULES = []
+        for NAMES, ICON, HOVER, DISABLED, HIGHLIGHT in _ICON_BUTTONS:
+            STATES = (
+                ("", f"background-color: none; border: none; image: {URL(ICON)};"),
+                ("::hover", (f"background-color: {self.PRIMARY}; " if HIGHLIGHT else "") + f"image: {URL(HOVER)};"),
+                ("::disabled", f"image: {URL(DISABLED)};" if DISABLED else None),
+                )
+            for STATE, PROPERTIES in STATES:
+                if PROPERTIES: RULES.append(f"    {', '.join([f'QPushButton{STATE}#{n}' for n in NAMES])} {{ {PROPERTIES} }}")
+        return "\n".join(RULES)
 
 
     def getStylesheet(self, objectName=None):
@@ -489,577 +1023,19 @@ class Stylesheet(object):
         Returns a string of stylesheet that will be used by QStyleSheet
         Values depends on what is the current theme.
         """
-        # self.getThemes()
-        RADIUS = "7px" ## Default: 9px
-        RADIUS_SML = "4px" ## Default: 5px
-        PADDING = "5px"
-
         if objectName is None:
-            STYLESHEET = f"""
-                QWidget#WIN_PARTICIPANTS {{
-                    image: url('./res/images/bg.png');
-                    image-position: bottom;
-                }}
-
-
-
-                /* Buttons */ 
-                QPushButton {{
-                    background-color: palette(button);
-                    padding: {PADDING};
-                    border-radius: {RADIUS};
-                    border: 1px solid {modHex(self.palette2Hex('button'), 7)}
-                }}
-                QPushButton::pressed {{
-                    background-color: palette(button);
-                }}
-                QPushButton::disabled {{
-                    color: {self.TXT_DISABLED};
-                    background-color: {self.BTN_DISABLED};
-                }}
-                QPushButton::hover {{
-                    background-color: palette(light);
-                }}
-                /*
-                QPushButton::focus {{
-                    border: 1px solid {self.BORDER};
-                }}
-                */
-
-
-
-                /* Export Powerpoint Button */ 
-                QPushButton#BTN_POWERPOINT {{
-                    background-color: none;
-                    border: none;
-                    image: url('./res/icons/ppt.png');
-                }}
-
-                QPushButton::hover#BTN_POWERPOINT {{
-                    background-color: {self.PRIMARY};
-                    image: url('./res/icons/ppt_hover.png');
-                }}
-
-                QPushButton::disabled#BTN_POWERPOINT {{
-                    image: url('./res/icons/ppt_disabled.png');
-                }}
-
-
-                /* Export Plain Text Button */ 
-                QPushButton#BTN_PLAINTEXT {{
-                    background-color: none;
-                    border: none;
-                    image: url('./res/icons/plaintext.png');
-                }}
-
-                QPushButton::hover#BTN_PLAINTEXT {{
-                    background-color: {self.PRIMARY};
-                    image: url('./res/icons/plaintext_hover.png');
-                }}
-
-                QPushButton::disabled#BTN_PLAINTEXT {{
-                    image: url('./res/icons/plaintext_disabled.png');
-                }}
-
-
-
-
-                /* Participant Parser */ 
-                QPushButton#BTN_PARSELIST {{
-                    background-color: none;
-                    border: none;
-                    image: url('./res/icons/parse.png');
-                }}
-
-                QPushButton::hover#BTN_PARSELIST {{
-                    image: url('./res/icons/parse_hover.png');
-                }}
-
-                QPushButton::disabled#BTN_PARSELIST {{
-                    image: url('./res/icons/parse_disabled.png');
-                }}
-
-                QPushButton#BTN_COPY_ROLE, QPushButton#BTN_COPY_NAME {{
-                    background-color: none;
-                    border: none;
-                    image: url('./res/icons/copy.png');
-                }}
-
-                QPushButton::hover#BTN_COPY_ROLE, QPushButton::hover#BTN_COPY_NAME {{
-                    image: url('./res/icons/copy_hover.png');
-                }}
-
-                QPushButton::disabled#BTN_COPY_ROLE, QPushButton::disabled#BTN_COPY_NAME {{
-                    image: url('./res/icons/copy_disabled.png');
-                }}
-
-
-
-
-                /* Set Active Button  */ 
-                QPushButton#BTN_ATVS {{
-                    background-color: none;
-                    border: none;
-                    image: none;
-                }}
-
-                QPushButton::hover#BTN_ATVS {{
-                    image: url('./res/icons/radio_translucent_hover.png');
-                }}
-
-                QPushButton::disabled#BTN_ATVS {{
-                    image: url('./res/icons/radio_disabled.png');
-                }}
-
-
-
-                /* Set Active Button SELECTED */ 
-                QPushButton#BTN_ATVS_SELECTED {{
-                    background-color: none;
-                    border: none;
-                    image: url('./res/icons/radio_selected.png');
-                }}
-
-                QPushButton::hover#BTN_ATVS_SELECTED {{
-                    image: url('./res/icons/radio_selected_hover.png');
-                }}
-
-                QPushButton::disabled#BTN_ATVS_SELECTED {{
-                    image: url('./res/icons/select_radio_disabled.png');
-                }}
-
-
-
-                /* Edit Button */ 
-                QPushButton#BTN_MEM_EDIT {{
-                    background-color: none;
-                    border: none;
-                    image: url('./res/icons/edit.png');
-                }}
-
-                QPushButton::hover#BTN_MEM_EDIT {{
-                    image: url('./res/icons/edit_hover.png');
-                }}
-
-                QPushButton::disabled#BTN_MEM_EDIT {{
-                    image: url('./res/icons/edit_disabled.png');
-                }}
-
-
-                /* Insert/Add Button */ 
-                QPushButton#BTN_INSS, QPushButton#BTN_MEM_ADD {{
-                    background-color: none;
-                    border: none;
-                    image: url('./res/icons/add.png');
-                }}
-
-                QPushButton::hover#BTN_INSS, QPushButton::hover#BTN_MEM_ADD {{
-                    image: url('./res/icons/add_hover.png');
-                }}
-
-                QPushButton::disabled#BTN_INSS, QPushButton::disabled#BTN_MEM_ADD  {{
-                    image: url('./res/icons/add_disabled.png');
-                }}
-
-
-
-                /* Remove Button + Discard BG Img Button (Settings) + Remove */ 
-                QPushButton#BTN_REMS, QPushButton#BTN_BG_DISCARD, QPushButton#BTN_MEM_REMOVE, QPushButton#BTN_GEN_REMOVE {{
-                    background-color: none;
-                    border: none;
-                    image: url('./res/icons/xmark.png');
-                }}
-
-                QPushButton::hover#BTN_REMS, QPushButton::hover#BTN_BG_DISCARD, QPushButton::hover#BTN_MEM_REMOVE, QPushButton::hover#BTN_GEN_REMOVE {{
-                    image: url('./res/icons/xmark_hover.png');
-                }}
-
-                QPushButton::disabled#BTN_REMS, QPushButton::disabled#BTN_BG_DISCARD, QPushButton::disabled#BTN_MEM_REMOVE, QPushButton::disabled#BTN_GEN_REMOVE {{
-                    image: url('./res/icons/xmark_disabled.png');
-                }}
-
-
-
-                /* Import Export Button */
-                QPushButton#BTN_MEM_IMPORT, QPushButton#BTN_GEN_IMPORT {{
-                    background-color: none;
-                    border: none;
-                    image: url('./res/icons/import.png');
-                }}
-
-                QPushButton::hover#BTN_MEM_IMPORT, QPushButton::hover#BTN_GEN_IMPORT {{
-                    image: url('./res/icons/import_hover.png');
-                }}
-
-                QPushButton::disabled#BTN_MEM_IMPORT, QPushButton::disabled#BTN_GEN_IMPORT {{
-                    image: url('./res/icons/import_disabled.png');
-                }}
-
-                QPushButton#BTN_MEM_EXPORT, QPushButton#BTN_GEN_EXPORT {{
-                    background-color: none;
-                    border: none;
-                    image: url('./res/icons/export.png');
-                }}
-
-                QPushButton::hover#BTN_MEM_EXPORT, QPushButton::hover#BTN_GEN_EXPORT {{
-                    image: url('./res/icons/export_hover.png');
-                }}
-
-                QPushButton::disabled#BTN_MEM_EXPORT, QPushButton::disabled#BTN_GEN_EXPORT {{
-                    image: url('./res/icons/export_disabled.png');
-                }}
-
-
-
-                /* Color Picker Button */
-                QPushButton#BTN_FAC_COLORPICKER {{
-                    background-color: none;
-                    border: none;
-                    image: url('./res/icons/fill.png');
-                }}
-
-                QPushButton::hover#BTN_FAC_COLORPICKER {{
-                    image: url('./res/icons/fill_hover.png');
-                }}
-
-                QPushButton::disabled#BTN_FAC_COLORPICKER {{
-                    image: url('./res/icons/fill_disabled.png');
-                }}
-
-
-
-                 /* Group Boxes */
-                QGroupBox {{
-                    border-radius: {RADIUS};
-                    background-color: {self.CARD};
-                    margin-top: 1.5em;
-                    padding: 5px;
-                    font-weight: bold;
-                    font-size: 10pt;
-                }}
-                QGroupBox::hover {{
-                    background-color: {self.CARDHOVER};
-                }}
-                QGroupBox::title {{
-                    color: palette(text);
-                    subcontrol-origin: margin;
-                    left: 0px;
-                    padding: 3px 5px 3px 5px;
-                    border-radius: {RADIUS};
-                }}
-                QGroupBox::title::hover {{
-                    border: 1px solid {self.PRIMARY};
-                }}
-
-
-
-                /* Remove Button LOCKED */ 
-                QPushButton#BTN_REMS_LOCKED {{
-                    background-color: none;
-                    border: none;
-                    image: url('./res/icons/locked.png');
-                }}
-
-                QPushButton::hover#BTN_REMS_LOCKED {{
-                    image: url('./res/icons/unlock.png');
-                }}
-
-                QPushButton::disabled#BTN_REMS_LOCKED {{
-                    image: url('./res/icons/locked_disabled.png');
-                }}
-
-
-
-                /* Save List Button */
-                QPushButton#BTN_SAVELIST, QPushButton#BTN_MEM_SAVE {{
-                    background-color: none;
-                    border: none;
-                    image: url('./res/icons/save.png');
-                }}
-
-                QPushButton::hover#BTN_SAVELIST, QPushButton::hover#BTN_MEM_SAVE {{
-                    image: url('./res/icons/save_hover.png');
-                }}
-
-                QPushButton::disabled#BTN_SAVELIST, QPushButton::disabled#BTN_MEM_SAVE {{
-                    image: url('./res/icons/save_disabled.png');
-                }}
-
-
-
-                /* Settings Button (Gear) */ 
-                QPushButton#BTN_SETTINGS, QPushButton#BTN_GEN_MODIFY {{
-                    background-color: none;
-                    border: none;
-                    image: url('./res/icons/settings.png');
-                }}
+            return self.STYLESHEET
 
-                QPushButton::hover#BTN_SETTINGS, QPushButton::hover#BTN_GEN_MODIFY {{
-                    image: url('./res/icons/settings_hover.png');
-                }}
 
 
-                /* Browse Button (Settings) */
-                QPushButton#BTN_BG_BROWSE {{
-                    background-color: none;
-                    border: none;
-                    image: url('./res/icons/folder.png');
-                }}
 
-                QPushButton::hover#BTN_BG_BROWSE {{
-                    image: url('./res/icons/folder_hover.png');
-                }}
-
-                QPushButton::disabled#BTN_BG_BROWSE {{
-                    image: url('./res/icons/folder_disabled.png');
-                }}
-
-
-                /* Dialog Boxes */
-                QMessageBox {{
-                    background-color: palette(window);
-                }}
-                
-
-
-                /* Tooltip */
-                QToolTip {{
-                    color: palette(text);
-                    background-color: palette(base);
-                    border: none;
-                }}
-
-
-
-                /* Status Bar */
-                QStatusBar#STATUSBAR {{
-                    color: {self.TXT_STATUSBAR};
-                    background-color: {self.STATUSBAR};
-                }}
-
-
-
-                /* Search Bars */
-                QLineEdit, QComboBox{{
-                    color: palette(text);
-                    selection-color: {self.TXT_INV};
-                    background-color: {self.CARD};
-                    border: 1px solid {self.BORDER};
-                    border-radius: {RADIUS};
-                    padding: {PADDING};
-                }}
-                QLineEdit::focus#LNE_SEARCH {{
-                    background-color: #AF{self.BORDER[1:]};
-                }}
-                QLineEdit::hover#LNE_SEARCH {{
-                    border: 1px solid {self.BORDER_HIGHLIGHT};
-                }}
-
-
-
-                /* Combo Boxes */
-                QComboBox {{
-                    background-color: transparent;
-                    border: 1px solid {self.BORDER};
-                }}
-                QComboBox::hover {{
-                    background-color: transparent;
-                    border: 1px solid {self.SECONDARY};
-                }}
-
-                QComboBox#CBX_RLS {{
-                    margin-bottom: 1px;
-                }}
-                QComboBox#CBX_NMS {{
-                    margin-bottom: 1px;
-                }}
-
-
-
-                /* Sliders */
-                QSlider::handle {{
-                    background-color: {self.PRIMARY};
-                }}
-                QSlider::handle::pressed {{
-                    background-color: {self.SECONDARY};
-                }}
-
-
-
-                /* ScrollBars */
-                QScrollBar:vertical {{
-                    background-color: palette(base);
-                    width: 16px;
-                    margin: 0px;
-                    border-radius: {RADIUS_SML};
-                }}
-                QScrollBar:horizontal {{
-                    background-color: palette(base);
-                    height: 15px;
-                    margin: 0px;
-                    border-radius: {RADIUS_SML};
-                }}
-                QScrollBar::handle:vertical {{
-                    background-color: {self.SCROLLBAR}; min-height: 20px; margin: 3px; border-radius: {RADIUS_SML}; border: none;
-                }}
-                QScrollBar::handle:horizontal {{
-                    background-color: {self.SCROLLBAR}; min-width: 20px; margin: 3px; border-radius: {RADIUS_SML}; border: none;
-                }}
-                QScrollBar::handle::hover {{
-                    background-color: {modHex(self.SCROLLBAR, 20)}; min-width: 20px; margin: 3px; border-radius: {RADIUS_SML}; border: none;
-                }}
-                QScrollBar::handle::pressed {{
-                    background-color: {self.PRIMARY}; min-width: 20px; margin: 3px; border-radius: {RADIUS_SML}; border: none;
-                }}
-
-                QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical {{
-                    border: none; background: none; height: 0px;
-                }}
-                QScrollBar::add-line:horizontal, QScrollBar::sub-line:horizontal {{
-                    border: none; background: none; width: 0px;
-                }}
-                QScrollBar::up-arrow:vertical, QScrollBar::down-arrow:vertical, QScrollBar::add-page:vertical, QScrollBar::sub-page:vertical {{
-                    border: none; background: none; color: none;
-                }}
-                QScrollBar::left-arrow:horizontal, QScrollBar::right-arrow:horizontal, QScrollBar::add-page:horizontal, QScrollBar::sub-page:horizontal {{
-                    border: none; background: none; color: none;
-                }}
-                
-
-
-                /* Settings Panel (List) */
-                QAbstractItemView {{
-                    color: palette(text);
-                    outline: none;
-                    background-color: palette(base);
-                    border: none;
-                    border-radius: {RADIUS};
-                    selection-color: {self.TXT_INV};
-                    selection-background-color: {self.SECONDARY};
-                    padding: 3px;
-                    min-height: 15px;
-                }}
-                QAbstractItemView::item {{
-                    padding: 5px 2px 5px 4px;
-                    margin: 2px 0px 2px 0px;
-                    border-radius: {RADIUS};
-                }}
-                QAbstractItemView::item::selected {{
-                    background-color: {self.PRIMARY};
-                }}
-                QAbstractItemView::item::hover {{
-                    color: palette(text);
-                    background-color: {self.CARD};
-                }}
-                QAbstractItemView::item::selected::hover {{
-                    color: {self.TXT_INV};
-                    background-color: qlineargradient(x1: 0, y1: 0, x2: 1, y2: 1,stop: 0 {modHex(self.PRIMARY, 50)}, stop: 1 {self.PRIMARY});
-                }}
-
-                /* Log Panel */
-                QPlainTextEdit {{
-                    color: palette(text);
-                    background-color: palette(base);
-                    border: 1px solid {self.BORDER};
-                    border-radius: {RADIUS};
-                }}
-            
+## Default presentation colors and font sizes, converted to pptx types on export
+_RGB_WHITE = (255, 255, 255)
+_RGB_SUBTITLE = (255, 169, 45)
+_RGB_ROLES = (221, 221, 221)
+_FSZ_TITLE, _FSZ_SUBTITLE, _FSZ_DATE = 40, 30, 15
 
-
-                /* Checkboxes (Toggle Switches) */
-                QCheckBox {{
-                    outline: none;
-                }}
-                QCheckBox::indicator {{
-                    width: 23px;
-                    height: 23px;
-                }}
-                QCheckBox::indicator::unchecked {{
-                    image: url(./res/icons/off.png);
-                }}
-                QCheckBox::indicator::unchecked::hover {{
-                    image: url(./res/icons/off_hover.png);
-                }}
-                QCheckBox::indicator::checked {{
-                    image: url(./res/icons/on.png);
-                }}
-                QCheckBox::indicator::checked::hover {{
-                    image: url(./res/icons/on_hover.png);
-                }}
-                QCheckBox::indicator::disabled {{
-                    image: url(./res/icons/toggle_disabled.png);
-                }}
-
-
-
-                /* Spin
-
-                /* Spin Box */
-                QSpinBox {{
-                    border: 1px solid {self.BORDER};
-                    border-radius: {RADIUS};
-                }}
-                
-
-                /* Add Queue Button */
-                QPushButton#BTN_ADDQUEUE {{
-                    background-color: transparent;
-                    min-width: 17px;
-                    width: 20px;
-                    height: 20px;
-                    image: url('./res/icons/add_.png');
-                }}
-                QPushButton::hover#BTN_ADDQUEUE {{
-                    image: url('./res/icons/add_hover_.png');
-                }}
-
-
-                /* Queue Button */
-                QPushButton#BTN_QUEUES {{
-                    background-color: transparent;
-                    min-width: 17px;
-                    width: 20px;
-                    height: 20px;
-                    image: url('./res/icons/queue_.png');
-                }}
-                QPushButton::hover#BTN_QUEUES {{
-                    image: url('./res/icons/queue_hover_.png');
-                }}
-
-
-
-                /* Special */
-
-                QLabel#PIX_HEADER {{
-                    color: {self.PRIMARY};
-                }}
-                QLabel::disabled, QLabel#LBL_BROWSERB {{
-                    color: {self.TXT_DISABLED};
-                }}
-                
-                QPushButton::enabled#BTN_LAUNCH, QPushButton::enabled#BTN_OK {{
-                    color: {self.TXT_INV};
-                    background-color: {self.PRIMARY};
-                }}
-                QPushButton#BTN_LAUNCH, QPushButton#BTN_OK  {{
-                    min-width: 100px;
-                }}
-                QPushButton::hover#BTN_LAUNCH, QPushButton::hover#BTN_OK {{
-                    color: {self.TXT_INV};
-                    background-color: qlineargradient(x1: 0, y1: 0, x2: 1, y2: 1,stop: 0 {modHex(self.PRIMARY, 50)}, stop: 1 {self.PRIMARY});
-                }}
-                
-                QPushButton::hover#BTN_RESET {{
-                    color: palette(highlighted-text);
-                    background-color: {self.ERROR};
-                }}
-                QLabel#LBL_RL, QLabel#LBL_NM {{
-                    color: #005278;
-                    padding: 3px;
-                    border-radius: {RADIUS};
-                }}
-                """
-            return STYLESHEET
+_DESKTOP = os.path.expanduser('~\\Desktop')                                                      ## Default folder for member list import/export
 
 
 
@@ -1088,8 +1064,8 @@ class Package(object):
         ## Main PPT Package
         self.DEF_DIR_EXPORT_RECENT = SW.DIR_CWD
         self.DIR_EXPORT_RECENT = SW.DIR_CWD
-        self.DIR_EXPORT_MEMLIST = os.path.expanduser('~\Desktop')
-        self.DIR_IMPORT_MEMLIST = os.path.expanduser('~\Desktop')
+        self.DIR_EXPORT_MEMLIST = _DESKTOP
+        self.DIR_IMPORT_MEMLIST = _DESKTOP
         self.DEF_IMG_BACKGROUND = "res/images/defBG.png"
         self.IMG_BACKGROUND = self.DEF_IMG_BACKGROUND
         self.FONT_TITLE = "Harriet Text Bold"
@@ -1098,14 +1074,14 @@ class Package(object):
         self.FONT_CONTENT = "Harriet Text Bold"
         self.TXT_TITLE = "Sabbath Worship Participants"
         self.TXT_SUBTITLE = "Happy Sabbath!"
-        self.RGB_TITLE = RGBColor(255, 255, 255)
-        self.RGB_SUBTITLE = RGBColor(255, 169, 45)
-        self.RGB_DATE = RGBColor(255, 255, 255)
-        self.RGB_ROLES = RGBColor(221, 221, 221)
-        self.RGB_NAMES = RGBColor(255, 255, 255)
-        self.FSZ_TITLE = Pt(40)
-        self.FSZ_SUBTITLE = Pt(30)
-        self.FSZ_DATE = Pt(15)
+        self.RGB_TITLE = _RGB_WHITE
+        self.RGB_SUBTITLE = _RGB_SUBTITLE
+        self.RGB_DATE = _RGB_WHITE
+        self.RGB_ROLES = _RGB_ROLES
+        self.RGB_NAMES = _RGB_WHITE
+        self.FSZ_TITLE = _FSZ_TITLE
+        self.FSZ_SUBTITLE = _FSZ_SUBTITLE
+        self.FSZ_DATE = _FSZ_DATE
 
         ## Config
         self.ALWAYS_ON_TOP = False
@@ -1116,33 +1092,28 @@ class Package(object):
     def loadConfig(self):
         """
         Retrieves all saved configurations from data.json
-        Works by looping through all variables in this program and finding
-        the working ones from absent ones.
+        Only the listed variables are loaded, absent ones keep their default.
         """
         LOG.info('Loading configuration')
-        LOAD = [
-            (self.IMG_BACKGROUND, "IMG_BACKGROUND"),
-            (self.FONT_TITLE, "FONT_TITLE"),
-            (self.FONT_SUBTITLE, "FONT_SUBTITLE"),
-            (self.FONT_DATE, "FONT_DATE"),
-            (self.FONT_CONTENT, "FONT_CONTENT"), 
-            (self.TXT_TITLE, "TXT_TITLE"),
-            (self.TXT_SUBTITLE, "TXT_SUBTITLE"),
-            (self.DIR_EXPORT_RECENT, "DIR_EXPORT_RECENT"),
-            (self.DIR_IMPORT_MEMLIST, "DIR_IMPORT_MEMLIST"),
-            (self.DIR_EXPORT_MEMLIST, "DIR_EXPORT_MEMLIST"),
-            (self.ALWAYS_ON_TOP, "ALWAYS_ON_TOP"),
-            (self.SPLIT_DIVINE, "SPLIT_DIVINE"),
-            (self.PRES_DISPDATE, "PRES_DISPDATE"),
-        ]
-        for obj in LOAD:
-            try:
-                for var in dict(self.__dict__):
-                    if getattr(self, var) == obj[0]:
-                        setattr(self, obj[1], DCFG["CONFIG"][obj[1]])
-                        break
-            except Exception as e:
-                pass
+        LOAD = (
+            "IMG_BACKGROUND",
+            "FONT_TITLE",
+            "FONT_SUBTITLE",
+            "FONT_DATE",
+            "FONT_CONTENT",
+            "TXT_TITLE",
+            "TXT_SUBTITLE",
+            "DIR_EXPORT_RECENT",
+            "DIR_IMPORT_MEMLIST",
+            "DIR_EXPORT_MEMLIST",
+            "ALWAYS_ON_TOP",
+            "SPLIT_DIVINE",
+            "PRES_DISPDATE",
+        )
+        CFG = DCFG.get("CONFIG", {})
+        for KEY in LOAD:
+            if KEY in CFG:
+                setattr(self, KEY, CFG[KEY])
 
         LOG.info('Successfully loaded configuration.')
 
@@ -1154,7 +1125,7 @@ class Core(object):
     Contains methods that are used for better user experience
     """
     def __init__(self):
-        self.IGNORED_CASE = ['of', 'to', 'and', 'by', 'for']
+        self.IGNORED_CASE = frozenset(('of', 'to', 'and', 'by', 'for'))
 
 
     def centerWindow(self, ui):
@@ -1176,7 +1147,7 @@ class Core(object):
         WGTA.move(WGTB.pos().x()+int(WINDOW[0]/2), WGTB.pos().y()+int(WINDOW[1]/2.2))
 
 
-    def splitContents(self, roles:str, names:str):
+    def splitContents(self, roles:list, names:list):
         """
         Splits the content to distinguish Sabbath school from Divine Service.
         Has fallback for when the service-based categorizing fails
@@ -1184,22 +1155,45 @@ class Core(object):
         for i, cmb in enumerate(FLD.CBX_RLS):
             ## Regular Splitter
             if cmb.currentText().upper() in ["CLOSING PRAYER", "CLOSINGPRAYER", "CLOSING"]:
-                SS_A = roles.split('\n', i+1); DS_A = SS_A[-1].split('\n'); SS_A.pop(-1)
-                SS_B = names.split('\n', i+1); DS_B = SS_B[-1].split('\n'); SS_B.pop(-1)
-                return (SS_A, SS_B, DS_A, DS_B)
-                
+                A, B = min(i+1, len(roles)-1), min(i+1, len(names)-1)              ## Last line always goes to divine service
+                return (roles[:A], names[:B], roles[A:], names[B:])
+
         ## Basic Splitter (Fallback)
-        SS_A = roles.split('\n', int(len(roles.split('\n'))/2)); DS_A = SS_A[-1].split('\n', int(len(SS_A[-1].split('\n'))/2)); SS_A.pop(-1)
-        SS_B = names.split('\n', int(len(names.split('\n'))/2)); DS_B = SS_B[-1].split('\n', int(len(SS_B[-1].split('\n'))/2)); SS_B.pop(-1)
-        return (SS_A, SS_B, DS_A, DS_B)
+        A, B = len(roles)//2, len(names)//2
+        return (roles[:A], names[:B], roles[A:], names[B:])
 
 
     def adjustRoleFormat(self, role:str):
         """
         Return the role string to a presentable format
         """
-        return ' '.join(map(str, [f"{w[:1].upper()}{w[1:].lower()}" if w.lower() not in self.IGNORED_CASE
-                else w.lower() if i else f"{w[:1].upper()}{w[1:].lower()}" for i, w in enumerate(role.split())]))
+        WORDS = role.split()
+        return ' '.join(l if i and l in self.IGNORED_CASE else w[:1].upper()+w[1:].lower()
+                for i, (w, l) in enumerate(zip(WORDS, map(str.lower, WORDS))))
+
+
+
+
+class QCBX_FIELD(QComboBox):
+    """
+    Combo box used by every field. The popup window flags are applied
+    on its first showing instead of on creation, since changing them
+    recreates the native window
+    """
+    POPUP_FLAGS = Qt.Popup | Qt.FramelessWindowHint | Qt.NoDropShadowWindowHint
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.FLAGGED = False
+
+
+    def showPopup(self):
+        if not self.FLAGGED:
+            POPUP = self.view().window()
+            POPUP.setWindowFlags(self.POPUP_FLAGS)
+            POPUP.setAttribute(Qt.WA_TranslucentBackground)
+            self.FLAGGED = True
+        super().showPopup()
 
 
 
@@ -1223,6 +1217,16 @@ class Fields(object):
         """
         self.LOADING = True
         self.CBX_RLS, self.CBX_NMS, self.BTN_REMS, self.BTN_INSS, self.BTN_ATVS = [], [], [], [], []
+        self.CONNECTIONS = []                                                                   ## Signal connections made by refreshStates
+        self.MODELS = (QtCore.QStringListModel(), QtCore.QStringListModel())                    ## Item lists shared by every role (0) and name (1) combo box
+        self.SORTED_MODELS = (QtCore.QSortFilterProxyModel(), QtCore.QSortFilterProxyModel())   ## Case-insensitively sorted views of MODELS for the completers
+        for MODEL, SORTED in zip(self.MODELS, self.SORTED_MODELS):
+            SORTED.setSourceModel(MODEL)
+            SORTED.setSortCaseSensitivity(Qt.CaseInsensitive)
+            SORTED.sort(0)                                                                      ## Dynamic sorting keeps it ordered after every model update
+        self.LAST_ITEMS = [None, None]                                                          ## (Field texts, Pool) each model was last built from
+        self.FIELD_DATA = None                                                                  ## (Roles, Names) texts of every field, cleared whenever one changes
+        self.CBX_INDEX = {}                                                                     ## id() of every combo box -> its field index, rebuilt by refreshStates
         self.FIELDS = 0
         self.FIELDS_MAX = 20
         self.PREV_ACTIVE = None
@@ -1247,10 +1251,16 @@ class Fields(object):
         if not LENGTH:                                                                                  ## Eliminates no-field issue when there's no data from pool
             PDB.generateDefault()
             LENGTH = 1
-        self.addFields(LENGTH)
-        self.fillupItems()
-        self.refreshItems()
-        self.refreshStates()
+        self.MODELS[0].setStringList(RLS)
+        self.MODELS[1].setStringList(NMS)
+        UIA.WGT_CENTRAL.setUpdatesEnabled(False)                                                        ## Coalesces the layout passes of every new field into one repaint
+        try:
+            self.addFields(LENGTH)
+            self.fillupItems()
+            self.refreshItems()
+        finally:
+            UIA.WGT_CENTRAL.setUpdatesEnabled(True)
+            UIA.WGT_CENTRAL.update()
         self.LOADING = False
 
 
@@ -1263,23 +1273,24 @@ class Fields(object):
         of every present button after recent changes
         """
         ## Reconnect Signals
+        for CONNECTION in self.CONNECTIONS:                                                             ## Disconnecting by handle never raises, handles of deleted widgets are just invalid
+            QtCore.QObject.disconnect(CONNECTION)
+        self.CONNECTIONS = []
+        self.clearFieldData()                                                                           ## Fields may have been added or removed
+        self.CBX_INDEX = {}
         for i in range(len(self.BTN_REMS)):                                                             ## Loops through every single button object based on BTN_REMS or BTN_INSS
-            try:
-                self.CBX_RLS[i].lineEdit().editingFinished.disconnect()
-                self.CBX_NMS[i].lineEdit().editingFinished.disconnect()
-                self.CBX_RLS[i].lineEdit().textChanged.disconnect()
-                self.CBX_NMS[i].lineEdit().textChanged.disconnect()
-                self.BTN_ATVS[i].clicked.disconnect()
-            except Exception:                                                                           ## Throws exception when the buttons aren't connected yet which is not valid in the disconnect method
-                pass
-            finally:                                                                                    ## Always connect the Add and Remove button to its main method
-                self.CBX_RLS[i].lineEdit().editingFinished.connect(lambda: self.refreshItems())
-                self.CBX_NMS[i].lineEdit().editingFinished.connect(lambda: self.refreshItems())
-                self.CBX_RLS[i].lineEdit().textChanged.connect(lambda: self.recordCbx('RLS'))
-                self.CBX_NMS[i].lineEdit().textChanged.connect(lambda: self.recordCbx('NMS'))
-                self.BTN_ATVS[i].clicked.connect(lambda: self.setActiveField())
-                self.BTN_INSS[i].mouseReleaseEvent = lambda event: self.mouseReleased('INSS', event)
-                self.BTN_REMS[i].mouseReleaseEvent = lambda event: self.mouseReleased('REMS', event)
+            self.CBX_INDEX[id(self.CBX_RLS[i])] = self.CBX_INDEX[id(self.CBX_NMS[i])] = i
+            self.CONNECTIONS += (
+                self.CBX_RLS[i].lineEdit().editingFinished.connect(self.refreshItems),
+                self.CBX_NMS[i].lineEdit().editingFinished.connect(self.refreshItems),
+                self.CBX_RLS[i].lineEdit().textChanged.connect(partial(self.recordCbx, 0, i)),
+                self.CBX_NMS[i].lineEdit().textChanged.connect(partial(self.recordCbx, 1, i)),
+                self.CBX_RLS[i].currentTextChanged.connect(self.clearFieldData),
+                self.CBX_NMS[i].currentTextChanged.connect(self.clearFieldData),
+                self.BTN_ATVS[i].clicked.connect(partial(self.setActiveField, i)),                      ## Field index is bound here so the handlers need not search for the focused button
+                )
+            self.BTN_INSS[i].mouseReleaseEvent = partial(self.mouseReleased, 'INSS', i)                 ## Always connect the Add and Remove button to its main method
+            self.BTN_REMS[i].mouseReleaseEvent = partial(self.mouseReleased, 'REMS', i)
         
         ## Prevent Overflow
         for btn in self.BTN_INSS:
@@ -1306,7 +1317,6 @@ class Fields(object):
         """
         m = time.time()
         PRCD = (self.CBX_RLS, RLS), (self.CBX_NMS, NMS)                                 ## Procedure Variable (Role Objects, Role List) & (Name Objects, Name List)
-        s = 0                                                                           ## Step
         
         try:
             HCBX = self.PREV_CBX                                                        ## Used for holding values for previous recorded CBX
@@ -1317,24 +1327,19 @@ class Fields(object):
         except IndexError:
             pass
 
-        while True:
-            ITEMS = [c.currentText().strip() for c in PRCD[s][0]]                       ## Retrieve all current items displayed
-
-            for i, c in enumerate(PRCD[s][0]):                                          ## Clear and fill up all CBX objects with items
-                c.clear()
-                c.addItems(ITEMS)
-                c.setCurrentIndex(i)
-                ## FIX THIS (Blank spaces)
-                if c.currentText() == '':                                               ## Prevent including the blank item in combo box by resetting the index to none (-1)
-                    c.setCurrentIndex(-1)
-                    c.removeItem(i)
-            
-            MERGE = [item for item in PRCD[s][1] if item not in ITEMS]                  ## Merge with excess names from pool
-            if len(MERGE):
-                for i, c in enumerate(PRCD[s][0]):
-                    # c.insertSeparator(c.count()-1)  ## <-- Not working for some reason
-                    c.addItem(self.SEPARATOR)
-                    c.addItems(MERGE)
+        for s, (CBXS, POOL) in enumerate(PRCD):
+            ITEMS = [c.currentText().strip() for c in CBXS]                             ## Retrieve all current items displayed
+            KEY = (tuple(ITEMS), tuple(POOL))
+            if KEY != self.LAST_ITEMS[s]:                                               ## Skips the rebuild when nothing changed since the last one
+                self.LAST_ITEMS[s] = KEY
+                LISTED = list(dict.fromkeys([i for i in ITEMS if i]))                   ## Blank fields are not listed as an item
+                PRESENT = set(ITEMS)
+                MERGE = [item for item in POOL if item not in PRESENT]                  ## Merge with excess names from pool
+                self.MODELS[s].setStringList(LISTED + ([self.SEPARATOR] + MERGE if MERGE else [])) ## One update is seen by all CBX objects of this category
+
+                ROWS = {item: i for i, item in enumerate(LISTED)}
+                for c, item in zip(CBXS, ITEMS):                                        ## Model reset clears the texts, so each CBX gets its own item back
+                    c.setCurrentIndex(ROWS.get(item, -1))                               ## Blank fields are set to none (-1)
 
 
             # ## Scan for identicals
@@ -1375,13 +1380,6 @@ class Fields(object):
             #         # for l in range(self.FIELDS):
             #         #     c.removeItem(0)
 
-            ## NOTE: 
-            ##      should remove blank spaces in items for every empty field
-            ##
-
-            if s > 0: break
-            else: s += 1
-
 
     def fillupItems(self):
         """
@@ -1397,55 +1395,51 @@ class Fields(object):
             if n.currentText() == '': n.setCurrentIndex(-1)
 
 
-    def redirectFieldInsertion(self, duplicate=False):
+    def redirectFieldInsertion(self, i:int, duplicate=False):
         """
         Redirects function to UIA's Field Insertion function.
-        Triggers from the Add button via PyQt signal 
+        Triggers from the Add button of field `i` via PyQt signal 
         """
         m = time.time()
-        for i, btn in enumerate(self.BTN_INSS):
-            if not btn.hasFocus(): continue
-            self.insertField(i)
-            self.refreshItems()
-            if duplicate:
-                self.CBX_RLS[i+1].setCurrentIndex(self.CBX_RLS[i].findText(self.CBX_RLS[i].currentText()))
-                self.CBX_NMS[i+1].setCurrentIndex(self.CBX_NMS[i].findText(self.CBX_NMS[i].currentText()))
-            break
+        self.insertField(i)
+        self.refreshItems()
+        if duplicate:
+            self.CBX_RLS[i+1].setCurrentIndex(self.CBX_RLS[i].currentIndex())
+            self.CBX_NMS[i+1].setCurrentIndex(self.CBX_NMS[i].currentIndex())
         showLatency(m)
 
 
-    def setActiveField(self):
+    def setActiveField(self, i:int, checked=False):
         """
         Sets an active field by exporting its current values into a text file 
-        to be read by a Text Source from OBS Studio
-        """
-        for i, btn in enumerate(self.BTN_ATVS):
-            if not btn.hasFocus(): continue
-            if btn.objectName() == 'BTN_ATVS_SELECTED':                                             ## Unset the field from being active
-                EXP.fromActiveField(i, True)
-                btn.setObjectName('BTN_ATVS')
-            else:                                                                                   ## Before setting the triggered button to active, determine the previous
-                if self.PREV_ACTIVE is not None:                                                    ## index to unset from being active and return into a normal state.
-                    POINTER = self.PREV_ACTIVE
-                    try:
-                        self.BTN_ATVS[POINTER]
-                    except IndexError:
-                        POINTER = len(self.BTN_ATVS)-1
-                    finally:
-                        self.BTN_ATVS[POINTER].setObjectName('BTN_ATVS')
-                        self.BTN_ATVS[POINTER].setToolTip(self.TTIP_BTN_ATVS)
-                        self.BTN_ATVS[POINTER].setStyleSheet(QSS.getStylesheet())
-                
-                EXP.fromActiveField(i)                                                              ## Set the focused button to be active and export the file
-                btn.setObjectName('BTN_ATVS_SELECTED')
-                btn.setToolTip(self.TTIP_BTN_ATVS_SELECTED)
-                self.PREV_ACTIVE = i
+        to be read by a Text Source from OBS Studio.
+        `checked` is only there to accept the argument of the clicked signal.
+        """
+        btn = self.BTN_ATVS[i]
+        if btn.objectName() == 'BTN_ATVS_SELECTED':                                                 ## Unset the field from being active
+            EXP.fromActiveField(i, True)
+            btn.setObjectName('BTN_ATVS')
+        else:                                                                                       ## Before setting the triggered button to active, determine the previous
+            if self.PREV_ACTIVE is not None:                                                        ## index to unset from being active and return into a normal state.
+                POINTER = self.PREV_ACTIVE
+                try:
+                    self.BTN_ATVS[POINTER]
+                except IndexError:
+                    POINTER = len(self.BTN_ATVS)-1
+                finally:
+                    self.BTN_ATVS[POINTER].setObjectName('BTN_ATVS')
+                    self.BTN_ATVS[POINTER].setToolTip(self.TTIP_BTN_ATVS)
+                    QSS.repolish(self.BTN_ATVS[POINTER])
+            
+            EXP.fromActiveField(i)                                                                  ## Set the focused button to be active and export the file
+            btn.setObjectName('BTN_ATVS_SELECTED')
+            btn.setToolTip(self.TTIP_BTN_ATVS_SELECTED)
+            self.PREV_ACTIVE = i
 
-            btn.setStyleSheet(QSS.getStylesheet())
-            break
+        QSS.repolish(btn)                                                                           ## Re-matches the app stylesheet against the new object name
 
 
-    def insertField(self, pos:int=-1):
+    def insertField(self, pos:int=-1, refresh:bool=True):
         """
         Inserts one new set of widgets with items available from both pools (roles, names).
         Creates Role, Name, Add button, Remove button to be placed on a vertical box layout.
@@ -1469,7 +1463,7 @@ class Fields(object):
         4. Starts instantiating all four (4) widgets to make a single-line field
         5. Combo boxes are filled with data from the pool for both Roles and Names
         6. Inserting the item in a QVBoxLayout
-        7. Refresh states
+        7. Refresh states, unless `refresh` is False because the caller refreshes once after a batch
 
         This method is not a loop but it can be used multiple times using a different method
         `addFields` which accepts numbers of how many times you want to generate a field.
@@ -1493,40 +1487,11 @@ class Fields(object):
         self.FIELDS = FDS+1
 
         ## Fills the placeholder with objects (for Role, Name, Add, and Clear/Remove button) 
-        self.CBX_RLS[pos] = QComboBox(UIA.WGT_CENTRAL); self.CBX_RLS[pos].setObjectName(f"CBX_RLS")
-        self.CBX_RLS[pos].view().window().setWindowFlags(Qt.Popup | Qt.FramelessWindowHint | Qt.NoDropShadowWindowHint)
-        self.CBX_RLS[pos].view().window().setAttribute(Qt.WA_TranslucentBackground)
-        self.CBX_RLS[pos].setMinimumWidth(140); self.CBX_RLS[pos].setMaximumWidth(200)
-        self.CBX_RLS[pos].setEditable(True)
-        self.CBX_RLS[pos].addItems(RLS)
-        self.CBX_RLS[pos].setCurrentText('')
-        self.CBX_RLS[pos].setMaxVisibleItems(self.MAX_VISIBLE_ITEMS)
-        self.CBX_RLS[pos].wheelEvent = lambda e: self.ignoreWheel(e)
-
-        self.CBX_NMS[pos] = QComboBox(UIA.WGT_CENTRAL); self.CBX_NMS[pos].setObjectName(f"CBX_NMS")
-        self.CBX_NMS[pos].view().window().setWindowFlags(Qt.Popup | Qt.FramelessWindowHint | Qt.NoDropShadowWindowHint)
-        self.CBX_NMS[pos].view().window().setAttribute(Qt.WA_TranslucentBackground)
-        self.CBX_NMS[pos].setMinimumWidth(140); self.CBX_NMS[pos].setMaximumWidth(200)
-        self.CBX_NMS[pos].setEditable(True)
-        self.CBX_NMS[pos].addItems(NMS)
-        self.CBX_NMS[pos].setCurrentText('')
-        self.CBX_NMS[pos].setMaxVisibleItems(self.MAX_VISIBLE_ITEMS)
-        self.CBX_NMS[pos].wheelEvent = lambda e: self.ignoreWheel(e)
-
-        self.BTN_ATVS[pos] = QPushButton(UIA.WGT_CENTRAL); self.BTN_ATVS[pos].setObjectName(f"BTN_ATVS")
-        self.BTN_ATVS[pos].setMaximumWidth(25);        self.BTN_ATVS[pos].setMinimumHeight(30)
-        self.BTN_ATVS[pos].setToolTip(self.TTIP_BTN_ATVS)
-        self.BTN_ATVS[pos].setFocusPolicy(Qt.ClickFocus)
-
-        self.BTN_INSS[pos] = QPushButton(UIA.WGT_CENTRAL); self.BTN_INSS[pos].setObjectName(f"BTN_INSS")
-        self.BTN_INSS[pos].setMaximumWidth(26); self.BTN_INSS[pos].setMinimumHeight(30)
-        self.BTN_INSS[pos].setToolTip(self.TTIP_BTN_INSS)
-        self.BTN_INSS[pos].setFocusPolicy(Qt.ClickFocus)
-
-        self.BTN_REMS[pos] = QPushButton(UIA.WGT_CENTRAL); self.BTN_REMS[pos].setObjectName(f"BTN_REMS")
-        self.BTN_REMS[pos].setMaximumWidth(25); self.BTN_REMS[pos].setMinimumHeight(30)
-        self.BTN_REMS[pos].setToolTip(self.TTIP_BTN_REMS)
-        self.BTN_REMS[pos].setFocusPolicy(Qt.ClickFocus)
+        self.CBX_RLS[pos] = self.createCombo("CBX_RLS", 0)
+        self.CBX_NMS[pos] = self.createCombo("CBX_NMS", 1)
+        self.BTN_ATVS[pos] = self.createButton("BTN_ATVS", self.TTIP_BTN_ATVS, 25)
+        self.BTN_INSS[pos] = self.createButton("BTN_INSS", self.TTIP_BTN_INSS, 26)
+        self.BTN_REMS[pos] = self.createButton("BTN_REMS", self.TTIP_BTN_REMS, 25)
 
         ## Finally adds those widgets into vertical layouts
         UIA.LYT_ROLES.insertWidget(pos, self.CBX_RLS[pos])
@@ -1535,66 +1500,90 @@ class Fields(object):
         UIA.LYT_CLEAR.insertWidget(pos, self.BTN_REMS[pos])
         UIA.LYT_INSRT.insertWidget(pos, self.BTN_INSS[pos])
 
-        self.refreshStates()
+        if refresh: self.refreshStates()
     
 
+    def createCombo(self, name:str, s:int):
+        """
+        Creates one field combo box sharing the item model of category `s` (0 - Roles, 1 - Names)
+        """
+        CBX = QCBX_FIELD(UIA.WGT_CENTRAL); CBX.setObjectName(name)
+        CBX.setMinimumWidth(140); CBX.setMaximumWidth(200)
+        CBX.setEditable(True)
+        CBX.setModel(self.MODELS[s])
+
+        COMPLETER = QtWidgets.QCompleter(self.SORTED_MODELS[s], CBX)                            ## Prefix matches on a sorted model are binary searched instead of scanned
+        COMPLETER.setCaseSensitivity(Qt.CaseInsensitive)
+        COMPLETER.setModelSorting(QtWidgets.QCompleter.CaseInsensitivelySortedModel)
+        COMPLETER.setCompletionMode(QtWidgets.QCompleter.InlineCompletion)                      ## Same inline behavior as the default combo box completer
+        CBX.setCompleter(COMPLETER)                                                             ## Set after setModel, which would otherwise replace the completer's model
+        CBX.setCurrentText('')
+        CBX.setMaxVisibleItems(self.MAX_VISIBLE_ITEMS)
+        CBX.wheelEvent = self.ignoreWheel
+        return CBX
+
+
+    def createButton(self, name:str, tooltip:str, width:int):
+        """
+        Creates one field operator button (active, insert, remove)
+        """
+        BTN = QPushButton(UIA.WGT_CENTRAL); BTN.setObjectName(name)
+        BTN.setMaximumWidth(width); BTN.setMinimumHeight(30)
+        BTN.setToolTip(tooltip)
+        BTN.setFocusPolicy(Qt.ClickFocus)
+        return BTN
+
+
     def addFields(self, fields:int=2):
         """
         Allows to add more field(s) using 2nd argument and redirects to `insertField` method
         """
-        for i in range(fields): self.insertField(i)
+        for i in range(fields): self.insertField(i, False)
+        self.refreshStates()                                                                    ## Reconnects every field once after the whole batch
 
 
-    def removeField(self):
+    def removeField(self, i:int):
         """
         Removes a specific field by unlinking the widget from
         the layout and deleting its widgets from memory.
         """
-        for i, btn in enumerate(self.BTN_REMS):
-            if not btn.hasFocus(): continue
-            if btn.objectName() != "BTN_REMS": return
-
-            UIA.LYT_ROLES.removeWidget(self.CBX_RLS[i])
-            UIA.LYT_NAMES.removeWidget(self.CBX_NMS[i])
-            UIA.LYT_INSRT.removeWidget(self.BTN_ATVS[i])
-            UIA.LYT_INSRT.removeWidget(self.BTN_INSS[i])
-            UIA.LYT_CLEAR.removeWidget(self.BTN_REMS[i])
-
-            del self.CBX_RLS[i]
-            del self.CBX_NMS[i]
-            del self.BTN_REMS[i]
-            del self.BTN_INSS[i]
-            del self.BTN_ATVS[i]
-            self.FIELDS -= 1
-            self.refreshStates()
-            gc.collect()
-
-            ## Reset window to shortest possible to remove spaces left by the field.
-            UIA.resize(UIA.size().width(), 0)   
-            break
-    
+        if self.BTN_REMS[i].objectName() != "BTN_REMS": return
+
+        UIA.LYT_ROLES.removeWidget(self.CBX_RLS[i])
+        UIA.LYT_NAMES.removeWidget(self.CBX_NMS[i])
+        UIA.LYT_ACTIV.removeWidget(self.BTN_ATVS[i])
+        UIA.LYT_INSRT.removeWidget(self.BTN_INSS[i])
+        UIA.LYT_CLEAR.removeWidget(self.BTN_REMS[i])
+
+        for WIDGETS in (self.CBX_RLS, self.CBX_NMS, self.BTN_REMS, self.BTN_INSS, self.BTN_ATVS):
+            WIDGETS.pop(i).deleteLater()                                                ## Widgets are owned by WGT_CENTRAL, so Qt has to free them, not the Python GC
+        self.FIELDS -= 1
+        self.refreshStates()
+
+        ## Reset window to shortest possible to remove spaces left by the field.
+        UIA.resize(UIA.size().width(), 0)   
 
-    def lockUnlockField(self):
+
+    def lockUnlockField(self, i:int):
         """
         Handles lock and unlock mechanism of the field selected
         """
-        for i, btn in enumerate(self.BTN_REMS):
-            if not btn.hasFocus(): continue
-            if btn.objectName() == "BTN_REMS":                                          ## Lock
-                btn.setObjectName("BTN_REMS_LOCKED")
-                btn.setStyleSheet(QSS.getStylesheet())
-                btn.setToolTip(self.TTIP_BTN_REMS_LOCKED)
-                self.CBX_RLS[i].setEnabled(False)
-                self.CBX_NMS[i].setEnabled(False)
-            else:                                                                       ## Unlock
-                btn.setObjectName("BTN_REMS")
-                btn.setStyleSheet(QSS.getStylesheet())
-                btn.setToolTip(self.TTIP_BTN_REMS)
-                self.CBX_RLS[i].setEnabled(True)
-                self.CBX_NMS[i].setEnabled(True)
+        btn = self.BTN_REMS[i]
+        if btn.objectName() == "BTN_REMS":                                              ## Lock
+            btn.setObjectName("BTN_REMS_LOCKED")
+            btn.setToolTip(self.TTIP_BTN_REMS_LOCKED)
+            self.CBX_RLS[i].setEnabled(False)
+            self.CBX_NMS[i].setEnabled(False)
+        else:                                                                           ## Unlock
+            btn.setObjectName("BTN_REMS")
+            btn.setToolTip(self.TTIP_BTN_REMS)
+            self.CBX_RLS[i].setEnabled(True)
+            self.CBX_NMS[i].setEnabled(True)
+
+        QSS.repolish(btn)                                                               ## Re-matches the app stylesheet against the new object name
 
 
-    def mouseReleased(self, button, event):
+    def mouseReleased(self, button, i:int, event):
         """
         Overrides default mouse release events for BTN_INSS and BTN_REMS
         Handles mouse-related events from field buttons such as:
@@ -1605,50 +1594,47 @@ class Fields(object):
         ## Insert Button
         if button == 'INSS':
             if event.button() == Qt.LeftButton:
-                self.redirectFieldInsertion()
+                self.redirectFieldInsertion(i)
             elif event.button() == Qt.RightButton:
-                self.redirectFieldInsertion(True)
+                self.redirectFieldInsertion(i, True)
 
         ## Remove Button
         elif button == 'REMS':
             if event.button() == Qt.LeftButton:
-                self.removeField()
+                self.removeField(i)
             elif event.button() == Qt.RightButton:
-                self.lockUnlockField()
+                self.lockUnlockField(i)
 
 
     def ignoreWheel(self, event):
         pass
     
 
-    def recordCbx(self, cbx):
+    def recordCbx(self, s:int, i:int, text=''):
         """
         Overrides TextChanged event of combo boxes 
 
         Records the CBX object to help identifying the last
-        combo box user used for editing fields
+        combo box user used for editing fields.
+        `s` is the category (0 - Roles, 1 - Names) and `i` the field index, bound on connection.
         
         PREV_CBX = (Category, Index Pos, Current Index Pos, Current Text)
         """
         if self.LOADING: return
 
-        if cbx == 'RLS':
-            for i, cbx in enumerate(self.CBX_RLS):
-                if not cbx.hasFocus(): continue
-                if cbx.currentText() == self.SEPARATOR:                                                             ## Helps preventing to display the separator
-                    cbx.setCurrentIndex(cbx.currentIndex()+ (1 if self.PREV_CBX[2] < cbx.currentIndex() else -1))
-                    return
-                self.PREV_CBX = (0, i, cbx.currentIndex(), cbx.itemText(cbx.currentIndex()))
-                break
-                
-        elif cbx == 'NMS':
-            for i, cbx in enumerate(self.CBX_NMS):
-                if not cbx.hasFocus(): continue
-                if cbx.currentText() == self.SEPARATOR:
-                    cbx.setCurrentIndex(cbx.currentIndex()+ (1 if self.PREV_CBX[2] < cbx.currentIndex() else -1))
-                    return
-                self.PREV_CBX = (1, i, cbx.currentIndex(), cbx.itemText(cbx.currentIndex()))
-                break
+        cbx = (self.CBX_RLS, self.CBX_NMS)[s][i]
+        if not cbx.hasFocus(): return                                                                           ## Only the combo box being edited by the user is recorded
+        if cbx.currentText() == self.SEPARATOR:                                                                 ## Helps preventing to display the separator
+            cbx.setCurrentIndex(cbx.currentIndex()+ (1 if self.PREV_CBX[2] < cbx.currentIndex() else -1))
+            return
+        self.PREV_CBX = (s, i, cbx.currentIndex(), cbx.itemText(cbx.currentIndex()))
+
+
+    def clearFieldData(self, text=''):
+        """
+        Drops the cached field texts so `getFieldData` reads them again
+        """
+        self.FIELD_DATA = None
 
 
     def getFieldData(self, merge=False):
@@ -1656,13 +1642,15 @@ class Fields(object):
         Returns 2 lists, and a dictionary of all fields' data
         Used for when exporting to a file (Powerpoint, plain text)
         """
-        ROLES = [role.currentText() for role in self.CBX_RLS]
-        NAMES = [name.currentText() for name in self.CBX_NMS]
+        if self.FIELD_DATA is None:
+            self.FIELD_DATA = ([role.currentText() for role in self.CBX_RLS],
+                    [name.currentText() for name in self.CBX_NMS])
+        ROLES, NAMES = list(self.FIELD_DATA[0]), list(self.FIELD_DATA[1])                       ## Copies, since callers extend and store them
         DICT = {i:[k,v] for i, (k,v) in enumerate(zip(ROLES, NAMES))}
 
-        if merge:
-            ROLES += [i for i in RLS if i not in ROLES]
-            NAMES += [i for i in NMS if i not in NAMES]
+        if merge:                                                                               ## Pool entries not present in any field are appended in pool order
+            PRESENT = set(ROLES); ROLES += [i for i in RLS if i not in PRESENT]
+            PRESENT = set(NAMES); NAMES += [i for i in NMS if i not in PRESENT]
         
         return ROLES, NAMES, DICT
 
@@ -1672,10 +1660,36 @@ class Fields(object):
         Handles forwarded KeyPressEvent from UIA for field switching via Enter|Return key
         """
         TGT = self.CBX_NMS if self.PREV_CBX[0] else self.CBX_RLS
-        for i, cbx in enumerate(TGT):
-            if not cbx.hasFocus(): continue
-            TGT[i+c if i+c != len(TGT) else 0].setFocus()
-            break
+        FOCUSED = QApplication.focusWidget()
+        if isinstance(FOCUSED, QLineEdit): FOCUSED = FOCUSED.parent()                          ## Editable combo boxes pass their focus to their line edit
+        i = self.CBX_INDEX.get(id(FOCUSED))
+        if i is None or TGT[i] is not FOCUSED: return
+        TGT[i+c if i+c != len(TGT) else 0].setFocus()
+
+
+
+
+class QRUN_SAVE(QtCore.QRunnable):
+    """
+    Saves a presentation from a pooled thread and reports back through `SIGNALS.done`,
+    which is delivered on the GUI thread
+    """
+    class Signals(QtCore.QObject):
+        done = QtCore.pyqtSignal(object)                                                        ## None on success, otherwise the raised exception
+
+    def __init__(self, prs, path:str):
+        super().__init__()
+        self.PRS, self.PATH = prs, path
+        self.SIGNALS = self.Signals()
+
+
+    def run(self):
+        try:
+            self.PRS.save(self.PATH)
+        except Exception as e:
+            self.SIGNALS.done.emit(e)
+        else:
+            self.SIGNALS.done.emit(None)
 
 
 
@@ -1685,7 +1699,11 @@ class Export(object):
     Handles exporting related functions.
     """
     def __init__(self):
-        pass
+        self.SAVING = None                                                                      ## Runnable of the last background save, kept so its signal object outlives the delivery
+        self.BUSY = False                                                                       ## True while a presentation is being saved
+        self.START = 0                                                                          ## Time the last Powerpoint export started
+        self.EXPORTED_POOL = None                                                               ## (Roles, Names) of the presentation being saved
+        self.LAST_ACTIVE = None                                                                 ## (Role, Name) last written by fromActiveField
 
     
     def fromActiveField(self, i, clear=False):
@@ -1694,12 +1712,15 @@ class Export(object):
         """
         if clear: R, N = '', ''
         else: R, N = FLD.CBX_RLS[i].currentText(), FLD.CBX_NMS[i].currentText() 
+        if (R, N) == self.LAST_ACTIVE: return                                                   ## Files already hold these values
 
         try:
             with open(f"{SYS.DIR_PROGRAM}/Role.txt", "w") as f: f.write(R)
             with open(f"{SYS.DIR_PROGRAM}/Name.txt", "w") as f: f.write(N)
+            self.LAST_ACTIVE = (R, N)
             # if not clear: LOG.info(f"Active field exported: {R} - {N}")
         except Exception as e:
+            self.LAST_ACTIVE = None                                                             ## Files may be half written, so the next call writes both again
             LOG.error(e)
             
 
@@ -1713,10 +1734,14 @@ class Export(object):
         DIR_TGT = QFileDialog.getExistingDirectory(None, "Select Folder", PKG.DIR_EXPORT_RECENT)
         if DIR_TGT:
             LOG.info(f"Saving file to {DIR_TGT}")
+            FILES = (
+                ("Roles.txt", '\n'.join(RLS)),
+                ("Names.txt", '\n'.join(NMS)),
+                ("Participants.txt", '\n'.join(f"{r}: {n}" for r, n in zip(RLS, NMS))),
+                )
             try:
-                with open(f"{DIR_TGT}/Roles.txt", "w") as f: f.write('\n'.join(RLS))
-                with open(f"{DIR_TGT}/Names.txt", "w") as f: f.write('\n'.join(NMS))
-                with open(f"{DIR_TGT}/Participants.txt", "w") as f: f.write('\n'.join([f"{r}: {n}" for r,n in zip(RLS,NMS)]))
+                for NAME, TEXT in FILES:
+                    with open(f"{DIR_TGT}/{NAME}", "w") as f: f.write(TEXT)
             except Exception as e:
                 LOG.error(e)
             
@@ -1737,12 +1762,55 @@ class Export(object):
         """
         Export data to a Powerpoint file
         """
+        from pptx import Presentation                                                           ## Imported on first export to keep the startup light
+        from pptx.util import Inches, Cm, Pt
+        from pptx.enum.text import PP_ALIGN
+        from pptx.dml.color import RGBColor
+
         # class PresBlueprint(self)
         def moveSlide(presentation, old_index, new_index):
             xml_slides = presentation.slides._sldIdLst  # pylint: disable=W0212
             slides = list(xml_slides)
             xml_slides.remove(slides[old_index])
             xml_slides.insert(new_index, slides[old_index])
+
+        def addSlide(self):
+            """
+            Adds a blank slide covered by the background image
+            """
+            SLIDE = self.PRS.slides.add_slide(self.PRS.slide_layouts[6])
+            SLIDE.shapes.add_picture(PKG.IMG_BACKGROUND, 0, 0, self.PRS.slide_width, self.PRS.slide_height) # Left-Top-Width-Height
+            return SLIDE
+
+        def addText(slide, box, text, size, rgb, alignment, font, italic=False):
+            """
+            Adds a textbox at `box` (Left-Top-Width-Height) holding a single styled paragraph
+            """
+            PARA = slide.shapes.add_textbox(*box).text_frame.paragraphs[0]
+            PARA.text = text
+            PARA.font.size = size
+            PARA.font.color.rgb = RGBColor(*rgb)
+            PARA.alignment = alignment
+            PARA.font.name = font
+            if italic: PARA.font.italic = True
+
+        def addHeader(self, slide, title):
+            """
+            Adds the title, subtitle and date shared by every main slide
+            """
+            WIDTH = self.PRS.slide_width
+            addText(slide, (0, Cm(1), WIDTH, Cm(4)), title, Pt(PKG.FSZ_TITLE), PKG.RGB_TITLE, PP_ALIGN.CENTER, PKG.FONT_TITLE, True)
+            addText(slide, (0, Cm(3), WIDTH, Cm(4)), PKG.TXT_SUBTITLE, Pt(PKG.FSZ_SUBTITLE), PKG.RGB_SUBTITLE, PP_ALIGN.CENTER, PKG.FONT_SUBTITLE)
+            if PKG.PRES_DISPDATE== True:
+                addText(slide, (0, Cm(4.2), WIDTH, Cm(4)), f"——— {datetime.datetime.now().strftime('%B %d, %Y')} ———",
+                        Pt(PKG.FSZ_DATE), PKG.RGB_DATE, PP_ALIGN.CENTER, PKG.FONT_DATE)
+
+        def addColumns(slide, roles, names, size, boxes):
+            """
+            Adds the right-aligned roles and the left-aligned names textboxes
+            """
+            addText(slide, boxes[0], roles, size, PKG.RGB_ROLES, PP_ALIGN.RIGHT, PKG.FONT_CONTENT, True)
+            addText(slide, boxes[1], names, size, PKG.RGB_NAMES, PP_ALIGN.LEFT, PKG.FONT_CONTENT)
         
         def splitDivine(self):
             """
@@ -1751,74 +1819,18 @@ class Export(object):
             """
             ## Service-based Splitter
             RLS, NMS, DCT = FLD.getFieldData()
-            SPLITTED = CORE.splitContents('\n'.join([f"{r}:" for r in RLS]), '\n'.join(NMS))
+            SPLITTED = CORE.splitContents([f"{r}:" for r in RLS], NMS)
             ID = [0,1], [2,3]
             TITLES = ['Sabbath School Participants', 'Divine Service Participants']
 
             for i in range(2):
-                SLD_MAIN = self.PRS.slides.add_slide(self.PRS.slide_layouts[6])
-                SLD_MAIN.shapes.add_picture(PKG.IMG_BACKGROUND, 0, 0, self.PRS.slide_width, self.PRS.slide_height) # Left-Top-Width-Height
-
-                ## Textboxes
-                ## Title
-                TBX_TITLE = SLD_MAIN.shapes.add_textbox(0, Cm(1), self.PRS.slide_width, Cm(4))
-                FRM_TITLE = TBX_TITLE.text_frame
-
-                PARA_TITLE = FRM_TITLE.paragraphs[0]
-                PARA_TITLE.text = TITLES[i]
-                PARA_TITLE.font.size = PKG.FSZ_TITLE
-                PARA_TITLE.font.color.rgb = PKG.RGB_TITLE
-                PARA_TITLE.alignment = PP_ALIGN.CENTER
-                PARA_TITLE.font.name = PKG.FONT_TITLE
-                PARA_TITLE.font.italic = True
-
-                ## Subtitle
-                TBX_SUBTITLE = SLD_MAIN.shapes.add_textbox(0, Cm(3), self.PRS.slide_width, Cm(4))
-                FRM_SUBTITLE = TBX_SUBTITLE.text_frame
-                PARA_SUBTITLE = FRM_SUBTITLE.paragraphs[0]
-                PARA_SUBTITLE.text = PKG.TXT_SUBTITLE
-                PARA_SUBTITLE.font.size = PKG.FSZ_SUBTITLE
-                PARA_SUBTITLE.font.color.rgb = PKG.RGB_SUBTITLE
-                PARA_SUBTITLE.alignment = PP_ALIGN.CENTER
-                PARA_SUBTITLE.font.name = PKG.FONT_SUBTITLE
-
-                ## Date
-                if PKG.PRES_DISPDATE== True:
-                    TBX_DATE = SLD_MAIN.shapes.add_textbox(0, Cm(4.2), self.PRS.slide_width, Cm(4))
-                    FRM_DATE = TBX_DATE.text_frame
-                    PARA_DATE = FRM_DATE.paragraphs[0]
-                    PARA_DATE.text = f"——— {datetime.datetime.now().strftime('%B %d, %Y')} ———"
-                    PARA_DATE.font.size = PKG.FSZ_DATE
-                    PARA_DATE.font.color.rgb = PKG.RGB_DATE
-                    PARA_DATE.alignment = PP_ALIGN.CENTER
-                    PARA_DATE.font.name = PKG.FONT_DATE
+                SLD_MAIN = addSlide(self)
+                addHeader(self, SLD_MAIN, TITLES[i])
 
                 ## Paragraph
                 left, top, width, height = 0, Cm(5.4), int(self.PRS.slide_width / 2), int(self.PRS.slide_height) - Cm(2)
-                PARA_FNTSZ = Pt(39-len(SPLITTED[ID[i][0]]))
-
-                ## Roles
-                TBX_ROLES = SLD_MAIN.shapes.add_textbox(left, top, width, height)
-                FRM_ROLES = TBX_ROLES.text_frame
-
-                PARA_RLS = FRM_ROLES.paragraphs[0]
-                PARA_RLS.text = '\n'.join(SPLITTED[ID[i][0]])
-                PARA_RLS.font.size = PARA_FNTSZ
-                PARA_RLS.font.color.rgb = PKG.RGB_ROLES
-                PARA_RLS.alignment = PP_ALIGN.RIGHT
-                PARA_RLS.font.name = PKG.FONT_CONTENT
-                PARA_RLS.font.italic = True
-
-                ## Names
-                TBX_NAMES = SLD_MAIN.shapes.add_textbox(int(self.PRS.slide_width / 2), top, width, height)
-                FRM_NAMES = TBX_NAMES.text_frame
-
-                PARA_NMS = FRM_NAMES.paragraphs[0]
-                PARA_NMS.text = '\n'.join(SPLITTED[ID[i][1]])
-                PARA_NMS.font.size = PARA_FNTSZ
-                PARA_NMS.font.color.rgb = PKG.RGB_NAMES
-                PARA_NMS.alignment = PP_ALIGN.LEFT
-                PARA_NMS.font.name = PKG.FONT_CONTENT
+                addColumns(SLD_MAIN, '\n'.join(SPLITTED[ID[i][0]]), '\n'.join(SPLITTED[ID[i][1]]), Pt(39-len(SPLITTED[ID[i][0]])),
+                        ((left, top, width, height), (int(self.PRS.slide_width / 2), top, width, height)))
 
 
 
@@ -1829,31 +1841,15 @@ class Export(object):
             ## Roles
             RLS, NMS, DCT = FLD.getFieldData()
             for i, (r, n) in enumerate(zip(RLS, NMS)):
-                SLD_SUB = self.PRS.slides.add_slide(self.PRS.slide_layouts[6])
-                SLD_SUB.shapes.add_picture(PKG.IMG_BACKGROUND, 0, 0, self.PRS.slide_width, self.PRS.slide_height) # Left-Top-Width-Height
+                SLD_SUB = addSlide(self)
 
                 ## Sub - Name
-                TBX_NAME = SLD_SUB.shapes.add_textbox(0, Inches(3.5), self.PRS.slide_width, self.PRS.slide_height)
-                FRM_NAME = TBX_NAME.text_frame
-
-                PARA_NAME = FRM_NAME.paragraphs[0]
-                PARA_NAME.text = NMS[i]
-                PARA_NAME.font.size = Pt(72-(len(NMS[i])/1.8))
-                PARA_NAME.font.color.rgb = PKG.RGB_NAMES
-                PARA_NAME.alignment = PP_ALIGN.CENTER
-                PARA_NAME.font.name = PKG.FONT_CONTENT
+                addText(SLD_SUB, (0, Inches(3.5), self.PRS.slide_width, self.PRS.slide_height), NMS[i],
+                        Pt(72-(len(NMS[i])/1.8)), PKG.RGB_NAMES, PP_ALIGN.CENTER, PKG.FONT_CONTENT)
 
                 ## Sub - Role
-                TBX_ROLE = SLD_SUB.shapes.add_textbox(0, Inches(4.6), self.PRS.slide_width, self.PRS.slide_height)
-                FRM_ROLE = TBX_ROLE.text_frame
-
-                PARA_ROLE = FRM_ROLE.paragraphs[0]
-                PARA_ROLE.text = RLS[i]
-                PARA_ROLE.font.size = Pt(40)
-                PARA_ROLE.font.color.rgb = PKG.RGB_SUBTITLE
-                PARA_ROLE.alignment = PP_ALIGN.CENTER
-                PARA_ROLE.font.name = PKG.FONT_CONTENT
-                PARA_ROLE.font.italic = True
+                addText(SLD_SUB, (0, Inches(4.6), self.PRS.slide_width, self.PRS.slide_height), RLS[i],
+                        Pt(40), PKG.RGB_SUBTITLE, PP_ALIGN.CENTER, PKG.FONT_CONTENT, True)
             return
 
 
@@ -1868,75 +1864,18 @@ class Export(object):
                 generatePerSlide(self)
                 
                 RLS, NMS, DCT = FLD.getFieldData()
-                SPLITTED = CORE.splitContents('\n'.join([f"{r}:" for r in RLS]), '\n'.join(NMS))
+                SPLITTED = CORE.splitContents([f"{r}:" for r in RLS], NMS)
 
                 moveSlide(self.PRS, 1, len(SPLITTED[0])+1)
                 return
 
-            SLD_MAIN = self.PRS.slides.add_slide(self.PRS.slide_layouts[6])
-            SLD_MAIN.shapes.add_picture(PKG.IMG_BACKGROUND, 0, 0, self.PRS.slide_width, self.PRS.slide_height) # Left-Top-Width-Height
-
-            ## Textboxes
-            ## Title
-            TBX_TITLE = SLD_MAIN.shapes.add_textbox(0, Cm(1), self.PRS.slide_width, Cm(4))
-            FRM_TITLE = TBX_TITLE.text_frame
-
-            PARA_TITLE = FRM_TITLE.paragraphs[0]
-            PARA_TITLE.text = PKG.TXT_TITLE
-            PARA_TITLE.font.size = PKG.FSZ_TITLE
-            PARA_TITLE.font.color.rgb = PKG.RGB_TITLE
-            PARA_TITLE.alignment = PP_ALIGN.CENTER
-            PARA_TITLE.font.name = PKG.FONT_TITLE
-            PARA_TITLE.font.italic = True
-
-            ## Subtitle
-            TBX_SUBTITLE = SLD_MAIN.shapes.add_textbox(0, Cm(3), self.PRS.slide_width, Cm(4))
-            FRM_SUBTITLE = TBX_SUBTITLE.text_frame
-            PARA_SUBTITLE = FRM_SUBTITLE.paragraphs[0]
-            PARA_SUBTITLE.text = PKG.TXT_SUBTITLE
-            PARA_SUBTITLE.font.size = PKG.FSZ_SUBTITLE
-            PARA_SUBTITLE.font.color.rgb = PKG.RGB_SUBTITLE
-            PARA_SUBTITLE.alignment = PP_ALIGN.CENTER
-            PARA_SUBTITLE.font.name = PKG.FONT_SUBTITLE
-
-            ## Date
-            if PKG.PRES_DISPDATE== True:
-                TBX_DATE = SLD_MAIN.shapes.add_textbox(0, Cm(4.2), self.PRS.slide_width, Cm(4))
-                FRM_DATE = TBX_DATE.text_frame
-                PARA_DATE = FRM_DATE.paragraphs[0]
-                PARA_DATE.text = f"——— {datetime.datetime.now().strftime('%B %d, %Y')} ———"
-                PARA_DATE.font.size = PKG.FSZ_DATE
-                PARA_DATE.font.color.rgb = PKG.RGB_DATE
-                PARA_DATE.alignment = PP_ALIGN.CENTER
-                PARA_DATE.font.name = PKG.FONT_DATE
-
+            SLD_MAIN = addSlide(self)
+            addHeader(self, SLD_MAIN, PKG.TXT_TITLE)
 
             ## Paragraph
             left, top, width, height = 0, Cm(5.4), int(self.PRS.slide_width / 2), int(self.PRS.slide_height) - Cm(2)
-            PARA_FNTSZ = Pt(39-FLD.FIELDS)
-
-            ## Roles
-            TBX_ROLES = SLD_MAIN.shapes.add_textbox(left, top, width, height)
-            FRM_ROLES = TBX_ROLES.text_frame
-
-            PARA_RLS = FRM_ROLES.paragraphs[0]
-            PARA_RLS.text = '\n'.join([f"{r}:" for r in RLS])
-            PARA_RLS.font.size = PARA_FNTSZ
-            PARA_RLS.font.color.rgb = PKG.RGB_ROLES
-            PARA_RLS.alignment = PP_ALIGN.RIGHT
-            PARA_RLS.font.name = PKG.FONT_CONTENT
-            PARA_RLS.font.italic = True
-
-            ## Names
-            TBX_NAMES = SLD_MAIN.shapes.add_textbox(int(self.PRS.slide_width / 2), top, width, height)
-            FRM_NAMES = TBX_NAMES.text_frame
-
-            PARA_NMS = FRM_NAMES.paragraphs[0]
-            PARA_NMS.text = '\n'.join(NMS)
-            PARA_NMS.font.size = PARA_FNTSZ
-            PARA_NMS.font.color.rgb = PKG.RGB_NAMES
-            PARA_NMS.alignment = PP_ALIGN.LEFT
-            PARA_NMS.font.name = PKG.FONT_CONTENT
+            addColumns(SLD_MAIN, '\n'.join([f"{r}:" for r in RLS]), '\n'.join(NMS), Pt(39-FLD.FIELDS),
+                    ((left, top, width, height), (int(self.PRS.slide_width / 2), top, width, height)))
 
             generatePerSlide(self)
 
@@ -1948,120 +1887,29 @@ class Export(object):
             ## 16:9 Ratio
             self.PRS.slide_width, self.PRS.slide_height = Inches(16), Inches(9)
 
-            SLD_MAIN = self.PRS.slides.add_slide(self.PRS.slide_layouts[6])
-            SLD_MAIN.shapes.add_picture(PKG.IMG_BACKGROUND, 0, 0, self.PRS.slide_width, self.PRS.slide_height) # Left-Top-Width-Height
-
-            ## Textboxes
-            ## Title
-            TBX_TITLE = SLD_MAIN.shapes.add_textbox(0, Cm(1), self.PRS.slide_width, Cm(4))
-            FRM_TITLE = TBX_TITLE.text_frame
-
-            PARA_TITLE = FRM_TITLE.paragraphs[0]
-            PARA_TITLE.text = PKG.TXT_TITLE
-            PARA_TITLE.font.size = PKG.FSZ_TITLE
-            PARA_TITLE.font.color.rgb = PKG.RGB_TITLE
-            PARA_TITLE.alignment = PP_ALIGN.CENTER
-            PARA_TITLE.font.name = PKG.FONT_TITLE
-            PARA_TITLE.font.italic = True
-
-            ## Subtitle
-            TBX_SUBTITLE = SLD_MAIN.shapes.add_textbox(0, Cm(3), self.PRS.slide_width, Cm(4))
-            FRM_SUBTITLE = TBX_SUBTITLE.text_frame
-            PARA_SUBTITLE = FRM_SUBTITLE.paragraphs[0]
-            PARA_SUBTITLE.text = PKG.TXT_SUBTITLE
-            PARA_SUBTITLE.font.size = PKG.FSZ_SUBTITLE
-            PARA_SUBTITLE.font.color.rgb = PKG.RGB_SUBTITLE
-            PARA_SUBTITLE.alignment = PP_ALIGN.CENTER
-            PARA_SUBTITLE.font.name = PKG.FONT_SUBTITLE
-
-            ## Sabbath School Text
-            TBX_SUBTITLE = SLD_MAIN.shapes.add_textbox(Inches(4), Inches(3), self.PRS.slide_width, Cm(4))
-            FRM_SUBTITLE = TBX_SUBTITLE.text_frame
-            PARA_SUBTITLE = FRM_SUBTITLE.paragraphs[0]
-            PARA_SUBTITLE.text = "Sabbath School"
-            PARA_SUBTITLE.font.size = Pt(40)
-            PARA_SUBTITLE.font.color.rgb = PKG.RGB_SUBTITLE
-            PARA_SUBTITLE.alignment = PP_ALIGN.CENTER
-            PARA_SUBTITLE.font.name = PKG.FONT_SUBTITLE
-
-            ## Divine Service Text
-            TBX_SUBTITLE = SLD_MAIN.shapes.add_textbox(Inches(1.25), Inches(6.5), Inches(4), Inches(2))
-            FRM_SUBTITLE = TBX_SUBTITLE.text_frame
-            PARA_SUBTITLE = FRM_SUBTITLE.paragraphs[0]
-            PARA_SUBTITLE.text = "Divine Service"
-            PARA_SUBTITLE.font.size = Pt(40)
-            PARA_SUBTITLE.font.color.rgb = PKG.RGB_SUBTITLE
-            PARA_SUBTITLE.alignment = PP_ALIGN.CENTER
-            PARA_SUBTITLE.font.name = PKG.FONT_SUBTITLE
-
-
-            ## Date
-            if PKG.PRES_DISPDATE== True:
-                TBX_DATE = SLD_MAIN.shapes.add_textbox(0, Cm(4.2), self.PRS.slide_width, Cm(4))
-                FRM_DATE = TBX_DATE.text_frame
-                PARA_DATE = FRM_DATE.paragraphs[0]
-                PARA_DATE.text = f"——— {datetime.datetime.now().strftime('%B %d, %Y')} ———"
-                PARA_DATE.font.size = PKG.FSZ_DATE
-                PARA_DATE.font.color.rgb = PKG.RGB_DATE
-                PARA_DATE.alignment = PP_ALIGN.CENTER
-                PARA_DATE.font.name = PKG.FONT_DATE
+            SLD_MAIN = addSlide(self)
+            addHeader(self, SLD_MAIN, PKG.TXT_TITLE)
 
+            ## Sabbath School and Divine Service Text
+            addText(SLD_MAIN, (Inches(4), Inches(3), self.PRS.slide_width, Cm(4)), "Sabbath School",
+                    Pt(40), PKG.RGB_SUBTITLE, PP_ALIGN.CENTER, PKG.FONT_SUBTITLE)
+            addText(SLD_MAIN, (Inches(1.25), Inches(6.5), Inches(4), Inches(2)), "Divine Service",
+                    Pt(40), PKG.RGB_SUBTITLE, PP_ALIGN.CENTER, PKG.FONT_SUBTITLE)
 
             ## Paragraph
             left, top, width, height = 0, Cm(5.4), int(self.PRS.slide_width/2), int(self.PRS.slide_height) - Cm(2)
             PARA_FNTSZ = Pt(38-FLD.FIELDS)
 
             ## Service-based Splitter
-            TXT_ROLES = '\n'.join([f"{r}:" for r in RLS])
-            TXT_NAMES = '\n'.join(NMS)
-            SPLITTED = CORE.splitContents(TXT_ROLES, TXT_NAMES)
+            SPLITTED = CORE.splitContents([f"{r}:" for r in RLS], NMS)
             
             ## Sabbath School
-            TBX_ROLES = SLD_MAIN.shapes.add_textbox(0, top, width/2.2, height)
-            TBX_NAMES = SLD_MAIN.shapes.add_textbox(width/2.2, top, width/2.2, height)
-            FRM_ROLES = TBX_ROLES.text_frame
-            FRM_NAMES = TBX_NAMES.text_frame
-
-            ## Roles
-            PARA_RLS = FRM_ROLES.paragraphs[0]
-            PARA_RLS.text = '\n'.join(SPLITTED[0])
-            PARA_RLS.font.size = PARA_FNTSZ
-            PARA_RLS.font.color.rgb = PKG.RGB_ROLES
-            PARA_RLS.alignment = PP_ALIGN.RIGHT
-            PARA_RLS.font.name = PKG.FONT_CONTENT
-            PARA_RLS.font.italic = True
-
-            ## Names
-            PARA_NMS = FRM_NAMES.paragraphs[0]
-            PARA_NMS.text = '\n'.join(SPLITTED[1])
-            PARA_NMS.font.size = PARA_FNTSZ
-            PARA_NMS.font.color.rgb = PKG.RGB_NAMES
-            PARA_NMS.alignment = PP_ALIGN.LEFT
-            PARA_NMS.font.name = PKG.FONT_CONTENT
-            
+            addColumns(SLD_MAIN, '\n'.join(SPLITTED[0]), '\n'.join(SPLITTED[1]), PARA_FNTSZ,
+                    ((0, top, width/2.2, height), (width/2.2, top, width/2.2, height)))
 
             ## Divine Worship
-            ## Roles
-            TBX_ROLES = SLD_MAIN.shapes.add_textbox(Inches(7.25), Inches(5.5), width/2.2, height)
-            TBX_NAMES = SLD_MAIN.shapes.add_textbox(Inches(10.9), Inches(5.5), width/2.2, height)
-            FRM_ROLES = TBX_ROLES.text_frame
-            FRM_NAMES = TBX_NAMES.text_frame
-
-            PARA_RLS = FRM_ROLES.paragraphs[0]
-            PARA_RLS.text = '\n'.join(SPLITTED[2])
-            PARA_RLS.font.size = PARA_FNTSZ
-            PARA_RLS.font.color.rgb = PKG.RGB_ROLES
-            PARA_RLS.alignment = PP_ALIGN.RIGHT
-            PARA_RLS.font.name = PKG.FONT_CONTENT
-            PARA_RLS.font.italic = True
-
-            ## Names
-            PARA_NMS = FRM_NAMES.paragraphs[0]
-            PARA_NMS.text = '\n'.join(SPLITTED[3])
-            PARA_NMS.font.size = PARA_FNTSZ
-            PARA_NMS.font.color.rgb = PKG.RGB_NAMES
-            PARA_NMS.alignment = PP_ALIGN.LEFT
-            PARA_NMS.font.name = PKG.FONT_CONTENT
+            addColumns(SLD_MAIN, '\n'.join(SPLITTED[2]), '\n'.join(SPLITTED[3]), PARA_FNTSZ,
+                    ((Inches(7.25), Inches(5.5), width/2.2, height), (Inches(10.9), Inches(5.5), width/2.2, height)))
             generatePerSlide(self)
         
 
@@ -2094,12 +1942,26 @@ class Export(object):
         #         return
         
 
-        START = time.time()
+        if self.BUSY: return                                                                    ## Previous export is still being written
+        self.START = time.time()
         LOG.info("Generating Powerpoint")
         doubleColumns(self) if FLD.FIELDS > FLD.FIELDS_MAX/1.10 else singleColumn(self)            
 
+        self.BUSY = True
+        self.EXPORTED_POOL = FLD.getFieldData(True)[:2]                                         ## Fields stay editable while saving, so the pool is taken now
+        self.SAVING = QRUN_SAVE(self.PRS, SYS.FILE_PPT_EXPORTED)
+        self.SAVING.SIGNALS.done.connect(self.savedPowerpoint)
+        QtCore.QThreadPool.globalInstance().start(self.SAVING)                                  ## Serializing the presentation no longer blocks the event loop
+
+
+    def savedPowerpoint(self, error):
+        """
+        Finishes the Powerpoint export on the GUI thread once the file is written.
+        `error` is the exception raised while saving, if any.
+        """
+        self.BUSY = False
         try:
-            self.PRS.save(SYS.FILE_PPT_EXPORTED)
+            if error is not None: raise error
             os.startfile(SYS.FILE_PPT_EXPORTED)
         except PermissionError as e:
             LOG.warn("PermissionError: The file is still open or is already running. Close the file first and try again.")
@@ -2116,11 +1978,11 @@ class Export(object):
         except Exception as e:
             LOG.error(f"{e}")
         else:
-            RLS, NMS, DCT = FLD.getFieldData(True)
+            RLS, NMS = self.EXPORTED_POOL
             DCFG['POOL'].update({"ROLES": RLS})
             DCFG['POOL'].update({"NAMES": NMS})
             PDB.dump()
-            LOG.info(f"File successfully saved. ({round((time.time()-START)*1000)} ms)")
+            LOG.info(f"File successfully saved. ({round((time.time()-self.START)*1000)} ms)")
             UIB.hide()
 
 
@@ -2162,7 +2024,7 @@ class QWGT_PARTICIPANTS(QMainWindow):
         
         ## Banner
         self.PIX_HEADER = QLabel(self.WGT_CENTRAL); self.PIX_HEADER.setObjectName("PIX_HEADER"); self.PIX_HEADER.setAlignment(Qt.AlignCenter)        
-        self.PIX_HEADER.setPixmap(QPixmap(SYS.RES_HEADERLOGO).scaledToHeight(75, Qt.KeepAspectRatio & Qt.SmoothTransformation))
+        self.PIX_HEADER.setPixmap(QPixmap(SYS.RES_HEADERLOGO).scaledToHeight(75, Qt.SmoothTransformation))
 
         ## Head
         SPC_WINV_TOPP = QSpacerItem(20, 15, QSizePolicy.Minimum, QSizePolicy.Minimum)
@@ -2273,6 +2135,20 @@ class QWGT_PARTICIPANTS(QMainWindow):
 
 
     
+class QDEL_FONT(QtWidgets.QStyledItemDelegate):
+    """
+    Draws each font family of a combo box popup in its own typeface.
+    Only the rows in view are painted, so their fonts are made as they scroll in
+    """
+    def initStyleOption(self, option, index):
+        super().initStyleOption(option, index)
+        FONT = QFont(option.font)
+        FONT.setFamily(option.text)
+        option.font = FONT
+
+
+
+
 class QWGT_SETTINGS(QMainWindow):
     """
     Settings window 
@@ -2280,15 +2156,20 @@ class QWGT_SETTINGS(QMainWindow):
 
     Alias UIB (User Interface B / Settings)
     """
+    FONT_MODEL = None                                                                               ## Font families shared by every font combo box, listed once
+    IMG_FILTER = None                                                                               ## File dialog filter of the readable image formats
+
     def __init__(self, parent = None):
         QWidget.__init__(self, parent)
         self.CHANGED = False
         self.BG_SCALING = 100
+        self.BG_CACHE = {}                                                                          ## (path, height, mtime) -> scaled background preview
 
 
     def setupUI(self):
         """
-        Initializes all widgets for UIB
+        Initializes the window and the General tab for UIB.
+        The other tabs are built the first time they are opened
         """
         ## Window
         self.setObjectName("WIN_SETTINGS")
@@ -2305,22 +2186,124 @@ class QWGT_SETTINGS(QMainWindow):
 
         ## Settings Main Tab
         self.TBW_SETTINGS = QTabWidget(self.WGT_CENTRAL); self.TBW_SETTINGS.setObjectName("TBW_SETTINGS")
-
-        ## General Tab
         self.TAB_GENERAL = QWidget(); self.TAB_GENERAL.setObjectName("TAB_GENERAL")
-        self.GBX_GEN_PREFS = QGroupBox(self.TAB_GENERAL); self.GBX_GEN_PREFS.setObjectName("GBX_GEN_PREFS")
-        self.CHK_GEN_ALWAYS_ON_TOP = QCheckBox(self.GBX_GEN_PREFS); self.CHK_GEN_ALWAYS_ON_TOP.setObjectName("CHK_GEN_ALWAYS_ON_TOP")
-        self.CHK_GEN_USE_SUGGESTED = QCheckBox(self.GBX_GEN_PREFS); self.CHK_GEN_USE_SUGGESTED.setObjectName("CHK_GEN_USE_SUGGESTED")
-
-        self.GBX_GEN_PRESETS = QGroupBox(self.TAB_GENERAL); self.GBX_GEN_PRESETS.setObjectName("GBX_GEN_PRESETS")
-        self.LST_GEN_PRESETS = QListWidget(self.GBX_GEN_PRESETS); self.LST_GEN_PRESETS.setObjectName("LST_GEN_PRESETS")
-        self.BTN_GEN_MODIFY = QPushButton(self.GBX_GEN_PRESETS); self.BTN_GEN_MODIFY.setObjectName("BTN_GEN_MODIFY")
-        self.BTN_GEN_IMPORT = QPushButton(self.GBX_GEN_PRESETS); self.BTN_GEN_IMPORT.setObjectName("BTN_GEN_IMPORT")
-        self.BTN_GEN_REMOVE = QPushButton(self.GBX_GEN_PRESETS); self.BTN_GEN_REMOVE.setObjectName("BTN_GEN_REMOVE")
-
-        ## Presentation Tab
         self.TAB_PRESENTATION = QWidget(); self.TAB_PRESENTATION.setObjectName("TAB_PRESENTATION")
+        self.TAB_MEMBERS = QWidget(); self.TAB_MEMBERS.setObjectName("TAB_MEMBERS")
+        self.BUILT = {0: False, 1: False, 2: False}                                                 ## Tab index -> whether its widgets were built
 
+        ## Spacers
+        SPC_FOOTER_H = QSpacerItem(40, 20, QSizePolicy.Expanding, QSizePolicy.Minimum)
+
+        ## Grid Layouts
+        self.GRID_MAIN = QGridLayout(self.WGT_CENTRAL); self.GRID_MAIN.setObjectName("GRID_MAIN")
+
+        ## Layering
+        ## Main
+        self.GRID_MAIN.addWidget(self.TBW_SETTINGS, 0, 0, 1, 3)
+        self.GRID_MAIN.addWidget(self.LBL_APPVERSION, 1, 0, 1, 1)
+        self.GRID_MAIN.addItem(SPC_FOOTER_H, 1, 1, 1, 1)
+        self.GRID_MAIN.addWidget(self.BTN_OK, 1, 2, 1, 1)
+
+        self.TBW_SETTINGS.addTab(self.TAB_GENERAL, "")
+        self.TBW_SETTINGS.addTab(self.TAB_PRESENTATION, "")
+        self.TBW_SETTINGS.addTab(self.TAB_MEMBERS, "")
+
+        ## Initialization
+        self.setupDisplay()
+        self.buildTab(0)
+        self.TBW_SETTINGS.setCurrentIndex(0)
+        self.setupConnections()
+
+
+    def buildTab(self, index:int):
+        """
+        Builds the widgets of a tab the first time it is shown
+        """
+        if self.BUILT.get(index, True): return
+        self.BUILT[index] = True
+        TAB = self.TBW_SETTINGS.widget(index)
+        TAB.setUpdatesEnabled(False)
+        try:
+            [self.setupGeneralTab, self.setupPresentationTab, self.setupMembersTab][index]()
+        finally:
+            TAB.setUpdatesEnabled(True)
+
+
+    def setupGeneralTab(self):
+        """
+        Initializes all widgets for the General tab
+        """
+        ## Widgets
+        self.GBX_GEN_PREFS = QGroupBox(self.TAB_GENERAL); self.GBX_GEN_PREFS.setObjectName("GBX_GEN_PREFS")
+        self.CHK_GEN_ALWAYS_ON_TOP = QCheckBox(self.GBX_GEN_PREFS); self.CHK_GEN_ALWAYS_ON_TOP.setObjectName("CHK_GEN_ALWAYS_ON_TOP")
+        self.CHK_GEN_USE_SUGGESTED = QCheckBox(self.GBX_GEN_PREFS); self.CHK_GEN_USE_SUGGESTED.setObjectName("CHK_GEN_USE_SUGGESTED")
+        self.CHK_CNTT_ENABLECBXSCROLL = QCheckBox(self.GBX_GEN_PREFS); self.CHK_CNTT_ENABLECBXSCROLL.setObjectName("CHK_CNTT_ENABLECBXSCROLL")
+
+        self.GBX_GEN_PRESETS = QGroupBox(self.TAB_GENERAL); self.GBX_GEN_PRESETS.setObjectName("GBX_GEN_PRESETS")
+        self.LST_GEN_PRESETS = QListWidget(self.GBX_GEN_PRESETS); self.LST_GEN_PRESETS.setObjectName("LST_GEN_PRESETS")
+        self.BTN_GEN_MODIFY = QPushButton(self.GBX_GEN_PRESETS); self.BTN_GEN_MODIFY.setObjectName("BTN_GEN_MODIFY")
+        self.BTN_GEN_IMPORT = QPushButton(self.GBX_GEN_PRESETS); self.BTN_GEN_IMPORT.setObjectName("BTN_GEN_IMPORT")
+        self.BTN_GEN_REMOVE = QPushButton(self.GBX_GEN_PRESETS); self.BTN_GEN_REMOVE.setObjectName("BTN_GEN_REMOVE")
+
+        ## Spacers
+        SPC_GENERAL_V = QSpacerItem(20, 40, QSizePolicy.Minimum, QSizePolicy.Expanding)
+        SPC_GEN_PRESETS_V = QSpacerItem(20, 40, QSizePolicy.Minimum, QSizePolicy.Expanding)
+
+        ## Grid Layouts
+        self.GRID_GENERAL = QGridLayout(self.TAB_GENERAL); self.GRID_GENERAL.setObjectName("GRID_GENERAL")
+        self.GRID_GEN_APPEARANCE = QGridLayout(self.GBX_GEN_PREFS); self.GRID_GEN_APPEARANCE.setObjectName("GRID_GEN_APPEARANCE")
+        self.GRID_GEN_PRESETS = QGridLayout(self.GBX_GEN_PRESETS); self.GRID_GEN_PRESETS.setObjectName("GRID_GEN_PRESETS")
+
+        ## Layering
+        self.GRID_GENERAL.addWidget(self.GBX_GEN_PREFS, 0, 0, 1, 1)
+        self.GRID_GENERAL.addWidget(self.GBX_GEN_PRESETS, 1, 0, 1, 1)
+        self.GRID_GENERAL.addItem(SPC_GENERAL_V, 2, 0, 1, 1)
+
+        self.GRID_GEN_APPEARANCE.addWidget(self.CHK_GEN_ALWAYS_ON_TOP, 0, 0, 1, 1)
+        self.GRID_GEN_APPEARANCE.addWidget(self.CHK_GEN_USE_SUGGESTED, 1, 0, 1, 1)
+        self.GRID_GEN_APPEARANCE.addWidget(self.CHK_CNTT_ENABLECBXSCROLL, 2, 0, 1, 1)
+
+        self.GRID_GEN_PRESETS.addWidget(self.LST_GEN_PRESETS, 0, 0, 6, 1)
+        self.GRID_GEN_PRESETS.addWidget(self.BTN_GEN_IMPORT, 0, 1, 1, 1)
+        self.GRID_GEN_PRESETS.addWidget(self.BTN_GEN_MODIFY, 1, 1, 1, 1)
+        self.GRID_GEN_PRESETS.addWidget(self.BTN_GEN_REMOVE, 2, 1, 1, 1)
+        self.GRID_GEN_PRESETS.addItem(SPC_GEN_PRESETS_V, 3, 1, 1, 1)
+
+        ## Display
+        self.GBX_GEN_PREFS.setTitle("Preferences")
+        self.GBX_GEN_PRESETS.setTitle("Presets")
+        self.CHK_GEN_ALWAYS_ON_TOP.setText("Always on top")
+        self.CHK_GEN_USE_SUGGESTED.setText("Automatically use suggested participant")
+        self.CHK_CNTT_ENABLECBXSCROLL.setText("Change participant when scrolling through field")
+        self.BTN_GEN_IMPORT.setToolTip("Import a preset")
+        self.BTN_GEN_MODIFY.setToolTip("Modify this preset")
+        self.BTN_GEN_REMOVE.setToolTip("Remove this preset from this list")
+
+        PRESETS = [
+                "Sabbath Service",
+                "Adventist Youth Service",
+                "Midweek Service",
+                "Midweek Service",
+                "Vesper Service",
+                "District Fellowship"
+                ]
+        self.LST_GEN_PRESETS.addItems(PRESETS)
+
+        ## Initialization
+        GEN.setup()
+
+        ## Connections
+        self.CHK_GEN_ALWAYS_ON_TOP.clicked.connect(lambda: GEN.toggleAoT(self.CHK_GEN_ALWAYS_ON_TOP.isChecked()))
+
+        ## Exceptions
+        self.CHK_GEN_USE_SUGGESTED.setEnabled(False)
+        self.CHK_CNTT_ENABLECBXSCROLL.setEnabled(False)
+
+
+    def setupPresentationTab(self):
+        """
+        Initializes all widgets for the Presentation tab
+        """
         ## Presentation - Content
         self.GBX_PRES_CONTENT = QGroupBox(self.TAB_PRESENTATION); self.GBX_PRES_CONTENT.setObjectName("GBX_PRES_CONTENT")
         self.LBL_CNTT_TITLE = QLabel(self.GBX_PRES_CONTENT); self.LBL_CNTT_TITLE.setObjectName("LBL_CNTT_TITLE"); self.LBL_CNTT_TITLE.setAlignment(Qt.AlignRight|Qt.AlignTrailing|Qt.AlignVCenter)
@@ -2329,8 +2312,7 @@ class QWGT_SETTINGS(QMainWindow):
         self.LNE_CNTT_SUBTITLE = QLineEdit(self.GBX_PRES_CONTENT); self.LNE_CNTT_SUBTITLE.setObjectName("LNE_CNTT_SUBTITLE"); self.LNE_CNTT_SUBTITLE.setClearButtonEnabled(True)
         self.CHK_CNTT_DISPDATE = QCheckBox(self.GBX_PRES_CONTENT); self.CHK_CNTT_DISPDATE.setObjectName("CHK_CNTT_DISPDATE")
         self.CHK_CNTT_USEWIDESCR = QCheckBox(self.GBX_PRES_CONTENT); self.CHK_CNTT_USEWIDESCR.setObjectName("CHK_CNTT_USEWIDESCR")
-        self.CHK_CNTT_ENABLECBXSCROLL = QCheckBox(self.GBX_PRES_CONTENT); self.CHK_CNTT_ENABLECBXSCROLL.setObjectName("CHK_CNTT_ENABLECBXSCROLL")
-        self.CHK_CNTT_SPLITDIVINE = QCheckBox(self.GBX_GEN_PREFS); self.CHK_CNTT_SPLITDIVINE.setObjectName("CHK_CNTT_SPLITDIVINE")
+        self.CHK_CNTT_SPLITDIVINE = QCheckBox(self.GBX_PRES_CONTENT); self.CHK_CNTT_SPLITDIVINE.setObjectName("CHK_CNTT_SPLITDIVINE")
         
         ## Presentation - Fonts and Colors
         self.GBX_PRES_FONTSCOLORS = QGroupBox(self.TAB_PRESENTATION); self.GBX_PRES_FONTSCOLORS.setObjectName("GBX_PRES_FONTSCOLORS")
@@ -2339,11 +2321,11 @@ class QWGT_SETTINGS(QMainWindow):
         self.LBL_FAC_BODY = QLabel(self.GBX_PRES_FONTSCOLORS); self.LBL_FAC_BODY.setObjectName("LBL_FAC_BODY"); self.LBL_FAC_BODY.setAlignment(Qt.AlignRight|Qt.AlignTrailing|Qt.AlignVCenter)
         self.LBL_FAC_ROLE = QLabel(self.GBX_PRES_FONTSCOLORS); self.LBL_FAC_ROLE.setObjectName("LBL_FAC_ROLE"); self.LBL_FAC_ROLE.setAlignment(Qt.AlignRight|Qt.AlignTrailing|Qt.AlignVCenter)
         self.LBL_FAC_NAME = QLabel(self.GBX_PRES_FONTSCOLORS); self.LBL_FAC_NAME.setObjectName("LBL_FAC_NAME"); self.LBL_FAC_NAME.setAlignment(Qt.AlignRight|Qt.AlignTrailing|Qt.AlignVCenter)
-        self.FCB_FAC_TITLE = QFontComboBox(self.GBX_PRES_FONTSCOLORS); self.FCB_FAC_TITLE.setObjectName("FCB_FAC_TITLE"); self.FCB_FAC_TITLE.setMaximumWidth(140)
-        self.FCB_FAC_SUBITITLE = QFontComboBox(self.GBX_PRES_FONTSCOLORS); self.FCB_FAC_SUBITITLE.setObjectName("FCB_FAC_SUBITITLE"); self.FCB_FAC_SUBITITLE.setMaximumWidth(140)
-        self.FCB_FAC_BODY = QFontComboBox(self.GBX_PRES_FONTSCOLORS); self.FCB_FAC_BODY.setObjectName("FCB_FAC_BODY"); self.FCB_FAC_BODY.setMaximumWidth(140)
-        self.FCB_FAC_ROLE = QFontComboBox(self.GBX_PRES_FONTSCOLORS); self.FCB_FAC_ROLE.setObjectName("FCB_FAC_ROLE"); self.FCB_FAC_ROLE.setMaximumWidth(140)
-        self.FCB_FAC_NAME = QFontComboBox(self.GBX_PRES_FONTSCOLORS); self.FCB_FAC_NAME.setObjectName("FCB_FAC_NAME"); self.FCB_FAC_NAME.setMaximumSize(QtCore.QSize(140, 16777215))
+        self.FCB_FAC_TITLE = QComboBox(self.GBX_PRES_FONTSCOLORS); self.FCB_FAC_TITLE.setObjectName("FCB_FAC_TITLE"); self.FCB_FAC_TITLE.setMaximumWidth(140)
+        self.FCB_FAC_SUBITITLE = QComboBox(self.GBX_PRES_FONTSCOLORS); self.FCB_FAC_SUBITITLE.setObjectName("FCB_FAC_SUBITITLE"); self.FCB_FAC_SUBITITLE.setMaximumWidth(140)
+        self.FCB_FAC_BODY = QComboBox(self.GBX_PRES_FONTSCOLORS); self.FCB_FAC_BODY.setObjectName("FCB_FAC_BODY"); self.FCB_FAC_BODY.setMaximumWidth(140)
+        self.FCB_FAC_ROLE = QComboBox(self.GBX_PRES_FONTSCOLORS); self.FCB_FAC_ROLE.setObjectName("FCB_FAC_ROLE"); self.FCB_FAC_ROLE.setMaximumWidth(140)
+        self.FCB_FAC_NAME = QComboBox(self.GBX_PRES_FONTSCOLORS); self.FCB_FAC_NAME.setObjectName("FCB_FAC_NAME"); self.FCB_FAC_NAME.setMaximumSize(QtCore.QSize(140, 16777215))
         self.LIN_FAC_DIVIDER = QFrame(self.GBX_PRES_FONTSCOLORS); self.LIN_FAC_DIVIDER.setObjectName("LIN_FAC_DIVIDER"); self.LIN_FAC_DIVIDER.setFrameShape(QFrame.HLine); self.LIN_FAC_DIVIDER.setFrameShadow(QFrame.Sunken)
         self.LBL_FAC_TITLE_PREV = QLabel(self.GBX_PRES_FONTSCOLORS); self.LBL_FAC_TITLE_PREV.setObjectName("LBL_FAC_TITLE_PREV")
         self.LBL_FAC_SUBTITLE_PREV = QLabel(self.GBX_PRES_FONTSCOLORS); self.LBL_FAC_SUBTITLE_PREV.setObjectName("LBL_FAC_SUBTITLE_PREV")
@@ -2355,6 +2337,11 @@ class QWGT_SETTINGS(QMainWindow):
         self.BTN_FAC_BODY = QPushButton(self.GBX_PRES_FONTSCOLORS); self.BTN_FAC_BODY.setObjectName("BTN_FAC_COLORPICKER"); self.BTN_FAC_BODY.setMaximumSize(QtCore.QSize(30, 16777215))
         self.BTN_FAC_ROLE = QPushButton(self.GBX_PRES_FONTSCOLORS); self.BTN_FAC_ROLE.setObjectName("BTN_FAC_COLORPICKER"); self.BTN_FAC_ROLE.setMaximumSize(QtCore.QSize(30, 16777215))
         self.BTN_FAC_NAME = QPushButton(self.GBX_PRES_FONTSCOLORS); self.BTN_FAC_NAME.setObjectName("BTN_FAC_COLORPICKER"); self.BTN_FAC_NAME.setMaximumSize(QtCore.QSize(30, 16777215))
+        self.DEL_FAC_FONT = QDEL_FONT(self.GBX_PRES_FONTSCOLORS)
+        for FCB in [self.FCB_FAC_TITLE, self.FCB_FAC_SUBITITLE, self.FCB_FAC_BODY, self.FCB_FAC_ROLE, self.FCB_FAC_NAME]:
+            FCB.setModel(self.getFontModel())
+            FCB.setItemDelegate(self.DEL_FAC_FONT)
+            FCB.view().setUniformItemSizes(True)                                                    ## Keeps the popup from sizing every row in its own font
         
         ## Presentation - Background
         self.GBX_PRES_BACKGROUND = QGroupBox(self.TAB_PRESENTATION); self.GBX_PRES_BACKGROUND.setObjectName("GBX_PRES_BACKGROUND")
@@ -2362,30 +2349,12 @@ class QWGT_SETTINGS(QMainWindow):
         self.BTN_BG_DISCARD = QPushButton(self.GBX_PRES_BACKGROUND); self.BTN_BG_DISCARD.setObjectName("BTN_BG_DISCARD"); self.BTN_BG_DISCARD.setMaximumSize(QtCore.QSize(30, 16777215))
         self.LBL_BG_PREVIEW = QLabel(self.GBX_PRES_BACKGROUND); self.LBL_BG_PREVIEW.setObjectName("LBL_BG_PREVIEW"); self.LBL_BG_PREVIEW.setAlignment(Qt.AlignCenter)
         self.PIX_BG_PREVIEW = QLabel(self.GBX_PRES_BACKGROUND); self.PIX_BG_PREVIEW.setObjectName("PIX_BG_PREVIEW"); self.PIX_BG_PREVIEW.setAlignment(Qt.AlignCenter)        
-        self.PIX_BG_PREVIEW.setPixmap(QPixmap(PKG.IMG_BACKGROUND).scaledToHeight(self.BG_SCALING, Qt.KeepAspectRatio & Qt.SmoothTransformation))
+        QtCore.QTimer.singleShot(0, lambda: self.PIX_BG_PREVIEW.setPixmap(self.getScaledBackground(PKG.IMG_BACKGROUND, self.BG_SCALING)))   ## Decoded after the tab paints
         
         self.BTN_PRES_RESET = QPushButton(self.TAB_PRESENTATION); self.BTN_PRES_RESET.setObjectName("BTN_PRES_RESET")
 
-        ## Members Tab
-        self.TAB_MEMBERS = QWidget(); self.TAB_MEMBERS.setObjectName("TAB_MEMBERS")
-        self.LNE_MEM_SEARCHADD = QLineEdit(self.TAB_MEMBERS); self.LNE_MEM_SEARCHADD.setObjectName("LNE_MEM_SEARCHADD"); self.LNE_MEM_SEARCHADD.setClearButtonEnabled(True)
-        self.LST_MEM_MEMBERS = QListWidget(self.TAB_MEMBERS); self.LST_MEM_MEMBERS.setObjectName("LST_MEM_MEMBERS")
-        self.BTN_MEM_ADD = QPushButton(self.TAB_MEMBERS); self.BTN_MEM_ADD.setObjectName("BTN_MEM_ADD")
-        self.BTN_MEM_EDIT = QPushButton(self.TAB_MEMBERS); self.BTN_MEM_EDIT.setObjectName("BTN_MEM_EDIT"); self.BTN_MEM_EDIT.setEnabled(False)
-        self.BTN_MEM_REMOVE = QPushButton(self.TAB_MEMBERS); self.BTN_MEM_REMOVE.setObjectName("BTN_MEM_REMOVE"); self.BTN_MEM_REMOVE.setEnabled(False)
-        self.BTN_MEM_IMPORT = QPushButton(self.TAB_MEMBERS); self.BTN_MEM_IMPORT.setObjectName("BTN_MEM_IMPORT")
-        self.BTN_MEM_EXPORT = QPushButton(self.TAB_MEMBERS); self.BTN_MEM_EXPORT.setObjectName("BTN_MEM_EXPORT")
-        self.GBX_MEM_DETAILS = QGroupBox(self.TAB_MEMBERS);  self.GBX_MEM_DETAILS.setObjectName("GBX_MEM_DETAILS")
-        self.LBL_DET_MEMBERS = QLabel(self.GBX_MEM_DETAILS); self.LBL_DET_MEMBERS.setObjectName("LBL_DET_MEMBERS")
-        self.LBL_DET_MEN = QLabel(self.GBX_MEM_DETAILS); self.LBL_DET_MEN.setObjectName("LBL_DET_MEN")
-        self.LBL_DET_WOMEN = QLabel(self.GBX_MEM_DETAILS); self.LBL_DET_WOMEN.setObjectName("LBL_DET_WOMEN")
-        self.LBL_DET_OTHERS = QLabel(self.GBX_MEM_DETAILS); self.LBL_DET_OTHERS.setObjectName("LBL_DET_OTHERS")
-        self.BTN_MEM_SAVE = QPushButton(self.TAB_MEMBERS); self.BTN_MEM_SAVE.setObjectName("BTN_MEM_SAVE")
 
         ## Spacers
-        SPC_FOOTER_H = QSpacerItem(40, 20, QSizePolicy.Expanding, QSizePolicy.Minimum)
-        SPC_GENERAL_V = QSpacerItem(20, 40, QSizePolicy.Minimum, QSizePolicy.Expanding)
-        SPC_GEN_PRESETS_V = QSpacerItem(20, 40, QSizePolicy.Minimum, QSizePolicy.Expanding)
         SPC_PRES_V4 = QSpacerItem(40, 20, QSizePolicy.Expanding, QSizePolicy.Minimum)
         SPC_PRES_BG_H = QSpacerItem(20, 40, QSizePolicy.Minimum, QSizePolicy.Expanding)
         SPC_PRES_FAC_H = QSpacerItem(40, 20, QSizePolicy.Expanding, QSizePolicy.Minimum)
@@ -2393,47 +2362,14 @@ class QWGT_SETTINGS(QMainWindow):
         SPC_PRES_V3 = QSpacerItem(20, 40, QSizePolicy.Minimum, QSizePolicy.Expanding)
         SPC_PRES_V2 = QSpacerItem(20, 40, QSizePolicy.Minimum, QSizePolicy.Expanding)
         SPC_PRES_V1 = QSpacerItem(20, 40, QSizePolicy.Minimum, QSizePolicy.Expanding)
-        SPC_MEM_V1 = QSpacerItem(20, 40, QSizePolicy.Minimum, QSizePolicy.Expanding)
 
         ## Grid Layouts
-        self.GRID_MEMBERS = QGridLayout(self.TAB_MEMBERS); self.GRID_MEMBERS.setObjectName("GRID_MEMBERS")
-        self.GRID_MAIN = QGridLayout(self.WGT_CENTRAL); self.GRID_MAIN.setObjectName("GRID_MAIN")
-        self.GRID_GENERAL = QGridLayout(self.TAB_GENERAL); self.GRID_GENERAL.setObjectName("GRID_GENERAL")
         self.GRID_PRES_BG = QGridLayout(self.GBX_PRES_BACKGROUND); self.GRID_PRES_BG.setObjectName("GRID_PRES_BG")
         self.GRID_PRESENTATION = QGridLayout(self.TAB_PRESENTATION); self.GRID_PRESENTATION.setObjectName("GRID_PRESENTATION")
         self.GRID_PRES_FAC = QGridLayout(self.GBX_PRES_FONTSCOLORS); self.GRID_PRES_FAC.setObjectName("GRID_PRES_FAC")
-        self.GRID_GEN_APPEARANCE = QGridLayout(self.GBX_GEN_PREFS); self.GRID_GEN_APPEARANCE.setObjectName("GRID_GEN_APPEARANCE")
         self.GRID_PRES_CONTENT = QGridLayout(self.GBX_PRES_CONTENT); self.GRID_PRES_CONTENT.setObjectName("GRID_PRES_CONTENT")
-        self.GRID_MEM_DET = QGridLayout(self.GBX_MEM_DETAILS); self.GRID_MEM_DET.setObjectName("GRID_MEM_DET")
-        self.GRID_GEN_PRESETS = QGridLayout(self.GBX_GEN_PRESETS); self.GRID_GEN_PRESETS.setObjectName("GRID_GEN_PRESETS")
 
         ## Layering
-        ## Main
-        self.GRID_MAIN.addWidget(self.TBW_SETTINGS, 0, 0, 1, 3)
-        self.GRID_MAIN.addWidget(self.LBL_APPVERSION, 1, 0, 1, 1)
-        self.GRID_MAIN.addItem(SPC_FOOTER_H, 1, 1, 1, 1)
-        self.GRID_MAIN.addWidget(self.BTN_OK, 1, 2, 1, 1)
-
-        self.TBW_SETTINGS.addTab(self.TAB_GENERAL, "")
-        self.TBW_SETTINGS.addTab(self.TAB_PRESENTATION, "")
-        self.TBW_SETTINGS.addTab(self.TAB_MEMBERS, "")
-
-        ## General Tab
-        self.GRID_GENERAL.addWidget(self.GBX_GEN_PREFS, 0, 0, 1, 1)
-        self.GRID_GENERAL.addWidget(self.GBX_GEN_PRESETS, 1, 0, 1, 1)
-        self.GRID_GENERAL.addItem(SPC_GENERAL_V, 2, 0, 1, 1)
-
-        self.GRID_GEN_APPEARANCE.addWidget(self.CHK_GEN_ALWAYS_ON_TOP, 0, 0, 1, 1)
-        self.GRID_GEN_APPEARANCE.addWidget(self.CHK_GEN_USE_SUGGESTED, 1, 0, 1, 1)
-        self.GRID_GEN_APPEARANCE.addWidget(self.CHK_CNTT_ENABLECBXSCROLL, 2, 0, 1, 1)
-
-        self.GRID_GEN_PRESETS.addWidget(self.LST_GEN_PRESETS, 0, 0, 6, 1)
-        self.GRID_GEN_PRESETS.addWidget(self.BTN_GEN_IMPORT, 0, 1, 1, 1)
-        self.GRID_GEN_PRESETS.addWidget(self.BTN_GEN_MODIFY, 1, 1, 1, 1)
-        self.GRID_GEN_PRESETS.addWidget(self.BTN_GEN_REMOVE, 2, 1, 1, 1)
-        self.GRID_GEN_PRESETS.addItem(SPC_GEN_PRESETS_V, 3, 1, 1, 1)
-        
-        ## Presentation Tab
         self.GRID_PRESENTATION.addWidget(self.GBX_PRES_CONTENT, 0, 0, 2, 2)
         self.GRID_PRESENTATION.addItem(SPC_PRES_V1, 2, 0, 1, 2)
         self.GRID_PRESENTATION.addWidget(self.GBX_PRES_FONTSCOLORS, 3, 0, 1, 2)
@@ -2481,77 +2417,21 @@ class QWGT_SETTINGS(QMainWindow):
         self.GRID_PRES_BG.addWidget(self.BTN_BG_DISCARD, 1, 1, 1, 1)
         self.GRID_PRES_BG.addItem(SPC_PRES_BG_H, 2, 1, 1, 1)
 
-        ## Members Tab
-        self.GRID_MEMBERS.addWidget(self.LNE_MEM_SEARCHADD, 2, 0, 1, 1)
-        self.GRID_MEMBERS.addWidget(self.LST_MEM_MEMBERS, 3, 0, 6, 1)
-        self.GRID_MEMBERS.addWidget(self.BTN_MEM_ADD, 2, 1, 1, 1)
-        self.GRID_MEMBERS.addWidget(self.BTN_MEM_EDIT, 3, 1, 1, 1)
-        self.GRID_MEMBERS.addWidget(self.BTN_MEM_REMOVE, 4, 1, 1, 1)
-        self.GRID_MEMBERS.addItem(SPC_MEM_V1, 5, 1, 1, 1)
-        self.GRID_MEMBERS.addWidget(self.BTN_MEM_IMPORT, 6, 1, 1, 1)
-        self.GRID_MEMBERS.addWidget(self.BTN_MEM_SAVE, 7, 1, 1, 1)
-        self.GRID_MEMBERS.addWidget(self.BTN_MEM_EXPORT, 8, 1, 1, 1)
-        self.GRID_MEMBERS.addWidget(self.GBX_MEM_DETAILS, 10, 0, 1, 2)
-
-        self.GRID_MEM_DET.addWidget(self.LBL_DET_MEMBERS, 0, 0, 1, 1)
-        self.GRID_MEM_DET.addWidget(self.LBL_DET_MEN, 0, 1, 1, 1)
-        self.GRID_MEM_DET.addWidget(self.LBL_DET_OTHERS, 1, 0, 1, 1)
-        self.GRID_MEM_DET.addWidget(self.LBL_DET_WOMEN, 1, 1, 1, 1)
-
-        ## Initialization
-        self.setupDisplay()
-        self.setupValidators()
-        GEN.setup()
-        PRT.setup()
-        MEM.setup()
-        self.TBW_SETTINGS.setCurrentIndex(0)
-        self.setupConnections()
-
-    
-    def setupValidators(self):
-        self.LNE_MEM_SEARCHADD.setValidator(QRegExpValidator(QRegExp("[a-z-A-Z. -]+")))
-
-
-    def setupDisplay(self):
-        self.setWindowTitle("Settings")
-        self.BTN_OK.setText("OK")
-        self.LBL_APPVERSION.setText(f"{SW.NAME} v{SW.VERSION}")
-
-        ## General Tab
-        self.TBW_SETTINGS.setTabText(self.TBW_SETTINGS.indexOf(self.TAB_GENERAL), "General")
-        self.GBX_GEN_PREFS.setTitle("Preferences")
-        self.GBX_GEN_PRESETS.setTitle("Presets")
-        self.CHK_GEN_ALWAYS_ON_TOP.setText("Always on top")
-        self.CHK_GEN_USE_SUGGESTED.setText("Automatically use suggested participant")
-        self.CHK_CNTT_ENABLECBXSCROLL.setText("Change participant when scrolling through field")
-        self.CHK_CNTT_SPLITDIVINE.setText("Separate Divine service from Sabbath School")
-        self.BTN_GEN_IMPORT.setToolTip("Import a preset")
-        self.BTN_GEN_MODIFY.setToolTip("Modify this preset")
-        self.BTN_GEN_REMOVE.setToolTip("Remove this preset from this list")
-
-        PRESETS = [
-                "Sabbath Service",
-                "Adventist Youth Service",
-                "Midweek Service",
-                "Midweek Service",
-                "Vesper Service",
-                "District Fellowship"
-                ]
-        self.LST_GEN_PRESETS.addItems(PRESETS)
-        
-        ## Presentation Tab
-        self.TBW_SETTINGS.setTabText(self.TBW_SETTINGS.indexOf(self.TAB_PRESENTATION), "Presentation")
+        ## Display
         self.GBX_PRES_CONTENT.setTitle("Content")
         self.GBX_PRES_FONTSCOLORS.setTitle("Fonts and Colors")
         self.GBX_PRES_BACKGROUND.setTitle("Background")
 
         self.CHK_CNTT_DISPDATE.setText("Display date")
         self.CHK_CNTT_USEWIDESCR.setText("Use widescreen (16:9)")
+        self.CHK_CNTT_SPLITDIVINE.setText("Separate Divine service from Sabbath School")
 
         self.LBL_CNTT_TITLE.setText("Title:")
         self.LBL_CNTT_SUBTITLE.setText("Subtitle:")
         self.LNE_CNTT_TITLE.setPlaceholderText("Sabbath Service Participants")
         self.LNE_CNTT_SUBTITLE.setPlaceholderText("Happy Sabbath!")
+        self.LNE_CNTT_TITLE.setText(PKG.TXT_TITLE)
+        self.LNE_CNTT_SUBTITLE.setText(PKG.TXT_SUBTITLE)
 
         self.LBL_FAC_TITLE.setText("Title:")
         self.LBL_FAC_SUBTITLE.setText("Subtitle:")
@@ -2564,43 +2444,91 @@ class QWGT_SETTINGS(QMainWindow):
         self.LBL_BG_PREVIEW.setText("Preview")
 
         self.BTN_PRES_RESET.setText("Reset to defaults")
-        
-        ## Members Tab
-        self.TBW_SETTINGS.setTabText(self.TBW_SETTINGS.indexOf(self.TAB_MEMBERS), "Members")
-        self.LNE_MEM_SEARCHADD.setPlaceholderText("Search or type to add new member")
-        self.BTN_MEM_ADD.setToolTip("Add this member to the list")
-        self.BTN_MEM_EDIT.setToolTip("Rename this member")
-        self.BTN_MEM_REMOVE.setToolTip("Remove this member from the list")
-        self.BTN_MEM_SAVE.setToolTip("Save current member list")
-        self.BTN_MEM_IMPORT.setToolTip("Import member list")
-        self.BTN_MEM_EXPORT.setToolTip("Export member list")
-
-        self.GBX_MEM_DETAILS.setTitle("Details")
 
+        ## Initialization
+        PRT.setup()
 
-    def setupConnections(self):
-        """
-        Manages Signals and Slots from user interactions
-        """
-        self.BTN_OK.clicked.connect(lambda: self.saveChanges())
+        ## Connections
         self.BTN_BG_BROWSE.clicked.connect(lambda: UIB.browseForBackgroundImage())
         self.BTN_BG_DISCARD.clicked.connect(lambda: UIB.discardImage())
         self.LNE_CNTT_TITLE.textChanged.connect(lambda: UIB.updatePackage())
         self.LNE_CNTT_SUBTITLE.textChanged.connect(lambda: UIB.updatePackage())
+        self.CHK_CNTT_SPLITDIVINE.clicked.connect(lambda: PRT.toggleSplitDivine(self.CHK_CNTT_SPLITDIVINE.isChecked()))
+        self.CHK_CNTT_DISPDATE.clicked.connect(lambda: PRT.toggleDispDate(self.CHK_CNTT_DISPDATE.isChecked()))
 
-        ## General Tab
-        self.CHK_GEN_ALWAYS_ON_TOP.clicked.connect(lambda: GEN.toggleAoT(self.CHK_GEN_ALWAYS_ON_TOP.isChecked()))
+        ## Exceptions
+        self.CHK_CNTT_USEWIDESCR.setCheckState(3)
+        self.CHK_CNTT_USEWIDESCR.setEnabled(False)
 
 
-        ## Presentation Tab
-        self.CHK_CNTT_SPLITDIVINE.clicked.connect(lambda: PRT.toggleSplitDivine(self.CHK_CNTT_SPLITDIVINE.isChecked()))
-        self.CHK_CNTT_DISPDATE.clicked.connect(lambda: PRT.toggleDispDate(self.CHK_CNTT_DISPDATE.isChecked()))
+    def setupMembersTab(self):
+        """
+        Initializes all widgets for the Members tab
+        """
+        ## Widgets
+        self.LNE_MEM_SEARCHADD = QLineEdit(self.TAB_MEMBERS); self.LNE_MEM_SEARCHADD.setObjectName("LNE_MEM_SEARCHADD"); self.LNE_MEM_SEARCHADD.setClearButtonEnabled(True)
+        self.LST_MEM_MEMBERS = QtWidgets.QListView(self.TAB_MEMBERS); self.LST_MEM_MEMBERS.setObjectName("LST_MEM_MEMBERS")
+        self.MDL_MEM_MEMBERS = QtCore.QStringListModel(self.LST_MEM_MEMBERS); self.LST_MEM_MEMBERS.setModel(self.MDL_MEM_MEMBERS)   ## Whole list is swapped in with a single model reset
+        self.LST_MEM_MEMBERS.setEditTriggers(QtWidgets.QAbstractItemView.NoEditTriggers); self.LST_MEM_MEMBERS.setUniformItemSizes(True)
+        self.BTN_MEM_ADD = QPushButton(self.TAB_MEMBERS); self.BTN_MEM_ADD.setObjectName("BTN_MEM_ADD")
+        self.BTN_MEM_EDIT = QPushButton(self.TAB_MEMBERS); self.BTN_MEM_EDIT.setObjectName("BTN_MEM_EDIT"); self.BTN_MEM_EDIT.setEnabled(False)
+        self.BTN_MEM_REMOVE = QPushButton(self.TAB_MEMBERS); self.BTN_MEM_REMOVE.setObjectName("BTN_MEM_REMOVE"); self.BTN_MEM_REMOVE.setEnabled(False)
+        self.BTN_MEM_IMPORT = QPushButton(self.TAB_MEMBERS); self.BTN_MEM_IMPORT.setObjectName("BTN_MEM_IMPORT")
+        self.BTN_MEM_EXPORT = QPushButton(self.TAB_MEMBERS); self.BTN_MEM_EXPORT.setObjectName("BTN_MEM_EXPORT")
+        self.GBX_MEM_DETAILS = QGroupBox(self.TAB_MEMBERS);  self.GBX_MEM_DETAILS.setObjectName("GBX_MEM_DETAILS")
+        self.LBL_DET_MEMBERS = QLabel(self.GBX_MEM_DETAILS); self.LBL_DET_MEMBERS.setObjectName("LBL_DET_MEMBERS")
+        self.LBL_DET_MEN = QLabel(self.GBX_MEM_DETAILS); self.LBL_DET_MEN.setObjectName("LBL_DET_MEN")
+        self.LBL_DET_WOMEN = QLabel(self.GBX_MEM_DETAILS); self.LBL_DET_WOMEN.setObjectName("LBL_DET_WOMEN")
+        self.LBL_DET_OTHERS = QLabel(self.GBX_MEM_DETAILS); self.LBL_DET_OTHERS.setObjectName("LBL_DET_OTHERS")
+        self.BTN_MEM_SAVE = QPushButton(self.TAB_MEMBERS); self.BTN_MEM_SAVE.setObjectName("BTN_MEM_SAVE")
+
+        ## Spacers
+        SPC_MEM_V1 = QSpacerItem(20, 40, QSizePolicy.Minimum, QSizePolicy.Expanding)
 
+        ## Grid Layouts
+        self.GRID_MEMBERS = QGridLayout(self.TAB_MEMBERS); self.GRID_MEMBERS.setObjectName("GRID_MEMBERS")
+        self.GRID_MEM_DET = QGridLayout(self.GBX_MEM_DETAILS); self.GRID_MEM_DET.setObjectName("GRID_MEM_DET")
 
-        ## Members
+        ## Layering
+        self.GRID_MEMBERS.addWidget(self.LNE_MEM_SEARCHADD, 2, 0, 1, 1)
+        self.GRID_MEMBERS.addWidget(self.LST_MEM_MEMBERS, 3, 0, 6, 1)
+        self.GRID_MEMBERS.addWidget(self.BTN_MEM_ADD, 2, 1, 1, 1)
+        self.GRID_MEMBERS.addWidget(self.BTN_MEM_EDIT, 3, 1, 1, 1)
+        self.GRID_MEMBERS.addWidget(self.BTN_MEM_REMOVE, 4, 1, 1, 1)
+        self.GRID_MEMBERS.addItem(SPC_MEM_V1, 5, 1, 1, 1)
+        self.GRID_MEMBERS.addWidget(self.BTN_MEM_IMPORT, 6, 1, 1, 1)
+        self.GRID_MEMBERS.addWidget(self.BTN_MEM_SAVE, 7, 1, 1, 1)
+        self.GRID_MEMBERS.addWidget(self.BTN_MEM_EXPORT, 8, 1, 1, 1)
+        self.GRID_MEMBERS.addWidget(self.GBX_MEM_DETAILS, 10, 0, 1, 2)
+
+        self.GRID_MEM_DET.addWidget(self.LBL_DET_MEMBERS, 0, 0, 1, 1)
+        self.GRID_MEM_DET.addWidget(self.LBL_DET_MEN, 0, 1, 1, 1)
+        self.GRID_MEM_DET.addWidget(self.LBL_DET_OTHERS, 1, 0, 1, 1)
+        self.GRID_MEM_DET.addWidget(self.LBL_DET_WOMEN, 1, 1, 1, 1)
+
+        ## Display
+        self.LNE_MEM_SEARCHADD.setValidator(QRegExpValidator(QRegExp("[a-z-A-Z. -]+")))
+        self.LNE_MEM_SEARCHADD.setPlaceholderText("Search or type to add new member")
+        self.BTN_MEM_ADD.setToolTip("Add this member to the list")
+        self.BTN_MEM_EDIT.setToolTip("Rename this member")
+        self.BTN_MEM_REMOVE.setToolTip("Remove this member from the list")
+        self.BTN_MEM_SAVE.setToolTip("Save current member list")
+        self.BTN_MEM_IMPORT.setToolTip("Import member list")
+        self.BTN_MEM_EXPORT.setToolTip("Export member list")
+
+        self.GBX_MEM_DETAILS.setTitle("Details")
+
+        ## Initialization
+        MEM.setup()
+        self.BTN_MEM_ADD.setEnabled(False)
+
+        ## Connections
         self.LNE_MEM_SEARCHADD.mouseReleaseEvent = lambda event: MEM.searchClicked(event)
-        self.LNE_MEM_SEARCHADD.textChanged.connect(lambda: MEM.checkSearchAdd())
-        self.LST_MEM_MEMBERS.itemSelectionChanged.connect(lambda: MEM.itemChanged())
+        self.TMR_MEM_SEARCH = QtCore.QTimer(self); self.TMR_MEM_SEARCH.setSingleShot(True)     ## Refilters once typing pauses instead of on every keystroke
+        self.TMR_MEM_SEARCH.setInterval(120)
+        self.TMR_MEM_SEARCH.timeout.connect(lambda: MEM.checkSearchAdd())
+        self.LNE_MEM_SEARCHADD.textChanged.connect(lambda: self.TMR_MEM_SEARCH.start())
+        self.LST_MEM_MEMBERS.selectionModel().selectionChanged.connect(lambda: MEM.itemChanged())
         self.BTN_MEM_ADD.clicked.connect(lambda: MEM.addNewMember())
         self.BTN_MEM_EDIT.clicked.connect(lambda: MEM.editMember())
         self.BTN_MEM_REMOVE.clicked.connect(lambda: MEM.removeMember())
@@ -2609,12 +2537,30 @@ class QWGT_SETTINGS(QMainWindow):
         self.BTN_MEM_EXPORT.clicked.connect(lambda: MEM.exportMemberList())
 
 
-        ## Exceptions
-        self.CHK_GEN_USE_SUGGESTED.setEnabled(False)
-        self.CHK_CNTT_USEWIDESCR.setCheckState(3)
-        self.CHK_CNTT_USEWIDESCR.setEnabled(False)
-        self.CHK_CNTT_ENABLECBXSCROLL.setEnabled(False)
-        
+    def getFontModel(self):
+        """
+        Returns the font family model, querying the font database on first use
+        """
+        if QWGT_SETTINGS.FONT_MODEL is None:
+            QWGT_SETTINGS.FONT_MODEL = QtCore.QStringListModel(QtGui.QFontDatabase().families())
+        return QWGT_SETTINGS.FONT_MODEL
+
+
+    def setupDisplay(self):
+        self.setWindowTitle("Settings")
+        self.BTN_OK.setText("OK")
+        self.LBL_APPVERSION.setText(f"{SW.NAME} v{SW.VERSION}")
+        self.TBW_SETTINGS.setTabText(self.TBW_SETTINGS.indexOf(self.TAB_GENERAL), "General")
+        self.TBW_SETTINGS.setTabText(self.TBW_SETTINGS.indexOf(self.TAB_PRESENTATION), "Presentation")
+        self.TBW_SETTINGS.setTabText(self.TBW_SETTINGS.indexOf(self.TAB_MEMBERS), "Members")
+
+
+    def setupConnections(self):
+        """
+        Manages Signals and Slots from user interactions
+        """
+        self.BTN_OK.clicked.connect(lambda: self.saveChanges())
+        self.TBW_SETTINGS.currentChanged.connect(lambda i: self.buildTab(i))
 
 
 
@@ -2624,7 +2570,7 @@ class QWGT_SETTINGS(QMainWindow):
 
         if event.key() in [Qt.Key_Enter, Qt.Key_Return]:
             ## Shortcut Key for Adding
-            if self.LNE_MEM_SEARCHADD.hasFocus():
+            if self.BUILT[2] and self.LNE_MEM_SEARCHADD.hasFocus():
                 MEM.addNewMember()
 
 
@@ -2674,7 +2620,7 @@ class QWGT_SETTINGS(QMainWindow):
         """
         ## Default values
         self.ENTERING = True
-        self.BTN_MEM_ADD.setEnabled(False)
+        if self.BUILT[2]: self.BTN_MEM_ADD.setEnabled(False)
 
         ## Spawn settings at center of UIA
         if self.isHidden():
@@ -2686,8 +2632,9 @@ class QWGT_SETTINGS(QMainWindow):
         self.activateWindow()
 
         ## Re-initialize variable
-        self.LNE_CNTT_TITLE.setText(PKG.TXT_TITLE)
-        self.LNE_CNTT_SUBTITLE.setText(PKG.TXT_SUBTITLE)
+        if self.BUILT[1]:
+            self.LNE_CNTT_TITLE.setText(PKG.TXT_TITLE)
+            self.LNE_CNTT_SUBTITLE.setText(PKG.TXT_SUBTITLE)
         self.ENTERING = False
         self.CHANGED = False
     
@@ -2706,29 +2653,43 @@ class QWGT_SETTINGS(QMainWindow):
         """
         Customizes the background image
         """
-        PATH_BGIMG = QFileDialog.getOpenFileName(None, 'Browse for Hymnal Package', os.getcwd(),
-                    f'Images ({" ".join(["*.{}".format(fo.data().decode()) for fo in QImageReader.supportedImageFormats()])})'.format())
+        if QWGT_SETTINGS.IMG_FILTER is None:                                                        ## Supported formats don't change while running
+            QWGT_SETTINGS.IMG_FILTER = f'Images ({" ".join(["*.{}".format(fo.data().decode()) for fo in QImageReader.supportedImageFormats()])})'
+        PATH_BGIMG = QFileDialog.getOpenFileName(None, 'Browse for Hymnal Package', os.getcwd(), QWGT_SETTINGS.IMG_FILTER)
                     
         if PATH_BGIMG[0] != '':   
-            self.PIX_BG_PREVIEW.setPixmap(QPixmap(PATH_BGIMG[0]).scaledToHeight(85, Qt.KeepAspectRatio & Qt.SmoothTransformation))
+            self.PIX_BG_PREVIEW.setPixmap(self.getScaledBackground(PATH_BGIMG[0], 85))
             PKG.IMG_BACKGROUND = PATH_BGIMG[0]
             self.updateBackgroundImage(PATH_BGIMG[0])
 
 
+    def getScaledBackground(self, path:str, height:int):
+        """
+        Returns the background image scaled for the preview.
+        Scaled copies are kept so the image is only decoded once per size
+        """
+        try: MTIME = os.path.getmtime(path)
+        except OSError: MTIME = None
+        KEY = (path, height, MTIME)
+        if KEY not in self.BG_CACHE:
+            self.BG_CACHE[KEY] = QPixmap(path).scaledToHeight(height, Qt.SmoothTransformation)
+        return self.BG_CACHE[KEY]
+
+
     def updateBackgroundImage(self, bg):
         """
         Makes copy of the imported bg image to program directory and updating the configuration
         """
-        for i in ['png', 'jpg', 'svg', 'bmp', 'tiff', 'jpeg', 'gif']:
-            try: os.remove(f"{SYS.DIR_PROGRAM}/BG.{i}")
-            except FileNotFoundError: pass
+        SOURCE = os.path.normcase(os.path.abspath(bg))
+        DEST = f"{SYS.DIR_PROGRAM}/BG{os.path.splitext(bg.split('/')[-1])[1]}"
 
-        shutil.copy(bg, SYS.DIR_PROGRAM)
-        FILE = bg.split('/')[-1]
-        DEST = f"{SYS.DIR_PROGRAM}/BG{os.path.splitext(FILE)[1]}"
+        for f in glob.glob(os.path.join(SYS.DIR_PROGRAM, "BG.*")):                              ## Removes previous copies of any extension
+            if os.path.normcase(os.path.abspath(f)) == SOURCE: continue
+            try: os.unlink(f)
+            except OSError as e: LOG.debug(e)
 
-        try: os.rename(f"{SYS.DIR_PROGRAM}/{FILE}", DEST)
-        except (FileNotFoundError, FileExistsError) as e: LOG.debug(e)
+        if os.path.normcase(os.path.abspath(DEST)) != SOURCE:
+            shutil.copyfile(bg, DEST)
         DCFG["CONFIG"].update({"IMG_BACKGROUND": DEST}); PDB.dump()
     
 
@@ -2737,7 +2698,7 @@ class QWGT_SETTINGS(QMainWindow):
         Discards and restores the background image to default
         """
         PKG.IMG_BACKGROUND = PKG.DEF_IMG_BACKGROUND
-        self.PIX_BG_PREVIEW.setPixmap(QPixmap(PKG.IMG_BACKGROUND).scaledToHeight(self.BG_SCALING, Qt.KeepAspectRatio & Qt.SmoothTransformation))
+        self.PIX_BG_PREVIEW.setPixmap(self.getScaledBackground(PKG.IMG_BACKGROUND, self.BG_SCALING))
         self.updateBackgroundImage(PKG.IMG_BACKGROUND)
 
 
@@ -2811,7 +2772,12 @@ class PresentationTab(object):
 
 
 
-    
+
+_ALPHA_RE = re.compile(r"[^A-Za-z]+")                                                               ## Non-alphabet characters, stripped when searching names
+
+
+
+
 class Members(object):
     """
     Handles all member functions from Settings
@@ -2822,21 +2788,47 @@ class Members(object):
         self.SEARCH_STATE = False
         self.LAST_INPUT = ''
         self.SAVE_STATE = True
+        self.APP_ICON = None
+        self.DISPLAYED = []                                                 ## Names currently shown in the member list, in row order
 
 
     def setup(self):
-        UIB.LST_MEM_MEMBERS.clear()
-        UIB.LST_MEM_MEMBERS.addItems(DCFG["POOL"]["NAMES"])
-        self.CACHED_MEMBERS = self.getCurrentMembers()
+        self.cacheMembers(DCFG["POOL"]["NAMES"])
+        self.populateList(self.CACHED_MEMBERS)
         self.generalRefresh()
 
 
-    def getCurrentMembers(self, lowercase=False):
+    def cacheMembers(self, names:list):
+        """
+        Keeps the sorted member names along with their lowercase and alphabet-only
+        forms used by searching and duplicate checks. The list widget only displays these
+        """
+        self.CACHED_MEMBERS = sorted(names)
+        self.CACHED_LOWER = [n.lower() for n in self.CACHED_MEMBERS]
+        self.CACHED_STRIPPED = [_ALPHA_RE.sub('', n) for n in self.CACHED_LOWER]
+
+
+    def populateList(self, names:list):
+        """
+        Replaces every name shown in the member list in one batch
+        """
+        self.DISPLAYED = names
+        UIB.MDL_MEM_MEMBERS.setStringList(names)
+
+
+    def getSelectedNames(self):
+        """
+        Returns the names selected in the member list
+        """
+        return [i.data() for i in UIB.LST_MEM_MEMBERS.selectionModel().selectedIndexes()]
+
+
+    def selectName(self, name:str):
         """
-        Returns a string names of members from the list widget
+        Selects the name in the member list if it is shown
         """
-        return ([UIB.LST_MEM_MEMBERS.item(i).text() if not lowercase else
-            UIB.LST_MEM_MEMBERS.item(i).text().lower() for i in range(UIB.LST_MEM_MEMBERS.count())])
+        if name in self.DISPLAYED:
+            UIB.LST_MEM_MEMBERS.setCurrentIndex(UIB.MDL_MEM_MEMBERS.index(self.DISPLAYED.index(name)))
 
 
     def checkSearchAdd(self):
@@ -2847,15 +2839,14 @@ class Members(object):
 
         if len(UIB.LNE_MEM_SEARCHADD.text()) < len(self.LAST_INPUT):
             self.SEARCH_STATE = True
-            UIB.LST_MEM_MEMBERS.clear()
-            UIB.LST_MEM_MEMBERS.addItems(self.CACHED_MEMBERS)
+            self.populateList(self.CACHED_MEMBERS)
 
         if UIB.LNE_MEM_SEARCHADD.text() != '':
             UIB.BTN_MEM_ADD.setEnabled(True)
             self.SEARCH_STATE = True
             self.filterItems()
 
-        if not len(re.sub(r"[^A-Za-z]+", '', UIB.LNE_MEM_SEARCHADD.text())):
+        if not len(_ALPHA_RE.sub('', UIB.LNE_MEM_SEARCHADD.text())):
             UIB.BTN_MEM_ADD.setEnabled(False)
             self.SEARCH_STATE = False
         
@@ -2863,11 +2854,9 @@ class Members(object):
 
     
     def filterItems(self):
-        INPUT = re.sub(r"[^A-Za-z]+", '', UIB.LNE_MEM_SEARCHADD.text().lower())                             ## Use RegEx to filter out non-alphabet characters
-        OUTPUT = [n for n in self.CACHED_MEMBERS if INPUT in re.sub(r"[^A-Za-z]+", '', n.lower())]
-        UIB.LST_MEM_MEMBERS.clear()
-        UIB.LST_MEM_MEMBERS.addItems(OUTPUT)
-        UIB.LST_MEM_MEMBERS.sortItems()
+        INPUT = _ALPHA_RE.sub('', UIB.LNE_MEM_SEARCHADD.text().lower())                                     ## Use RegEx to filter out non-alphabet characters
+        OUTPUT = [n for n, STRIPPED in zip(self.CACHED_MEMBERS, self.CACHED_STRIPPED) if INPUT in STRIPPED]
+        self.populateList(OUTPUT)                                                                           ## Already sorted since the cache is kept sorted
         self.LAST_INPUT = UIB.LNE_MEM_SEARCHADD.text()
         self.refreshButtons()
     
@@ -2878,31 +2867,38 @@ class Members(object):
 
     def getSimilarNames(self, name:str, renaming=None):    
         """
-        Uses Levenshtein Ratio method to determine the similarity
+        Uses the Levenshtein ratio to determine the similarity
         of the existing names vs the proposed name entry
         """
-        MEMBERS = self.CACHED_MEMBERS
-        if renaming is not None: MEMBERS.remove(renaming) 
-        return [n for n in MEMBERS if lev.ratio(n.lower(), name.lower()) > self.DUPLICATE_THRESHOLD]
+        NAME = name.lower()
+        if extractAll:                                                                                  ## Scores all members in one native call that gives up early below the cutoff
+            MATCHES = extractAll(NAME, self.CACHED_LOWER, scorer=levRatio, processor=None, score_cutoff=self.DUPLICATE_THRESHOLD, limit=None)
+            return [self.CACHED_MEMBERS[i] for _, SCORE, i in sorted(MATCHES, key=lambda m: m[2])   ## Back to list order, the cutoff itself is inclusive
+                    if SCORE > self.DUPLICATE_THRESHOLD and self.CACHED_MEMBERS[i] != renaming]
+
+        BAND = 1 - self.DUPLICATE_THRESHOLD                                                             ## Ratio can only pass if the length gap is below this share of both lengths
+        return [n for n, LOWER in zip(self.CACHED_MEMBERS, self.CACHED_LOWER)
+                if n != renaming and abs(len(LOWER) - len(NAME)) <= BAND * (len(LOWER) + len(NAME))   ## The member being renamed is skipped without touching the cache
+                and levRatio(LOWER, NAME) > self.DUPLICATE_THRESHOLD]
         
 
     def displayDialog(self, mode, similar:list=None, name=''):
         """
         Constructor method for similar names dialog
         """
+        if self.APP_ICON is None: self.APP_ICON = QIcon(SYS.RES_APP_ICON)                          ## Decoded once, shared by every dialog
         MSG_BOX = QMessageBox(); MSG_BOX.setWindowTitle(SW.NAME)
         MSG_BOX.setStyleSheet('QPushButton {min-width: 50px;}')
+        MSG_BOX.setWindowIcon(self.APP_ICON); MSG_BOX.setWindowFlags(Qt.WindowStaysOnTopHint)
 
         if mode == 0:
             LOG.warn(f"Members: Duplicate name detected: {name}")
-            MSG_BOX.setWindowIcon(QIcon(SYS.RES_APP_ICON)); MSG_BOX.setWindowFlags(Qt.WindowStaysOnTopHint)
             MSG_BOX.setStandardButtons(QMessageBox.Ok); MSG_BOX.setDefaultButton(QMessageBox.Ok)
             MSG_BOX.setIcon(QMessageBox.Warning)
             MSG_BOX.setText(f"{name} is already in the list.")
 
         elif mode == 1:
             LOG.info(f'Members: Similar names detected: {", ".join(similar)}')
-            MSG_BOX.setWindowIcon(QIcon(SYS.RES_APP_ICON)); MSG_BOX.setWindowFlags(Qt.WindowStaysOnTopHint)
             MSG_BOX.setIcon(QMessageBox.Question)
             MSG_BOX.setStandardButtons(QMessageBox.Yes | QMessageBox.No); MSG_BOX.setDefaultButton(QMessageBox.No)
             MSG_BOX.setText("The name you entered might be already in the list.\nContinue anyway?")
@@ -2910,10 +2906,9 @@ class Members(object):
            
         elif mode == 2:
             LOG.info(f'Members: Too few members for exporting')
-            MSG_BOX.setWindowIcon(QIcon(SYS.RES_APP_ICON)); MSG_BOX.setWindowFlags(Qt.WindowStaysOnTopHint)
             MSG_BOX.setIcon(QMessageBox.Question)
             MSG_BOX.setStandardButtons(QMessageBox.Yes | QMessageBox.No); MSG_BOX.setDefaultButton(QMessageBox.No)
-            MSG_BOX.setText(f"The list only contains {len(self.getCurrentMembers())} member(s)\nDo you still want to continue?")
+            MSG_BOX.setText(f"The list only contains {len(self.CACHED_MEMBERS)} member(s)\nDo you still want to continue?")
 
         return MSG_BOX
 
@@ -2940,20 +2935,23 @@ class Members(object):
         Inserts new item using the text from search bar
         Also checks for duplicate and similar member names
         """
+        if UIB.TMR_MEM_SEARCH.isActive():                                                       ## Applies a pending search first so the add button state is current
+            UIB.TMR_MEM_SEARCH.stop()
+            self.checkSearchAdd()
         if not UIB.BTN_MEM_ADD.isEnabled(): return
         ## Check for duplicate
         PROPOSED = UIB.LNE_MEM_SEARCHADD.text().strip()
-        if PROPOSED.lower() in map(lambda i: i.lower().strip(), self.CACHED_MEMBERS):
+        if PROPOSED.lower() in (n.strip() for n in self.CACHED_LOWER):
             self.displayDialog(0, self.getSimilarNames(PROPOSED), PROPOSED).exec_(); return
 
         elif self.hasDuplicateName(PROPOSED):
             if self.displayDialog(1, self.getSimilarNames(PROPOSED)).exec_() != QMessageBox.Yes: return
 
-        UIB.LNE_MEM_SEARCHADD.clear()
-        UIB.LST_MEM_MEMBERS.addItem(self.adjustNameFormat(PROPOSED))
-        UIB.LST_MEM_MEMBERS.sortItems()
-        self.CACHED_MEMBERS = self.getCurrentMembers()
-        UIB.LST_MEM_MEMBERS.findItems(self.adjustNameFormat(PROPOSED), Qt.MatchExactly)[0].setSelected(True)
+        NAME = self.adjustNameFormat(PROPOSED)
+        self.cacheMembers(self.CACHED_MEMBERS + [NAME])
+        UIB.LNE_MEM_SEARCHADD.clear(); UIB.TMR_MEM_SEARCH.stop()
+        self.checkSearchAdd()                                                                   ## Shows the whole list again right away
+        self.selectName(NAME)
         self.SAVE_STATE = False
         self.generalRefresh()
 
@@ -2962,7 +2960,7 @@ class Members(object):
         """
         Lets the user edit and rename member
         """
-        OLD_NAME = UIB.LST_MEM_MEMBERS.selectedItems()[0].text()
+        OLD_NAME = self.getSelectedNames()[0]
 
         class DLG_RENAME(QtWidgets.QDialog):
             def __init__(self, parent = None):
@@ -3000,30 +2998,34 @@ class Members(object):
                     if NEW_NAME.lower() == OLD_NAME.lower():
                         self.hide()
 
-                    elif NEW_NAME.lower() in MEM.getCurrentMembers(True):
+                    elif NEW_NAME.lower() in MEM.CACHED_LOWER:
                         MEM.displayDialog(0, MEM.getSimilarNames(NEW_NAME), NEW_NAME).exec_(); return
 
                     elif MEM.hasDuplicateName(NEW_NAME, OLD_NAME):
                         if MEM.displayDialog(1, MEM.getSimilarNames(NEW_NAME)).exec_() != QMessageBox.Yes: return     
 
-                    UIB.LST_MEM_MEMBERS.selectedItems()[0].setText(MEM.adjustNameFormat(NEW_NAME))
-                    MEM.CACHED_MEMBERS = MEM.getCurrentMembers()         
+                    NEW_NAME = MEM.adjustNameFormat(NEW_NAME)
+                    NAMES = list(MEM.CACHED_MEMBERS); NAMES[NAMES.index(OLD_NAME)] = NEW_NAME
+                    MEM.cacheMembers(NAMES)
+                    MEM.filterItems()
+                    MEM.selectName(NEW_NAME)
                 self.hide()      
 
             def reject(self):
                 self.hide()
         
-        gc.collect()
         DLG_RENAME()
         self.SAVE_STATE = False
         self.generalRefresh()
             
     
     def removeMember(self):
-        for i in UIB.LST_MEM_MEMBERS.selectedItems():
-            UIB.LST_MEM_MEMBERS.takeItem(UIB.LST_MEM_MEMBERS.row(i))
+        NAMES = list(self.CACHED_MEMBERS)
+        for n in self.getSelectedNames():
+            NAMES.remove(n)
 
-        self.CACHED_MEMBERS = self.getCurrentMembers()
+        self.cacheMembers(NAMES)
+        self.filterItems()                                                                      ## Redisplays the list under the current search
         self.SAVE_STATE = False
         self.generalRefresh()
 
@@ -3033,17 +3035,14 @@ class Members(object):
 
         self.generalRefresh() 
 
-        try:
-            if len(UIB.LST_MEM_MEMBERS.selectedItems()):
-                UIB.BTN_MEM_EDIT.setToolTip(f'Rename "{UIB.LST_MEM_MEMBERS.currentItem().text()}"')
-                UIB.BTN_MEM_REMOVE.setToolTip(f'Remove "{UIB.LST_MEM_MEMBERS.currentItem().text()}" from the list')
-        except AttributeError:
-            UIB.BTN_MEM_EDIT.setToolTip(f'Rename this member')
-            UIB.BTN_MEM_REMOVE.setToolTip(f'Remove this member from the list')
+        SELECTED = self.getSelectedNames()
+        if len(SELECTED):
+            UIB.BTN_MEM_EDIT.setToolTip(f'Rename "{SELECTED[0]}"')
+            UIB.BTN_MEM_REMOVE.setToolTip(f'Remove "{SELECTED[0]}" from the list')
 
 
     def searchClicked(self, event):
-        UIB.BTN_MEM_ADD.setEnabled(True if len(self.CACHED_MEMBERS) and len(re.sub(r"[^A-Za-z]+", '', UIB.LNE_MEM_SEARCHADD.text())) else False) 
+        UIB.BTN_MEM_ADD.setEnabled(True if len(self.CACHED_MEMBERS) and len(_ALPHA_RE.sub('', UIB.LNE_MEM_SEARCHADD.text())) else False) 
 
 
     def generalRefresh(self):
@@ -3052,22 +3051,21 @@ class Members(object):
         """
         self.refreshButtons()
         self.refreshDetails()
-        UIB.LST_MEM_MEMBERS.sortItems()
 
 
     def refreshButtons(self):
         """
         Handles all button-related items for Members tab
         """
-        if len(UIB.LST_MEM_MEMBERS.selectedItems()):
+        if UIB.LST_MEM_MEMBERS.selectionModel().hasSelection():
             UIB.BTN_MEM_REMOVE.setEnabled(True)
             UIB.BTN_MEM_EDIT.setEnabled(True)
         else:
             UIB.BTN_MEM_REMOVE.setEnabled(False); UIB.BTN_MEM_REMOVE.setToolTip('')
             UIB.BTN_MEM_EDIT.setEnabled(False); UIB.BTN_MEM_EDIT.setToolTip('')
 
-        UIB.BTN_MEM_EXPORT.setEnabled(True if len(self.getCurrentMembers()) and not self.SEARCH_STATE else False)
-        UIB.BTN_MEM_SAVE.setEnabled(True if len(self.getCurrentMembers()) and not self.SAVE_STATE else False)
+        UIB.BTN_MEM_EXPORT.setEnabled(True if len(self.CACHED_MEMBERS) and not self.SEARCH_STATE else False)
+        UIB.BTN_MEM_SAVE.setEnabled(True if len(self.CACHED_MEMBERS) and not self.SAVE_STATE else False)
     
 
     def refreshDetails(self):